@@ -0,0 +1,56 @@
+""" Benchmark of the download cycle time against the number of servers (sid) 
+
+Each server is simulated with a fixed round-trip latency. The sequential read cost 
+is expected to grow with the number of sids while the concurrent read is expected 
+to stay close to the latency of the slowest server. 
+
+Usage:: 
+    
+    python benchmarks/bench_concurrent_read.py [latency_in_seconds]
+"""
+import sys
+import time 
+from concurrent.futures import ThreadPoolExecutor
+
+from pydevmgr_core import BaseNode, NodesReader, BaseReadCollector
+
+
+class LatencyCollector(BaseReadCollector):
+    def __init__(self, latency):
+        super().__init__()
+        self._latency = latency
+    
+    def read(self, data):
+        time.sleep(self._latency) # simulate one server round-trip 
+        for node in self._nodes:
+            data[node] = node.config.sid_number
+
+class ServerNode(BaseNode, sid_number=(int, 0), latency=(float, 0.01)):
+    @property
+    def sid(self):
+        return self.config.sid_number
+    
+    def read_collector(self):
+        return LatencyCollector(self.config.latency)
+
+
+def cycle_time(reader, n_cycles=10):
+    data = {}
+    tic = time.perf_counter()
+    for _ in range(n_cycles):
+        reader.read(data)
+    return (time.perf_counter()-tic)/n_cycles
+
+
+def main(latency=0.01):
+    print(f"{'n_sid':>6} {'sequential (ms)':>16} {'concurrent (ms)':>16}")
+    for n_sid in (1, 2, 4, 8, 16, 32):
+        nodes = [ServerNode(sid_number=i, latency=latency) for i in range(n_sid) for _ in range(10)]
+        with ThreadPoolExecutor(n_sid) as executor:
+            seq = cycle_time(NodesReader(nodes))
+            con = cycle_time(NodesReader(nodes, executor=executor))
+        print(f"{n_sid:6d} {seq*1000:16.2f} {con*1000:16.2f}")
+
+
+if __name__ == "__main__":
+    main(*(float(a) for a in sys.argv[1:]))
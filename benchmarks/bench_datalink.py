@@ -0,0 +1,104 @@
+""" Benchmark of the DataLink creation and transfer of node values into the data models 
+
+A fleet of devices is linked to their data models, each device has a stat sub-object of nodes. 
+The per-field setattr loop (previous implementation) is compared to the compiled transfer plan 
+of the links, with and without validation on models configured with ``validate_assignment``. 
+The link creation time is measured with an empty and a filled cache of field plans. 
+If numpy is installed, one :class:`ArrayDataLink` for the whole fleet is also measured. 
+
+Usage:: 
+    
+    python benchmarks/bench_datalink.py [n_devices]
+"""
+import sys
+import time 
+
+from pydevmgr_core import DataLink, NodeVar
+from pydevmgr_core.nodes import Value
+from pydevmgr_core.base import datamodel
+try:
+    from pydantic.v1 import BaseModel
+except ModuleNotFoundError:
+    from pydantic import BaseModel
+
+N_FIELDS = 10 
+
+class Stat:
+    def __init__(self, prefix):
+        for i in range(N_FIELDS):
+            setattr(self, f"v{i}", Value(f"{prefix}.v{i}", value=float(i)))
+
+class Device:
+    def __init__(self, name):
+        self.stat = Stat(name)
+
+StatData = type("StatData", (BaseModel,), {"__annotations__": {f"v{i}": NodeVar[float] for i in range(N_FIELDS)}, 
+                                           **{f"v{i}": 0.0 for i in range(N_FIELDS)}})
+
+class Data(BaseModel):
+    stat: StatData = StatData()
+
+class StrictStatData(StatData):
+    class Config:
+        validate_assignment = True
+
+class StrictData(BaseModel):
+    stat: StrictStatData = StrictStatData()
+
+
+def setattr_loop(link, data):
+    # previous implementation of DataLink._download_from 
+    for node, lst in link._rnode_fields.items():
+        for attr, obj in lst:
+            setattr(obj, attr, data[node])
+
+def compiled(link, data):
+    link._download_from(data)
+
+def cycle_time(func, links, data, n_cycles=100):
+    tic = time.perf_counter()
+    for _ in range(n_cycles):
+        for link in links:
+            func(link, data)
+    return (time.perf_counter()-tic)/n_cycles
+
+
+def link_time(devices):
+    tic = time.perf_counter()
+    for d in devices:
+        DataLink(d, Data())
+    return time.perf_counter()-tic
+
+
+def main(n_devices=200):
+    devices = [Device(f"motor{i}") for i in range(n_devices)]
+    cold = 0.0
+    for d in devices:
+        datamodel._field_plans.clear()
+        cold += link_time([d])
+    warm = link_time(devices)
+    print(f"creation of {n_devices} links (ms): no plan cache {cold*1000:.3f}, cached plans {warm*1000:.3f}\n")
+    
+    print(f"{n_devices} devices x {N_FIELDS} fields, time per download cycle")
+    print(f"{'model':<30} {'setattr (ms)':>14} {'compiled (ms)':>14}")
+    for name, Model, kwargs in [("default", Data, {}), 
+                                ("validate_assignment", StrictData, {}), 
+                                ("validate_assignment, trusted", StrictData, {"validate":False})]:
+        links = [DataLink(d, Model(), **kwargs) for d in devices]
+        data = {}
+        for link in links:
+            data.update({node:node.get() for node in link.rnodes})
+        t1 = cycle_time(setattr_loop, links, data)
+        t2 = cycle_time(compiled, links, data)
+        print(f"{name:<30} {t1*1000:>14.3f} {t2*1000:>14.3f}")
+    
+    try:
+        from pydevmgr_core.np_datalink import ArrayDataLink
+    except ModuleNotFoundError:
+        return 
+    link = ArrayDataLink(devices, Data)
+    t = cycle_time(compiled, [link], data)
+    print(f"{'ArrayDataLink (one array)':<30} {'':>14} {t*1000:>14.3f}")
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
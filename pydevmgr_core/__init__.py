@@ -8,5 +8,9 @@ except ModuleNotFoundError:
     pass
 else:
     from . import np_nodes
+    from . import np_recorder
+    from .np_recorder import HistoryRecorder
+    from . import np_datalink
+    from .np_datalink import ArrayDataLink
     del numpy 
         
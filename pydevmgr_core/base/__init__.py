@@ -8,6 +8,7 @@ from .node import (BaseNode, node,
                    NodesReader, NodesWriter, 
                    DictReadCollector, DictWriteCollector, 
                    BaseReadCollector, BaseWriteCollector, 
+                   ReadPlan, get_read_plan, clear_read_plans, SingleFlight, 
                    new_node
                 )
 from .node_alias import (NodeAlias, NodeAlias1,  nodealias, nodealias1, BaseNodeAlias, BaseNodeAlias1) 
@@ -24,8 +25,12 @@ from .pydantic_tools import Defaults, GenDevice, GenManager, GenInterface, GenNo
 
 from .parser_engine import BaseParser, parser, conparser, create_parser_class
 
-from .download import  Downloader, download, DataView, reset
-from .upload import upload, Uploader
+from .download import  (Downloader, AsyncDownloader, download, download_async, DataView, DataIndex, reset, 
+                        PartialDownloadError, Subscription, DataSnapshot, AcquisitionTimes, SidTiming, new_cycle)
+from .scheduler import DeadlineScheduler, CATCHUP
+from .callback_executor import CallbackExecutor, CallbackStats, DROP
+from .metrics import RollingHistogram, DownloaderMetrics
+from .upload import upload, upload_async, Uploader
 from .wait import wait, Waiter
 from .datamodel import (DataLink, BaseData, NodeVar, NodeVar_R, NodeVar_W,
                         NodeVar_RW, StaticVar, model_subset)
@@ -0,0 +1,220 @@
+import time
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+
+from .base import log
+
+from typing import Callable, Dict, Optional, Union
+
+
+class DROP(str, Enum):
+    """ Policy of a :class:`CallbackExecutor` queue when a callback is slower than the downloads
+
+    - OLDEST : the queue is bounded to maxsize calls, the oldest pending call is dropped when full
+    - LATEST : only the latest call is kept, any pending call is replaced
+    """
+    OLDEST = "oldest"
+    LATEST = "latest"
+
+
+class CallbackStats:
+    """ Execution statistics of one callback inside a :class:`CallbackExecutor`
+
+    Attributes:
+        n_calls (int): number of executed calls
+        n_dropped (int): number of calls dropped by the queue policy
+        n_errors (int): number of calls which raised an exception
+        latency (float): time in second between the submission and the start of the last call
+        max_latency (float): max latency since the last reset
+        duration (float): execution time of the last call
+        max_duration (float): max duration since the last reset
+    """
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.n_calls = 0
+        self.n_dropped = 0
+        self.n_errors = 0
+        self.latency = 0.0
+        self.max_latency = 0.0
+        self.duration = 0.0
+        self.max_duration = 0.0
+        self._sum_latency = 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        if not self.n_calls:
+            return 0.0
+        return self._sum_latency / self.n_calls
+
+    def __repr__(self):
+        return (f"<{self.__class__.__name__} n_calls={self.n_calls} n_dropped={self.n_dropped} "
+                f"n_errors={self.n_errors} latency={self.latency:.6f} max_latency={self.max_latency:.6f}>")
+
+
+class _Lane:
+    # a bounded queue of calls for one callback. Calls of the same callback are executed in
+    # order, one at a time
+    def __init__(self, func, executor, maxsize, policy, on_error):
+        self.func = func
+        self.stats = CallbackStats()
+        self._executor = executor
+        self._maxsize = 1 if policy == DROP.LATEST else maxsize
+        self._queue = deque()
+        self._lock = threading.Lock()
+        self._running = False
+        self._on_error = on_error
+
+    def submit(self, args):
+        with self._lock:
+            queue = self._queue
+            if len(queue) >= self._maxsize:
+                queue.popleft()
+                self.stats.n_dropped += 1
+            queue.append((time.monotonic(), args))
+            if self._running:
+                return
+            self._running = True
+        self._executor.submit(self._drain)
+
+    def _drain(self):
+        stats = self.stats
+        while True:
+            with self._lock:
+                if not self._queue:
+                    self._running = False
+                    return
+                submitted, args = self._queue.popleft()
+            start = time.monotonic()
+            latency = start-submitted
+            try:
+                self.func(*args)
+            except Exception as e:
+                stats.n_errors += 1
+                self._on_error(self.func, e)
+            finally:
+                duration = time.monotonic()-start
+                stats.n_calls += 1
+                stats.latency = latency
+                stats.max_latency = max(stats.max_latency, latency)
+                stats._sum_latency += latency
+                stats.duration = duration
+                stats.max_duration = max(stats.max_duration, duration)
+
+    def pending(self):
+        with self._lock:
+            return len(self._queue) + self._running
+
+
+def _log_error(func, error):
+    log.error(f"Callback {func!r} failed: {error!r}", exc_info=error)
+
+
+class CallbackExecutor:
+    """ Execute callbacks outside the download thread
+
+    Each callback has its own bounded queue: calls of the same callback are executed in order and
+    never concurrently, a slow callback drops its oldest (or all but the latest) pending calls
+    instead of delaying the downloads or the other callbacks.
+
+    Args:
+        max_workers (int, optional): number of threads of the shared thread pool. Ignored if
+                      ``dedicated`` is True
+        maxsize (int, optional): max number of pending calls per callback (default 1)
+        policy (str, :class:`DROP`, optional): "oldest" (default) drop the oldest pending call
+                      when the queue is full, "latest" keep only the latest call
+        dedicated (bool, optional): If True each callback has its own consumer thread instead of
+                      sharing a thread pool
+        on_error (callable, optional): function ``f(callback, exception)`` called when a callback
+                      raised an exception. Default log the error.
+
+    Example:
+
+    ::
+
+        executor = CallbackExecutor(max_workers=4, policy="latest")
+        downloader = Downloader(nodes, callback_executor=executor)
+        ...
+        executor.stats[my_callback].max_latency
+    """
+    def __init__(self,
+          max_workers: Optional[int] = None,
+          maxsize: int = 1,
+          policy: Union[str, DROP] = DROP.OLDEST,
+          dedicated: bool = False,
+          on_error: Optional[Callable] = None
+        ) -> None:
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be >=1 got {maxsize}")
+        self._maxsize = maxsize
+        self._policy = DROP(policy)
+        self._dedicated = dedicated
+        self._on_error = _log_error if on_error is None else on_error
+        self._pool = None if dedicated else ThreadPoolExecutor(max_workers, thread_name_prefix="pydevmgr_callback")
+        self._lanes = {}
+        self._lock = threading.Lock()
+
+    @property
+    def policy(self) -> DROP:
+        return self._policy
+
+    @property
+    def stats(self) -> Dict[Callable, CallbackStats]:
+        """ callback/:class:`CallbackStats` pairs """
+        return {f:lane.stats for f, lane in list(self._lanes.items())}
+
+    def _get_lane(self, func):
+        try:
+            return self._lanes[func]
+        except KeyError:
+            pass
+        with self._lock:
+            lane = self._lanes.get(func)
+            if lane is None:
+                if self._dedicated:
+                    executor = ThreadPoolExecutor(1, thread_name_prefix="pydevmgr_callback")
+                else:
+                    executor = self._pool
+                lane = self._lanes[func] = _Lane(func, executor, self._maxsize, self._policy, self._on_error)
+        return lane
+
+    def submit(self, func: Callable, *args) -> None:
+        """ queue the call ``func(*args)``  """
+        self._get_lane(func).submit(args)
+
+    def discard(self, func: Callable) -> None:
+        """ forget a callback, its pending calls are still executed """
+        with self._lock:
+            lane = self._lanes.pop(func, None)
+        if lane is not None and self._dedicated:
+            lane._executor.shutdown(wait=False)
+
+    def pending(self) -> int:
+        """ number of calls pending or running """
+        return sum(lane.pending() for lane in list(self._lanes.values()))
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """ wait until all the pending calls are executed
+
+        Returns:
+            flag (bool): False if the timeout is reached
+        """
+        tic = time.monotonic()
+        while self.pending():
+            if timeout is not None and (time.monotonic()-tic) > timeout:
+                return False
+            time.sleep(0.001)
+        return True
+
+    def shutdown(self, wait: bool = True) -> None:
+        """ shutdown the threads """
+        with self._lock:
+            lanes, self._lanes = self._lanes, {}
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+        else:
+            for lane in lanes.values():
+                lane._executor.shutdown(wait=wait)
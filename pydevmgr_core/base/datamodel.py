@@ -6,13 +6,16 @@ try:
     from pydantic.v1.fields import ModelField
 except ModuleNotFoundError:
     from pydantic.fields import ModelField
-from .download import download, BaseDataLink, reset
+from .download import BaseDataLink, reset, AcquisitionTimes, new_cycle, _has_changed, _NOT_SET
+from .node import get_read_plan
 from .upload import upload
 from .node import BaseNode
 from .model_var import NodeVar, NodeVar_R, NodeVar_W, NodeVar_RW, StaticVar
 from .base import BaseData, path as to_path 
 
-from typing import  Any, Iterable, Dict, List, Type
+import time
+import weakref
+from typing import  Any, Callable, Iterable, Dict, List, Set, Type, Optional
 
 class C:
     ATTR = 'attr'
@@ -23,136 +26,282 @@ class C:
 class MatchError(ValueError):
     ...
 
-def _extract_static(obj, name, field):        
-    if C.ATTR in field.field_info.extra:
-        if field.field_info.extra.get(C.ITEM, None) is not None:
+def _static_getter(name, field):
+    # Return a function f(obj) -> static value of the input object for this field.
+    # Only the field is used, so the function can be cached by model class 
+    extra = field.field_info.extra
+    if C.ATTR in extra:
+        if extra.get(C.ITEM, None) is not None:
             raise ValueError(f'{C.ATTR!r} and {C.ITEM!r} cannot be both set, choose one.')                    
         
-        attribute = field.field_info.extra[C.ATTR]
-        if attribute:
+        attribute = extra[C.ATTR]
+        if not attribute:
+            return _identity
+        def get_static(obj):
             try:
-                val = getattr(obj, attribute)
+                return getattr(obj, attribute)
             except AttributeError:
                 raise MatchError(f'{attribute!r} is not an attribute of {obj.__class__.__name__!r}')
-        else:
-            val = obj
     
-    elif C.ITEM in field.field_info.extra:             
-        item = field.field_info.extra[C.ITEM]
-        try:
-            val = obj[item]
-        except KeyError:
-            raise MatchError(f'{item!r} is not an item of {obj.__class__.__name__!r}')
+    elif C.ITEM in extra:             
+        item = extra[C.ITEM]
+        def get_static(obj):
+            try:
+                return obj[item]
+            except KeyError:
+                raise MatchError(f'{item!r} is not an item of {obj.__class__.__name__!r}')
     else:
-        try:
-            val = getattr(obj, name)
-        except AttributeError:
-            raise MatchError(f'{name!r} is not an attribute of {obj.__class__.__name__!r}')        
-    
-    return val
-        
-def _extract_node(obj, name, field):
-    """ called when a NodeVar is detected in datamodel """
-    
-    if C.NODE in field.field_info.extra:
+        def get_static(obj):
+            try:
+                return getattr(obj, name)
+            except AttributeError:
+                raise MatchError(f'{name!r} is not an attribute of {obj.__class__.__name__!r}')        
+    return get_static
+
+def _identity(obj):
+    return obj
+
+def _check_node(node, obj, what):
+    if not isinstance(node, BaseNode):
+        raise MatchError(f'node {what} is not a node in {obj.__class__.__name__!r}')
+    return node
+
+def _node_getter(name, field):
+    # Return a function f(obj) -> node of the input object for this NodeVar field.
+    # Only the field is used, so the function can be cached by model class 
+    extra = field.field_info.extra
+    if C.NODE in extra:
         
-        node = field.field_info.extra[C.NODE]
+        node = extra[C.NODE]
         node = to_path(node)    
-        if field.field_info.extra.get(C.ATTR, None) is not None:
+        if extra.get(C.ATTR, None) is not None:
             raise MatchError(f'node={C.NODE!r} and attr={C.ATTR!r} cannot be both set, choose one.')
         
-        if field.field_info.extra.get(C.PATH, None) is not None:
+        if extra.get(C.PATH, None) is not None:
             raise MatchError(f'node={C.NODE!r} and path={C.PATH!r} cannot be both set, choose one.')
         
-        if field.field_info.extra.get(C.ITEM, None) is not None:
+        if extra.get(C.ITEM, None) is not None:
             raise MatchError(f'node={C.NODE!r} and item={C.ITEM!r} cannot be both set, choose one.')
                                         
         if isinstance(node, BaseNode.Property):
-            _, node = node.new(obj)
+            prop = node
+            def get_node(obj):
+                _, node = prop.new(obj)
+                return node 
         elif isinstance(node, str):
-            try:
-                attr = node
-                node = getattr(obj, attr)
-            except AttributeError:
-                raise MatchError(f'{attr!r} is not a node in {obj.__class__.__name__!r}')
-        elif hasattr(node, "__iter__"):
-            
             attr = node
-            cobj = obj
-            path = tuple(attr)
-            for a in path[:-1]:
-                cobj = getattr(cobj, a)
-            try:
-                node = getattr(cobj, path[-1])
-            except AttributeError:
-                raise MatchError(f'{path[-1]!r} is not a node in {obj.__class__.__name__!r} with path {path}')        
-        elif not isinstance(node, BaseNode):
+            def get_node(obj):
+                try:
+                    return getattr(obj, attr)
+                except AttributeError:
+                    raise MatchError(f'{attr!r} is not a node in {obj.__class__.__name__!r}')
+        elif hasattr(node, "__iter__"):
+            path = tuple(node)
+            def get_node(obj):
+                cobj = obj
+                for a in path[:-1]:
+                    cobj = getattr(cobj, a)
+                try:
+                    return getattr(cobj, path[-1])
+                except AttributeError:
+                    raise MatchError(f'{path[-1]!r} is not a node in {obj.__class__.__name__!r} with path {path}')        
+        elif isinstance(node, BaseNode):
+            def get_node(obj, node=node):
+                return node
+        else:
             raise MatchError(f'node set in the field is not a node')
     
-    elif C.ATTR in field.field_info.extra:
-        if field.field_info.extra.get(C.ITEM, None) is not None:
+    elif C.ATTR in extra:
+        if extra.get(C.ITEM, None) is not None:
             raise MatchError(f'attr={C.ATTR!r} and item={C.ITEM!r} cannot be both set, choose one.')
-        if field.field_info.extra.get(C.PATH, None) is not None:
+        if extra.get(C.PATH, None) is not None:
             raise MatchError(f'attr={C.ATTR!r} and path={C.PATH!r} cannot be both set, choose one.') 
             
-        attr = field.field_info.extra[C.ATTR]  
-        if attr:            
+        attr = extra[C.ATTR]  
+        if not attr:
+            return _identity
+        def get_node(obj):
             try:
-                node = getattr(obj, attr)
+                return getattr(obj, attr)
             except AttributeError:
                 raise MatchError(f'{attr!r} is not a node in {obj.__class__.__name__!r}')
-        else:
-            node = obj        
             
-    elif C.PATH in field.field_info.extra:
-        if field.field_info.extra.get(C.ITEM, None) is not None:
+    elif C.PATH in extra:
+        if extra.get(C.ITEM, None) is not None:
             raise MatchError(f'path={C.PATH!r} and item={C.ITEM!r} cannot be both set, choose one.')
              
-        path = field.field_info.extra[C.PATH]
+        path = extra[C.PATH]
         path = to_path(path)    
         if path:
-            
             if isinstance(path, str):
                 path = path.split('.')                
             elif not hasattr(path, "__iter__"):
                 raise MatchError(f"expecting string or iterable for path parameter got {path!r}")
-                
-            cobj = obj
             path = tuple(path)
+        else:
+            path = ()
+        
+        def get_node(obj):
+            cobj = obj
             try:
                 for a in path[:-1]:
                     cobj = getattr(cobj, a)
-                node = getattr(cobj, path[-1])
+                node = getattr(cobj, path[-1]) if path else obj 
             except AttributeError:
                 raise MatchError(f'{path!r} is not a valid in {obj.__class__.__name__!r} with path {path}')                                    
-        else:
-            node = obj
-             
-        if not isinstance(node, BaseNode):
-            raise MatchError(f'node attribute  {attr!r} is not a node in {obj.__class__.__name__!r}')
+            return _check_node(node, obj, f'path {path!r}')
     
-    elif C.ITEM in field.field_info.extra:
+    elif C.ITEM in extra:
          
-        item = field.field_info.extra[C.ITEM]
-        try:
-            node = obj[item]
-        except (KeyError, TypeError):
-            raise MatchError(f'{item!r} is not an item in {obj.__class__.__name__!r}')
-                             
-        if not isinstance(node, BaseNode):
-            raise MatchError(f'node item {item!r} is not a node in {obj.__class__.__name__!r}')    
+        item = extra[C.ITEM]
+        def get_node(obj):
+            try:
+                node = obj[item]
+            except (KeyError, TypeError):
+                raise MatchError(f'{item!r} is not an item in {obj.__class__.__name__!r}')
+            return _check_node(node, obj, f'item {item!r}')
                                             
     else:
         attr = name
-        try:
-            node = getattr(obj, attr)
-        except AttributeError as e:
-            raise MatchError(f'{attr!r} is not a node in {obj.__class__.__name__!r}')         
-        if not isinstance(node, BaseNode):
-            raise MatchError(f'node attribute {attr!r} is not a node in {obj.__class__.__name__!r}')
+        def get_node(obj):
+            try:
+                node = getattr(obj, attr)
+            except AttributeError as e:
+                raise MatchError(f'{attr!r} is not a node in {obj.__class__.__name__!r}')         
+            return _check_node(node, obj, f'attribute {attr!r}')
          
-    return node                                
+    return get_node                                
+
+def _extract_static(obj, name, field):        
+    return _static_getter(name, field)(obj)
+
+def _extract_node(obj, name, field):
+    """ called when a NodeVar is detected in datamodel """
+    return _node_getter(name, field)(obj)
+
+
+class F:
+    # kinds of field in a field plan 
+    STATIC = 'static'
+    R = 'r'
+    W = 'w'
+    RW = 'rw'
+    MODEL = 'model'
+
+# Plans are cached by model class. The field matching logic only depends on the model 
+# class, a plan is then bound to each input object with the getter functions 
+_field_plans = weakref.WeakKeyDictionary()
+
+def _compile_field_plan(Model: Type[BaseModel]) -> list:
+    plan = []
+    for name, field in Model.__fields__.items():
+        if not isinstance(field.type_, type):
+            continue   
+        try:
+            if issubclass(field.type_, StaticVar):
+                plan.append( (name, F.STATIC, _static_getter(name, field), False) )
+            elif issubclass(field.type_, NodeVar_R):
+                plan.append( (name, F.R, _node_getter(name, field), False) )
+            elif issubclass(field.type_, (NodeVar, NodeVar_RW)):
+                plan.append( (name, F.RW, _node_getter(name, field), False) )
+            elif issubclass(field.type_, NodeVar_W):
+                plan.append( (name, F.W, _node_getter(name, field), False) )
+            elif issubclass(field.type_, BaseModel):
+                # sub-model must exist if BaseData
+                plan.append( (name, F.MODEL, _static_getter(name, field), issubclass(field.type_, BaseData)) )
+        except MatchError as e:
+            # field configuration error, raised when bounded  
+            plan.append( (name, None, e, False) )
+    return plan 
+
+def get_field_plan(Model: Type[BaseModel]) -> list:
+    """ Return the cached list of (name, kind, getter, strict) field resolution of a model class """
+    try:
+        return _field_plans[Model]
+    except KeyError:
+        plan = _field_plans[Model] = _compile_field_plan(Model)
+        return plan 
+
+
+def _has_fast_assignment(model: BaseModel, validate: bool) -> bool:
+    # True if a field assignment is only a __dict__ update. This is the case for a default pydantic
+    # model: no custom __setattr__, mutable and no validation on assignment (or validation skipped)
+    cls = model.__class__
+    if cls.__setattr__ is not BaseModel.__setattr__:
+        return False
+    config = model.__config__
+    if not config.allow_mutation or getattr(config, "frozen", False):
+        return False
+    if validate and config.validate_assignment:
+        return False
+    return True
+
+
+class _TransferPlan:
+    # Compiled transfer of node values to/from the data model fields
+    # 
+    # Fields are grouped by model, the fast models are updated in bulk through their __dict__ and 
+    # __fields_set__, the others (validation on assignment, custom __setattr__, ...) with setattr
+    __slots__ = ("fast", "slow", "upload", "rwupload")
+    def __init__(self, rnode_fields: dict, wnode_fields: dict, validate: bool = True, model_paths: Optional[dict] = None):
+        model_paths = model_paths or {}
+        groups = {}
+        slow = []
+        for node, lst in rnode_fields.items():
+            for attr, obj in lst:
+                path = model_paths.get(id(obj), "")+attr
+                if _has_fast_assignment(obj, validate):
+                    groups.setdefault(id(obj), (obj, []))[1].append((attr, node, path))
+                else:
+                    slow.append((obj, attr, node, path))
+        self.fast = [(obj, frozenset(p[0] for p in pairs), tuple(pairs)) for obj, pairs in groups.values()]
+        self.slow = slow
+        self.upload = [(node, obj, attr) for node, lst in wnode_fields.items() for attr, obj in lst]
+        # upload of the write nodes also downloaded 
+        self.rwupload = [(node, obj, attr) for node, obj, attr in self.upload if node in rnode_fields]
+    
+    def download(self, data: dict) -> None:
+        for obj, names, pairs in self.fast:
+            obj.__dict__.update({attr:data[node] for attr, node, _ in pairs})
+            obj.__fields_set__.update(names)
+        for obj, attr, node, _ in self.slow:
+            setattr(obj, attr, data[node])
     
+    def download_changes(self, data: dict, changed: set) -> None:
+        # same as download but add the path of changed fields inside the changed set 
+        for obj, names, pairs in self.fast:
+            d = obj.__dict__
+            for attr, node, path in pairs:
+                val = data[node]
+                if _has_changed(d.get(attr, _NOT_SET), val, None):
+                    changed.add(path)
+                d[attr] = val
+            obj.__fields_set__.update(names)
+        for obj, attr, node, path in self.slow:
+            old = getattr(obj, attr, _NOT_SET)
+            setattr(obj, attr, data[node])
+            # compare the validated value 
+            if _has_changed(old, getattr(obj, attr), None):
+                changed.add(path)
+    
+    def upload_to(self, todata: dict) -> None:
+        for node, obj, attr in self.upload:
+            val = getattr(obj, attr)
+            if isinstance(val, BaseNode):
+                continue
+            # the last in the list will be set
+            # which may not in a hierarchical order 
+            # any way several same w-node should be avoided
+            todata[node] = val
+    
+    def reference_to(self, reference: dict) -> None:
+        # model values (validated) of the downloaded write nodes, as they would be uploaded 
+        for node, obj, attr in self.rwupload:
+            val = getattr(obj, attr)
+            if not isinstance(val, BaseNode):
+                reference[node] = val
+
+
 class DataLink(BaseDataLink):
     """ Link an object containing nodes, to a :class:`pydantic.BaseModel` 
     
@@ -162,6 +311,11 @@ class DataLink(BaseDataLink):
                          
         model (:class:`pydantic.BaseModel`): a data model. Is expecting that the data model structure 
             contains :class:`NodeVar` type hint signature.
+        strick_match (bool, optional): If True (default) a field which cannot be matched to the input 
+            raise a ValueError 
+        validate (bool, optional): If False, the downloaded values are written in the model without 
+            validation even if the model has the ``validate_assignment`` config. To be used for 
+            trusted nodes only. Default is True 
             
     Example: 
     
@@ -227,11 +381,16 @@ class DataLink(BaseDataLink):
     def __init__(self, 
           input : Any, 
           model : BaseModel, 
-          strick_match : bool = True 
+          strick_match : bool = True, 
+          validate: bool = True, 
+          track_changes: bool = False, 
+          on_change: Optional[Callable] = None, 
+          report_changes: bool = False
         ) -> None:
         
         self._rnode_fields = {}
         self._wnode_fields = {}
+        self._model_paths = {}
         if isinstance(input, BaseNode):
             try:
                 model.value 
@@ -245,6 +404,12 @@ class DataLink(BaseDataLink):
             self._collect_nodes(model, input, strick_match)
         self._input = input 
         self._model = model
+        self._validate = validate
+        self._transfer_plan = _TransferPlan(self._rnode_fields, self._wnode_fields, validate, self._model_paths)
+        self._on_change = on_change 
+        self._report_changes = report_changes or on_change is not None
+        # node/value of the last values known by the server, None if not tracked 
+        self._reference = {} if track_changes else None 
     
     @property
     def model(self)-> BaseModel:
@@ -254,6 +419,25 @@ class DataLink(BaseDataLink):
     def input(self)-> Any:
         return self._input
     
+    @property
+    def acquisition(self) -> Optional[AcquisitionTimes]:
+        """ :class:`AcquisitionTimes` of the last download (by :meth:`download` or a :class:`Downloader`)
+        
+        None if the link was never downloaded 
+        """
+        return self._acquisition
+    
+    @property
+    def cycle(self) -> int:
+        """ global cycle number of the last download, 0 if never downloaded """
+        acquisition = self._acquisition
+        return 0 if acquisition is None else acquisition.cycle
+    
+    def get_timestamp(self, node: BaseNode) -> Optional[float]:
+        """ acquisition time (time.time()) of the last downloaded value of a linked node or None """
+        acquisition = self._acquisition
+        return None if acquisition is None else acquisition.timestamp(node)
+    
     @property
     def rnodes(self)-> Iterable:
         return self._rnode_fields
@@ -272,59 +456,44 @@ class DataLink(BaseDataLink):
             elif issubclass(field.type_, (NodeVar_R,NodeVar,NodeVar_W, NodeVar_RW)):
                 raise ValueError("Linking a single node. Data model should not contain NodeVar fields")
     
-    def _collect_nodes(self, model, input_obj, strick_match):
-        for name, field in model.__fields__.items():
-            if not isinstance(field.type_, type):
-                continue        
-            if issubclass(field.type_, StaticVar):
-                try:
-                    val = _extract_static(input_obj, name, field)
-                except MatchError as e:
-                    if strick_match: raise e
-                else:    
-                    setattr(model, name, val)
-                    
-            elif issubclass(field.type_, (NodeVar_R,)):
-                try:
-                    node = _extract_node(input_obj, name, field)               
-                except MatchError as e:
-                    if strick_match: raise e
-                else:
-                    self._rnode_fields.setdefault(node, []).append((name, model))
+    def _collect_nodes(self, model, input_obj, strick_match, prefix=""):
+        self._model_paths[id(model)] = prefix 
+        for name, kind, getter, strict in get_field_plan(model.__class__):
+            if kind is None:
+                # the field configuration does not match, getter is the error 
+                if strick_match: raise getter
+                continue 
             
-            elif issubclass(field.type_, (NodeVar, NodeVar_RW)):
-                try:
-                    node = _extract_node(input_obj, name, field)               
-                except MatchError as e:
-                    if strick_match: raise e
-                else:
-                    
-                    self._rnode_fields.setdefault(node, []).append((name, model))
-                    self._wnode_fields.setdefault(node, []).append((name, model))
-                       
-            elif issubclass(field.type_, (NodeVar_W, )):
-                try:
-                    node = _extract_node(input_obj, name, field)
-                except MatchError as e:
-                    if strick_match: raise e
-                else:                  
-                    self._wnode_fields.setdefault(node, []).append((name, model))   
-                
-            elif issubclass(field.type_, BaseModel):
+            if kind == F.MODEL:
                 # chidren is ignored if path is broken
                 sub_model = getattr(model, name)
                 if not isinstance(sub_model, BaseModel):                
                     continue
-                
-                                                    
                 try:
-                    sub_obj = _extract_static(input_obj, name, field)
+                    sub_obj = getter(input_obj)
                 except MatchError as e:
                     # if BaseData force the existance of the path 
-                    if strick_match and issubclass(field.type_, BaseData):
+                    if strick_match and strict:
                         raise e
                 else:                    
-                    self._collect_nodes( sub_model, sub_obj, strick_match)
+                    self._collect_nodes( sub_model, sub_obj, strick_match, prefix+name+".")
+                continue
+            
+            try:
+                val = getter(input_obj)
+            except MatchError as e:
+                if strick_match: raise e
+                continue
+            
+            if kind == F.STATIC:
+                setattr(model, name, val)
+            elif kind == F.R:
+                self._rnode_fields.setdefault(val, []).append((name, model))
+            elif kind == F.RW:
+                self._rnode_fields.setdefault(val, []).append((name, model))
+                self._wnode_fields.setdefault(val, []).append((name, model))
+            else:
+                self._wnode_fields.setdefault(val, []).append((name, model))   
     
     def download_from_nodes(self, nodevals: Dict[BaseNode,Any]) -> None:
         """ Update the data from a dictionary of node/value pair 
@@ -339,17 +508,43 @@ class DataLink(BaseDataLink):
             else:
                 for attr, obj in lst:
                     setattr(obj, attr, val)
+                reference = self._reference
+                if reference is not None and node in self._wnode_fields:
+                    # the last in the list is the uploaded one 
+                    attr, obj = self._wnode_fields[node][-1]
+                    reference[node] = getattr(obj, attr)
                     
-    def _download_from(self, data: dict) -> None:
-        for node, lst in self._rnode_fields.items():
-            for attr, obj in lst:
-                setattr(obj, attr, data[node])
+    def _download_from(self, data: dict) -> Optional[Set[str]]:
+        if self._report_changes:
+            changed = set()
+            self._transfer_plan.download_changes(data, changed)
+        else:
+            changed = None 
+            self._transfer_plan.download(data)
+        
+        if self._reference is not None:
+            # the model values are the reference, they can differ from data if validated 
+            self._transfer_plan.reference_to(self._reference)
+        
+        if changed and self._on_change is not None:
+            self._on_change(changed)
+        return changed 
                 
-    def download(self) -> None:
-        """ download Nodes from servers and update the data """
+    def download(self) -> Optional[Set[str]]:
+        """ download Nodes from servers and update the data 
+        
+        Returns:
+            changed (set, None): set of changed field paths if the link reports changes (see the 
+                ``report_changes`` and ``on_change`` arguments), None otherwise 
+        """
         data = {}
-        download( self._rnode_fields, data )
-        self._download_from(data)
+        plan = get_read_plan(self._rnode_fields)
+        cycle, since = new_cycle(), time.time()
+        plan.read(data)
+        acquisition = AcquisitionTimes()
+        acquisition.record(cycle, plan, since)
+        self._acquisition = acquisition
+        return self._download_from(data)
     
     def reset(self):
         """ All linked nodes with a reset method will be reseted """   
@@ -357,21 +552,43 @@ class DataLink(BaseDataLink):
         reset(self._wnode_fields)         
                 
     def _upload_to(self, todata: dict) -> None:
-        for node, lst in self._wnode_fields.items():    
-            for attr, obj in lst:
-                val = getattr(obj, attr)
-                if isinstance(val, BaseNode):
-                    continue
-                # the last in the list will be set
-                # which may not in a hierarchical order 
-                # any way several same w-node should be avoided
-                todata[node] = val  
+        self._transfer_plan.upload_to(todata)
                         
-    def upload(self) -> None:
-        """ upload data value (the one linked to a node) to the server """
+    def changes(self) -> Dict[BaseNode, Any]:
+        """ node/value pairs of write nodes changed since the last upload or download 
+        
+        If changes are not tracked (see the ``track_changes`` argument) all the write nodes are returned. 
+        
+        .. note::
+            
+            Values are compared with ``!=``, a mutable value modified in place is not detected.
+        """
         todata = {}
         self._upload_to(todata)
+        reference = self._reference
+        if reference is None:
+            return todata
+        return {node:val for node, val in todata.items() if _has_changed(reference.get(node, _NOT_SET), val, None)}
+    
+    def upload(self, changed_only: bool = False) -> None:
+        """ upload data value (the one linked to a node) to the server 
+        
+        Args:
+            changed_only (bool, optional): If True only the fields changed since the last upload 
+                or download are written (see :meth:`changes`). Nothing is written if nothing changed
+        """
+        if changed_only:
+            if self._reference is None:
+                self._reference = {}
+            todata = self.changes()
+            if not todata:
+                return 
+        else:
+            todata = {}
+            self._upload_to(todata)
         upload(todata) 
+        if self._reference is not None:
+            self._reference.update(todata)
 
 def model_subset(
        class_name: str, 
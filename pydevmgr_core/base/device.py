@@ -2,7 +2,7 @@ from .base import (_BaseObject, _BaseProperty, BaseData, open_object,
                         ChildrenCapability, ChildrenCapabilityConfig
                         )
 from .class_recorder import  KINDS,  record_class
-from .node import BaseNode 
+from .node import BaseNode, clear_read_plans
 from .interface import BaseInterface
 from .rpc import BaseRpc
 from enum import Enum 
@@ -152,7 +152,9 @@ class BaseDevice(_BaseObject, ChildrenCapability):
     def rebuild(self):
         """ rebuild will disconnect the device and create a new com """
         self.disconnect()
-        self.clear()
+        self.clear_all()
+        # cached read plans may hold collectors built from the old com 
+        clear_read_plans()
         self._com = self.new_com(self._config)
     
         
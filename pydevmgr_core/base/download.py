@@ -1,25 +1,105 @@
-from .node import NodesReader, BaseNode
+from .node import NodesReader, BaseNode, SingleFlight, get_read_plan
+from .scheduler import DeadlineScheduler, CATCHUP
+from .callback_executor import CallbackExecutor
+from .metrics import DownloaderMetrics
 from .base import  _BaseObject
 
 
 import time
-from collections import  OrderedDict
+import asyncio
+import threading
+import itertools
+from collections import  OrderedDict, namedtuple
+from collections.abc import Mapping
+from concurrent.futures import Executor, ThreadPoolExecutor
 
 from typing import Any, Dict, Iterable, Union, Optional, Callable
 
 
+class DataIndex:
+    """ Incremental index of the node keys of a data dictionary 
+    
+    For each node key (e.g. "motor1.stat.pos_actual") all the prefixes ("", "motor1", 
+    "motor1.stat") are indexed so a :class:`DataView` on any prefix is built in O(1) and see 
+    the nodes added later. 
+    
+    Args:
+        data (iterable, optional): initial nodes (e.g. a data dictionary)
+    """
+    def __init__(self, data: Iterable = ()):
+        self._lookups = {"":{}} # prefix -> {sub key: node}
+        self._keys = {} # node -> key 
+        for node in data:
+            self.add(node)
+    
+    def add(self, node: BaseNode) -> None:
+        """ index a node, nodes without a string key are ignored """
+        key = getattr(node, "key", None)
+        if not isinstance(key, str) or node in self._keys:
+            return 
+        self._keys[node] = key
+        lookups = self._lookups
+        lookups[""][key] = node 
+        i = key.find(".")
+        while i>-1:
+            lookups.setdefault(key[:i], {})[key[i+1:]] = node
+            i = key.find(".", i+1)
+    
+    def remove(self, node: BaseNode) -> None:
+        """ remove a node from the index """
+        key = self._keys.pop(node, None)
+        if key is None:
+            return 
+        lookups = self._lookups
+        if lookups[""].get(key) is node:
+            del lookups[""][key]
+        i = key.find(".")
+        while i>-1:
+            lookup = lookups.get(key[:i])
+            if lookup is not None and lookup.get(key[i+1:]) is node:
+                del lookup[key[i+1:]]
+            i = key.find(".", i+1)
+    
+    def lookup(self, prefix: str = "") -> Dict[str, BaseNode]:
+        """ Return the live sub-key/node dictionary of a prefix """
+        try:
+            return self._lookups[prefix]
+        except KeyError:
+            return self._lookups.setdefault(prefix, {})
+    
+    def get(self, key: str) -> Optional[BaseNode]:
+        """ Return the node of a key or None """
+        return self._lookups[""].get(key)
+
+
 class DataView:
+    """ A dictionary like view of a node/value data dictionary with string keys 
+    
+    Keys are the node keys without the prefix. 
+    
+    Args:
+        data (dict): node/value data dictionary 
+        prefix (str, object, optional): limit the view to the keys starting by ``prefix+"."``
+                   It can be an object with a ``key`` attribute (e.g. a device)
+        index (:class:`DataIndex`, optional): If given, the view is a live view on the index: 
+                   nodes added to the index are visible. Otherwise the data is scanned once. 
+    """
     def __init__(self, 
             data: Dict[BaseNode,Any], 
-            prefix: Optional[Union[str, _BaseObject]] = None
+            prefix: Optional[Union[str, _BaseObject]] = None, 
+            index: Optional[DataIndex] = None
           ) -> None:
         self._data = data
         if prefix is None:
             prefix = ""
         if not isinstance(prefix, str):
             prefix = prefix.key 
+        self._prefix = prefix 
+        self._index = index 
         
-        if not prefix:
+        if index is not None:
+            key_lookup = index.lookup(prefix)
+        elif not prefix:
             key_lookup = {n.key:n for n in data if hasattr(n, "key") }
         else:                    
             key_lookup = {}
@@ -52,13 +132,25 @@ class DataView:
     def __has__(self, item):
         return item in self._key_lookup
     
+    def __contains__(self, item):
+        return item in self._key_lookup
+    
+    def __len__(self):
+        return len(self._key_lookup)
+    
+    def __iter__(self):
+        return iter(list(self._key_lookup))
+    
     def update(self, __d__={}, **kwargs) -> None:
-        for k,v in dict(__d__, **kwargs).iteritems():
+        for k,v in dict(__d__, **kwargs).items():
             self._data[self._key_lookup[k]] = v
     
     def pop(self, item) -> Any:
         """ Pop an item from the root data ! """
-        return self._data.pop(self._key_lookup[item])    
+        node = self._key_lookup[item]
+        if self._index is not None:
+            self._index.remove(node)
+        return self._data.pop(node)    
     
     def popitem(self, item) -> Any:
         """ Pop an item from the root data ! """
@@ -84,9 +176,12 @@ class DataView:
         
         Shall be avoided to use in a :class:`Prefixed` object
         """        
-        pref = self._prefix+"."
         for k, n in list(self._key_lookup.items()):            
-            self._data.pop(n)
+            self._data.pop(n, None)
+            if self._index is not None:
+                self._index.remove(n)
+            else:
+                del self._key_lookup[k]
 
 
 def _setitem(d,k,v):
@@ -96,9 +191,92 @@ def _dummy_callback(data):
 def _dummy_trigger():
     return True
 
+def _check_period(period):
+    if period is not None and period<=0:
+        raise ValueError(f"download period must be strictly positive got {period}")
+
 class BaseDataLink:
     """ place holder for an instance check """    
-    pass
+    # AcquisitionTimes of the last download, set by the downloader 
+    _acquisition = None
+
+
+# global download cycle counter shared by all downloads 
+_cycle_counter = itertools.count(1)
+
+def new_cycle() -> int:
+    """ Return a new download cycle number, cycle numbers are unique and increasing for the process """
+    return next(_cycle_counter)
+
+SidTiming = namedtuple("SidTiming", ["cycle", "start", "end"])
+SidTiming.__doc__ = """ Timing of one server (sid) round-trip: cycle number, start and end time (time.time()) """ 
+
+class AcquisitionTimes:
+    """ Compact record of the acquisition times of downloaded nodes 
+    
+    Times are recorded per server (sid) round-trip, all nodes of a sid share the same timing. 
+    Aliases take the timing of their most recent source sid. Nodes with a max_age have the 
+    timestamp of their cached value. 
+    
+    Attributes:
+        cycle (int): number of the last download cycle (see :func:`new_cycle`) 
+    """
+    def __init__(self):
+        self.cycle = 0 
+        self._sids = {} 
+        self._alias_sids = {}
+        self._cache_times = {}
+    
+    def record(self, cycle: int, reader: NodesReader, since: float = 0.0) -> None:
+        """ record the sid times of a reader read at a given cycle 
+        
+        Only the sid round-trips started after ``since`` are recorded 
+        """
+        self.cycle = cycle 
+        sids = self._sids
+        for sid, (start, end) in list(reader.sid_times.items()):
+            if start >= since:
+                sids[sid] = SidTiming(cycle, start, end)
+        self._cache_times.update(reader.cache_times)
+        self._alias_sids.update(reader._get_alias_sids())
+    
+    def sid_timing(self, sid) -> Optional[SidTiming]:
+        """ :class:`SidTiming` of the last successful round-trip of a sid or None """
+        return self._sids.get(sid)
+    
+    @property
+    def sids(self) -> Dict[Any, SidTiming]:
+        """ sid/:class:`SidTiming` pairs """
+        return dict(self._sids)
+    
+    def timing(self, node: BaseNode) -> Optional[SidTiming]:
+        """ :class:`SidTiming` of the last acquisition of a node or None """
+        sid = getattr(node, "sid", None)
+        if sid is not None:
+            return self._sids.get(sid)
+        timings = [self._sids[s] for s in self._alias_sids.get(node, ()) if s in self._sids]
+        if not timings:
+            return None 
+        return max(timings, key=lambda t: t.end)
+    
+    def timestamp(self, node: BaseNode) -> Optional[float]:
+        """ acquisition time (end of the server round-trip) of a node or None 
+        
+        For a node with a max_age this is the time of its cached value 
+        """
+        try:
+            return self._cache_times[node]
+        except KeyError:
+            pass 
+        timing = self.timing(node)
+        return None if timing is None else timing.end
+    
+    def age(self, node: BaseNode, now: Optional[float] = None) -> Optional[float]:
+        """ age in second of the node value or None """
+        timestamp = self.timestamp(node)
+        if timestamp is None:
+            return None 
+        return (time.time() if now is None else now) - timestamp
 
 
 class DownloaderConnection:
@@ -114,6 +292,11 @@ class DownloaderConnection:
         self._downloader = downloader 
         self._token = token 
     
+    @property
+    def period(self) -> Optional[float]:
+        """ default download period of the connection, None if updated at each download """
+        return self._downloader.get_period(self._token)
+    
     def _check_connection(self):
         if not self._token:
             raise RuntimeError("DownloaderConnection has been disconnected from its Downloader")
@@ -135,24 +318,26 @@ class DownloaderConnection:
         self._downloader.disconnect(self._token)
         self._token = None
         
-    def add_node(self, *nodes) -> None:
+    def add_node(self, *nodes, period: Optional[float] = None) -> None:
         """ Register nodes to be downloader associated to this connection 
         
         Args:
             *nodes :  nodes to be added to the download queue
+            period (float, optional): download period of the nodes, default is the connection period
         """ 
         self._check_connection() 
-        self._downloader.add_node(self._token, *nodes)
+        self._downloader.add_node(self._token, *nodes, period=period)
     
-    def add_nodes(self, nodes) -> None:
+    def add_nodes(self, nodes, period: Optional[float] = None) -> None:
         """ Register nodes to be downloader associated to this connection 
         
         Args:
             nodes :  nodes to be added to the download queue. 
                      If a dictionary of node/value pairs, they are added to the downloader data. 
+            period (float, optional): download period of the nodes, default is the connection period
         """
         self._check_connection() 
-        self._downloader.add_nodes(self._token, nodes)
+        self._downloader.add_nodes(self._token, nodes, period=period)
     
     def remove_node(self, *nodes) -> None:
         """ remove  any nodes to the downloader associated to this connection 
@@ -165,14 +350,15 @@ class DownloaderConnection:
         self._check_connection() 
         self._downloader.remove_node(self._token, *nodes)
     
-    def add_datalink(self, *datalinks) -> None:
+    def add_datalink(self, *datalinks, period: Optional[float] = None) -> None:
         """ Register datalinks to the downloader associated to this connection 
         
         Args:
             *datalinks :  :class:`DataLink` to be added to the download queue on the associated downloader
+            period (float, optional): download period of the datalinks, default is the connection period
         """
         self._check_connection() 
-        self._downloader.add_datalink(self._token, *datalinks)        
+        self._downloader.add_datalink(self._token, *datalinks, period=period)        
     
     def remove_datalink(self, *datalinks) -> None:
         """ Remove any given datalinks to the downloader associated to this connection 
@@ -218,10 +404,127 @@ class DownloaderConnection:
         """
         self._check_connection() 
         self._downloader.remove_failure_callback(self._token, *callbacks)
+    
+    def subscribe(self, 
+            nodes: Iterable, 
+            callback: Callable, 
+            deadband: Optional[Union[float, Dict[BaseNode,float]]] = None, 
+            on_change: bool = True
+        ) -> 'Subscription':
+        """ Subscribe a callback to the changes of some nodes 
+        
+        See :meth:`Downloader.subscribe`
+        """
+        self._check_connection() 
+        return self._downloader.subscribe(self._token, nodes, callback, deadband=deadband, on_change=on_change)
+
+
+def _has_changed(old, new, deadband):
+    # True if the new value is different than the old one (outside the deadband) 
+    if deadband:
+        try:
+            return abs(new-old) > deadband
+        except TypeError:
+            pass 
+    try:
+        return bool(new != old)
+    except (ValueError, TypeError): # e.g. arrays 
+        return True
+
+_NOT_SET = object()
+
+class Subscription:
+    """ A callback subscribed to the changes of some nodes of a :class:`Downloader` 
+    
+    Created by :meth:`Downloader.subscribe`. After each download refreshing the connection, 
+    new values are compared to the last notified ones and ``callback(changed)`` is called with 
+    a dictionary of node/value pairs of the changed nodes only. 
+    
+    Attributes:
+        nodes (tuple): subscribed nodes
+        deadband (float, dict, None): absolute deadband for numerical values, can be a dictionary 
+                                      of node/deadband pairs 
+        on_change (bool): If False the callback is called at each download with all the nodes
+    """
+    def __init__(self, downloader, token, nodes, callback, deadband=None, on_change=True):
+        self._downloader = downloader
+        self._token = token
+        self.nodes = tuple(nodes)
+        self.callback = callback
+        self.deadband = deadband
+        self.on_change = on_change
+        self._last = dict.fromkeys(self.nodes, _NOT_SET)
+    
+    def __call__(self):
+        # executed as a downloader callback 
+        data = self._downloader.data
+        if not self.on_change:
+            changed = {n:data[n] for n in self.nodes}
+        else:
+            last = self._last
+            deadband = self.deadband
+            is_dict = isinstance(deadband, dict)
+            changed = {}
+            for node in self.nodes:
+                new = data[node]
+                old = last[node]
+                if old is _NOT_SET or _has_changed(old, new, deadband.get(node) if is_dict else deadband):
+                    changed[node] = new
+            if not changed:
+                return None
+            last.update(changed)
+        return self.callback(changed)
+    
+    def unsubscribe(self) -> None:
+        """ Remove the subscription from the downloader """
+        self._downloader.unsubscribe(self)
+    
+    def reset(self) -> None:
+        """ Forget the last notified values, all nodes are notified at the next download """
+        self._last = dict.fromkeys(self.nodes, _NOT_SET)
+
+
+class DataSnapshot(Mapping):
+    """ Immutable node/value mapping of the :class:`Downloader` data at the end of a download cycle 
+    
+    Attributes:
+        version (int): download cycle number, increasing by one at each download
+        timestamp (float): time (time.time()) of the end of the download cycle 
+    """
+    __slots__ = ('_data', 'version', 'timestamp')
+    def __init__(self, data: Dict[BaseNode, Any], version: int, timestamp: float):
+        self._data = data 
+        self.version = version 
+        self.timestamp = timestamp 
+    
+    def __getitem__(self, node):
+        return self._data[node]
+    
+    def __iter__(self):
+        return iter(self._data)
+    
+    def __len__(self):
+        return len(self._data)
+    
+    def __repr__(self):
+        return f"<{self.__class__.__name__} version={self.version} {self._data!r}>"
+
 
 class StopDownloader(StopIteration):
     pass
 
+class PartialDownloadError(RuntimeError):
+    """ Raised (or sent to failure callbacks) when some servers (sid) failed to be read 
+    
+    Attributes:
+        errors (dict): sid/exception pairs (or alias/exception pairs for failing aliases) 
+    """
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__("download failed for: "+", ".join(
+            f"{sid!r} ({e.__class__.__name__}: {e})" for sid, e in errors.items()
+        ))
+
 class Downloader:
     """ object dedicated to download nodes, feed data and run some callback 
 
@@ -245,6 +548,43 @@ class Downloader:
         trigger (callable, optional): a function taking no argument and should return True or False 
                                       If given the "download" method download nodes only if f() return True. 
                                       Can be used if the download object is running in a thread for instance.
+        max_workers (int, Executor, optional): If given, nodes of different servers (sid) are read 
+                                      concurrently in a thread pool of max_workers threads (one 
+                                      collector per sid). An already built :class:`concurrent.futures.Executor` 
+                                      is also accepted. Default is None: servers are read one after the other. 
+                                      A thread pool created from an int is shut down by :meth:`close`. 
+        single_flight (SingleFlight, bool, optional): If given, server reads are merged with the reads 
+                                      of the same nodes done at the same time by other threads sharing
+                                      the same :class:`SingleFlight` group (True for the default group).
+        isolate_failures (bool, optional): If True each server (sid) is read independently. A failing sid 
+                                      does not abort the download: its nodes keep their last values and are
+                                      marked as stale (see :attr:`errors`, :attr:`stale_nodes`), datalinks 
+                                      and callbacks are still executed with the other values. Failure 
+                                      callbacks receive a :class:`PartialDownloadError`. 
+        metrics (bool, int, optional): If True (or the number of samples), timing metrics are recorded 
+                                      see :attr:`metrics` and :class:`DownloaderMetrics`. Default is False
+        callback_executor (:class:`CallbackExecutor`, optional): If given, callbacks and failure callbacks 
+                                      are executed in the executor threads instead of the download thread, so
+                                      slow callbacks do not delay the next download. Note that the data 
+                                      can be updated by the next download while a callback is executed and 
+                                      that a :class:`StopDownloader` raised by a callback is then ignored. 
+    
+    Multi-rate: 
+        Connections, nodes and datalinks can be given their own download period (see 
+        :meth:`new_connection`, :meth:`add_nodes`, :meth:`add_datalink`). Nodes without period are 
+        downloaded at the period of :meth:`run` (or at each :meth:`download` call). At each tick only 
+        the nodes of the due periods are red (still in one call per server) and only the datalinks and 
+        callbacks of the refreshed connections are executed. This avoids running several downloaders 
+        in several threads. 
+        
+        ::
+        
+            >>> downloader = Downloader()
+            >>> fast = downloader.new_connection(period=0.02)
+            >>> fast.add_node(mgr.motor1.stat.pos_actual)
+            >>> slow = downloader.new_connection(period=1.0)
+            >>> slow.add_node(mgr.motor1.stat.temperature)
+            >>> downloader.run(period=0.1) # other nodes are red at 10Hz 
     
     Example: 
     
@@ -303,10 +643,36 @@ class Downloader:
             nodes_or_datalink: Union[Iterable, BaseDataLink] = None,  
             data: Optional[Dict] = None, 
             callback: Optional[Callable] = None,
-            trigger: Optional[Callable] = None
+            trigger: Optional[Callable] = None, 
+            max_workers: Optional[Union[int, Executor]] = None, 
+            isolate_failures: bool = False, 
+            single_flight: Optional[Union[SingleFlight, bool]] = None, 
+            callback_executor: Optional[CallbackExecutor] = None, 
+            metrics: Union[bool, int] = False
         ) -> None:
         if data is None:
             data = {}
+        self._callback_executor = callback_executor
+        self._acquisition = AcquisitionTimes()
+        self._metrics = None
+        if metrics:
+            self.enable_metrics(1000 if metrics is True else metrics)
+        
+        # snapshots are published (copy of data) only once they have been requested 
+        self._version = 0 
+        self._snapshot = None
+        self._snapshot_enabled = False
+        self._snapshot_condition = threading.Condition()
+        
+        self._index = DataIndex(data)
+        
+        # an executor created here is owned (and shut down by close), a given one is not 
+        self._own_executor = isinstance(max_workers, int)
+        if self._own_executor:
+            max_workers = ThreadPoolExecutor(max_workers, thread_name_prefix="pydevmgr_download")
+        self._executor = max_workers
+        self._isolate_failures = isolate_failures
+        self._errors = {}
                
         self._data = data 
         
@@ -353,18 +719,45 @@ class Downloader:
         
         self._trigger = trigger
         # Ellipsis is here to define general nodes,datalinks,callbacks, ... independent to connection
-        self._dict_nodes = OrderedDict([(Ellipsis,nodes)])
-        self._dict_datalinks = OrderedDict([(Ellipsis,datalinks)])
+        # nodes and datalinks are stored with their download period (None for every download)  
+        self._dict_nodes = OrderedDict([(Ellipsis,dict.fromkeys(nodes))])
+        self._dict_datalinks = OrderedDict([(Ellipsis,dict.fromkeys(datalinks))])
         self._dict_callbacks = OrderedDict([(Ellipsis,callbacks)])
         self._dict_failure_callbacks = OrderedDict([(Ellipsis,failure_callbacks)])
+        self._dict_periods = OrderedDict([(Ellipsis,None)])
+        self._dict_subscriptions = OrderedDict([(Ellipsis,[])])
         
         
         self.trigger = trigger
         self._next_token = 1
         
-        self._rebuild_nodes()
+        # nodes are reference counted (several connections/datalinks can use the same node) 
+        # the reader is updated incrementally: changes are queued and applied by the 
+        # download call so the reader is never modified while reading 
+        self._nodes = {}
+        self._single_flight = single_flight
+        self._to_read = NodesReader(executor=self._executor, single_flight=single_flight)
+        self._last_reader = self._to_read
+        self._pending = []
+        self._lock = threading.Lock()
+        
+        # multi-rate scheduling. One reader and one node reference count per period.
+        # _to_read is the reader of the None period. Readers of several periods due at 
+        # the same tick are merged in order to keep one call per server 
+        self._rate_nodes = {None:{}}
+        self._readers = {None: self._to_read}
+        self._merged_readers = {}
+        self._schedulers = {} # period -> DeadlineScheduler, None is the run period 
+        self._catchup = CATCHUP.SKIP
+        self._schedule = () # periods (not None) to be scheduled 
+        self._token_periods = {}
+        
+        self._register_nodes(nodes)
+        for dl in datalinks:
+            self._register_nodes(dl.rnodes)
         self._rebuild_callbacks()
         self._rebuild_failure_callbacks()
+        self._rebuild_schedule()
     
     def __has__(self, node):
         return node in self._nodes
@@ -373,20 +766,156 @@ class Downloader:
     def data(self):
         return self._data
     
-    def _rebuild_nodes(self):
-        nodes = set()
-        for nds in self._dict_nodes.values():
-            nodes.update(nds)
-            for n in nds:
-                self._data.setdefault(n,None)
-        for dls in self._dict_datalinks.values():
-            for dl in dls:
-                nodes.update(dl.rnodes)
-                for n in dl.rnodes:
+    @property
+    def errors(self) -> dict:
+        """ sid/exception pairs of the servers which failed during the last download 
+        
+        Aliases which failed to be evaluated are included as alias/exception pairs. 
+        Only relevant when the downloader isolate failures
+        """
+        return dict(self._errors)
+    
+    @property
+    def stale_nodes(self) -> set:
+        """ set of nodes not updated during the last download because of a sid failure """
+        if not self._errors:
+            return set()
+        return self._last_reader.stale_nodes(self._errors)
+    
+    def is_stale(self, node) -> bool:
+        """ True if the node value was not updated by the last download because of a failure """
+        return node in self.stale_nodes 
+    
+    def _register_nodes(self, nodes, period=None):
+        with self._lock:
+            rate_nodes = self._rate_nodes.setdefault(period, {})
+            for n in nodes:
+                if n is None: continue
+                count = self._nodes.get(n, 0)
+                self._nodes[n] = count+1
+                if not count:
                     self._data.setdefault(n,None)
+                    self._index.add(n)
+                count = rate_nodes.get(n, 0)
+                rate_nodes[n] = count+1
+                if not count:
+                    self._pending.append((True, n, period))
+    
+    def _unregister_nodes(self, nodes, period=None):
+        with self._lock:
+            rate_nodes = self._rate_nodes.get(period, {})
+            for n in nodes:
+                try:
+                    count = self._nodes[n]
+                except KeyError:
+                    continue
+                if count>1:
+                    self._nodes[n] = count-1
+                else:
+                    del self._nodes[n]
                 
-        self._nodes = nodes
-        self._to_read = NodesReader(nodes)
+                count = rate_nodes.get(n, 0)
+                if count>1:
+                    rate_nodes[n] = count-1
+                elif count:
+                    del rate_nodes[n]
+                    self._pending.append((False, n, period))
+            if period is not None and not rate_nodes:
+                self._rate_nodes.pop(period, None)
+    
+    def _apply_pending(self):
+        # apply the queued node changes to the readers 
+        with self._lock:
+            pending, self._pending = self._pending, []
+            periods = set(self._rate_nodes)
+        readers = self._readers
+        for added, node, period in pending:
+            try:
+                reader = readers[period]
+            except KeyError:
+                reader = readers[period] = NodesReader(executor=self._executor, single_flight=self._single_flight)
+            if added:
+                reader.add(node)
+            else:
+                reader.remove(node)
+        for period in list(readers):
+            if period not in periods and period is not None:
+                del readers[period]
+        self._merged_readers.clear()
+    
+    def _rebuild_schedule(self):
+        # periods used by each connection and the set of periods to schedule 
+        token_periods = {}
+        for token, period in self._dict_periods.items():
+            periods = set(self._dict_nodes[token].values())
+            periods.update(self._dict_datalinks[token].values())
+            if self._dict_subscriptions.get(token):
+                # subscribed nodes are downloaded at the connection period 
+                periods.add(period)
+            # a connection without nodes nor datalinks follows its own period 
+            token_periods[token] = frozenset(periods or (period,))
+        
+        schedule = set()
+        for periods in token_periods.values():
+            schedule.update(periods)
+        schedule.discard(None)
+        for period in list(self._schedulers):
+            if period not in schedule and period is not None:
+                del self._schedulers[period]
+        self._token_periods = token_periods
+        self._schedule = tuple(sorted(schedule))
+    
+    def _get_rate_reader(self, due):
+        # return the reader for the due periods 
+        if len(due) == 1:
+            for period in due:
+                try:
+                    return self._readers[period]
+                except KeyError: # no nodes for this period 
+                    return self._to_read if period is None else NodesReader()
+        key = frozenset(due)
+        try:
+            return self._merged_readers[key]
+        except KeyError:
+            pass 
+        with self._lock:
+            nodes = {} 
+            for period in due:
+                nodes.update(self._rate_nodes.get(period, {}))
+        reader = NodesReader(nodes, executor=self._executor, single_flight=self._single_flight)
+        self._merged_readers[key] = reader
+        return reader
+    
+    def _due_periods(self, now, base_period=None):
+        # return the set of due periods and schedule the next deadlines 
+        # The None period is always due, except if base_period is given
+        due = set()
+        for period, p in [(None, base_period)]+[(p,p) for p in self._schedule]:
+            if p is None:
+                due.add(period)
+                continue 
+            try:
+                scheduler = self._schedulers[period]
+            except KeyError:
+                scheduler = self._schedulers[period] = DeadlineScheduler(p, self._catchup)
+            if scheduler.is_due(now):
+                due.add(period)
+                scheduler.advance(now)
+        return due 
+    
+    def _time_to_deadline(self):
+        # time to wait before the next scheduled download 
+        now = time.monotonic()
+        return min(s.time_to_deadline(now) for s in list(self._schedulers.values()))
+    
+    @property
+    def schedulers(self) -> Dict[Optional[float], DeadlineScheduler]:
+        """ period/:class:`DeadlineScheduler` pairs used by :meth:`run` 
+        
+        The None key is the scheduler of the run period. The schedulers hold timing statistics 
+        (lateness, jitter, overruns, ...) 
+        """
+        return dict(self._schedulers)
 
     def _rebuild_callbacks(self):
         callbacks = set()
@@ -400,10 +929,23 @@ class Downloader:
             callbacks.update(clbc)
         self._failure_callbacks = callbacks
     
+    def _discard_callbacks(self, callbacks):
+        # forget the executor lanes of removed callbacks, unless still used by another connection
+        executor = self._callback_executor
+        if executor is None:
+            return 
+        for func in callbacks:
+            if func not in self._callbacks and func not in self._failure_callbacks:
+                executor.discard(func)
     
-    def new_token(self) -> tuple:
+    def new_token(self, period: Optional[float] = None) -> tuple:
         """ add a new app connection token
         
+        Args:
+            period (float, optional): default download period in second of the nodes and datalinks 
+                added with this token. Callbacks of this token are executed only when one of 
+                its period is due. None (default) means each download (or at the period of :meth:`run`).
+        
         Return:
            A token, the token and type itself is not relevant, it is just a unique ID to be used in 
                     add_node, add_callback, add_failure_callback, and disconnect methods 
@@ -415,25 +957,36 @@ class Downloader:
                 
         
         """
+        _check_period(period)
         token = id(self), self._next_token
-        self._dict_nodes[token] = set()
-        self._dict_datalinks[token] = set()
+        self._dict_nodes[token] = {}
+        self._dict_datalinks[token] = {}
         self._dict_callbacks[token] = set()
         self._dict_failure_callbacks[token] = set()
+        self._dict_periods[token] = period
+        self._dict_subscriptions[token] = []
         
         self._next_token += 1
-        # self._rebuild_nodes()
         # self._rebuild_callbacks()
         # self._rebuild_failure_callbacks()
+        self._rebuild_schedule()
         return token
     
-    def new_connection(self):
+    def new_connection(self, period: Optional[float] = None):
         """ Return a :class:`DownloaderConnection` object 
         
         The :class:`DownloaderConnection` object contain a token and the downloader in order to have 
         a standalone object to handle the add/remove of queue nodes and callbacks 
+        
+        Args:
+            period (float, optional): default download period in second of the connection. 
+                                      See :meth:`new_token`
         """
-        return DownloaderConnection(self, self.new_token())
+        return DownloaderConnection(self, self.new_token(period))
+    
+    def get_period(self, token: tuple) -> Optional[float]:
+        """ Return the default download period of a connection token """
+        return self._dict_periods[token]
     
     def disconnect(self, token: tuple) -> None:
         """ Disconnect the iddentified connection 
@@ -451,18 +1004,28 @@ class Downloader:
             raise ValueError('please provide a real token')
         
         try:
-            self._dict_nodes.pop(token)
-            self._dict_datalinks.pop(token)
-            self._dict_callbacks.pop(token)
-            self._dict_failure_callbacks.pop(token)
+            nodes = self._dict_nodes.pop(token)
+            datalinks = self._dict_datalinks.pop(token)
+            callbacks = self._dict_callbacks.pop(token)
+            failure_callbacks = self._dict_failure_callbacks.pop(token)
+            period = self._dict_periods.pop(token)
+            subscriptions = self._dict_subscriptions.pop(token)
         except KeyError:
-            pass
+            return 
+        
+        for subscription in subscriptions:
+            self._unregister_nodes(subscription.nodes, period)
         
-        self._rebuild_nodes()
+        for node, period in nodes.items():
+            self._unregister_nodes([node], period)
+        for dl, period in datalinks.items():
+            self._unregister_nodes(dl.rnodes, period)
         self._rebuild_callbacks()
         self._rebuild_failure_callbacks()
+        self._discard_callbacks(callbacks | failure_callbacks)
+        self._rebuild_schedule()
     
-    def add_node(self, token: tuple, *nodes) -> None:
+    def add_node(self, token: tuple, *nodes, period: Optional[float] = None) -> None:
         """ Register node to be downloaded for an iddentified app
         
         Args:
@@ -470,11 +1033,12 @@ class Downloader:
                    ``add_node(...,node1, node2)`` can also be used, in this case nodes will be added
                    to the main pool of nodes and cannot be removed from the downloader 
             *nodes :  nodes to be added to the download queue, associated to the app
+            period (float, optional): download period of the nodes in second. Default is the 
+                   period of the token (see :meth:`new_token`)
         """   
-        self._dict_nodes[token].update(nodes)
-        self._rebuild_nodes()
+        self.add_nodes(token, nodes, period=period)
     
-    def add_nodes(self, token: tuple, nodes: Union[dict,Iterable]) -> None:
+    def add_nodes(self, token: tuple, nodes: Union[dict,Iterable], period: Optional[float] = None) -> None:
         """ Register nodes to be downloaded for an iddentified app
         
         Args:
@@ -483,13 +1047,29 @@ class Downloader:
                    to the main pool of nodes and cannot be removed from the downloader 
             nodes (Iterable, dict):  nodes to be added to the download queue, associated to the app
                    If a dictionary of node/value pairs, they are added to the downloader data.  
+            period (float, optional): download period of the nodes in second. Default is the 
+                   period of the token (see :meth:`new_token`)
         """
+        if period is None:
+            period = self._dict_periods[token]
+        _check_period(period)
+        
         if isinstance(nodes, dict):
             for node,val in nodes.items():
                 self._data[node] = val
-        
-        self._dict_nodes[token].update(nodes)
-        self._rebuild_nodes()
+                self._index.add(node)
+        
+        token_nodes = self._dict_nodes[token]
+        new_nodes = []
+        for n in nodes:
+            if n in token_nodes:
+                if token_nodes[n] == period:
+                    continue
+                self._unregister_nodes([n], token_nodes[n])
+            token_nodes[n] = period 
+            new_nodes.append(n)
+        self._register_nodes(new_nodes, period)
+        self._rebuild_schedule()
     
     def remove_node(self, token: tuple, *nodes) -> None:
         """ Remove node from the download queue
@@ -502,14 +1082,13 @@ class Downloader:
             token: a Token returned by :func:`Downloader.new_token`                  
             *nodes :  nodes to be removed 
         """   
-        for node in nodes:
-            try:
-                self._dict_nodes[token].remove(node)
-            except KeyError:
-                pass 
-        self._rebuild_nodes()
+        token_nodes = self._dict_nodes[token]
+        for n in nodes:
+            if n in token_nodes:
+                self._unregister_nodes([n], token_nodes.pop(n))
+        self._rebuild_schedule()
     
-    def add_datalink(self, token: tuple, *datalinks) -> None:
+    def add_datalink(self, token: tuple, *datalinks, period: Optional[float] = None) -> None:
         """ Register a new datalink
         
         Args:
@@ -517,9 +1096,22 @@ class Downloader:
                 ``add_datalink(...,dl1, dl2)`` can also be used, in this case they will be added
                 to the main pool of datalinks and cannot be remove from the downloader   
             *datalinks :  :class:`DataLink` to be added to the download queue, associated to the token 
+            period (float, optional): download period of the datalinks in second. Default is the 
+                   period of the token (see :meth:`new_token`)
         """           
-        self._dict_datalinks[token].update(datalinks)
-        self._rebuild_nodes()    
+        if period is None:
+            period = self._dict_periods[token]
+        _check_period(period)
+        
+        token_datalinks = self._dict_datalinks[token]
+        for dl in datalinks:
+            if dl in token_datalinks:
+                if token_datalinks[dl] == period:
+                    continue
+                self._unregister_nodes(dl.rnodes, token_datalinks[dl])
+            token_datalinks[dl] = period
+            self._register_nodes(dl.rnodes, period)
+        self._rebuild_schedule()
     
     def remove_datalink(self, token: tuple, *datalinks) -> None:
         """ Remove a datalink from a established connection
@@ -530,12 +1122,11 @@ class Downloader:
             token: a Token returned by :func:`Downloader.new_token`
             *datalinks :  :class:`DataLink` objects to be removed         
         """
+        token_datalinks = self._dict_datalinks[token]
         for dl in  datalinks:
-            try:
-                self._dict_datalinks[token].remove(dl)
-            except KeyError:
-                pass 
-        self._rebuild_nodes()
+            if dl in token_datalinks:
+                self._unregister_nodes(dl.rnodes, token_datalinks.pop(dl))
+        self._rebuild_schedule()
         
     def add_callback(self, token: tuple, *callbacks) -> None:   
         """ Register callbacks to be executed after each download 
@@ -566,6 +1157,7 @@ class Downloader:
             except KeyError:
                 pass 
         self._rebuild_callbacks()
+        self._discard_callbacks(callbacks)
     
     
     def add_failure_callback(self, token: tuple, *callbacks) -> None:  
@@ -597,25 +1189,100 @@ class Downloader:
             except KeyError:
                 pass         
         self._rebuild_failure_callbacks()
+        self._discard_callbacks(callbacks)
+    
+    def subscribe(self, 
+            token: tuple, 
+            nodes: Iterable, 
+            callback: Callable, 
+            deadband: Optional[Union[float, Dict[BaseNode,float]]] = None, 
+            on_change: bool = True
+        ) -> Subscription:
+        """ Subscribe a callback to the changes of some nodes 
+        
+        The nodes are added to the download queue (at the token period). After each download 
+        the new values are compared to the previously notified ones and ``callback(changed)`` is
+        called only if some nodes changed, ``changed`` is a dictionary of node/value pairs of 
+        the changed nodes. The first download notifies all the nodes. 
+        
+        Args:
+            token: a Token returned by :func:`Downloader.new_token`
+            nodes (iterable): nodes to subscribe to 
+            callback (callable): function with signature ``f(changed)``
+            deadband (float, dict, optional): absolute deadband for numerical values, a change 
+                smaller or equal to deadband is ignored. Can be a dictionary of node/deadband pairs. 
+            on_change (bool, optional): If False, the callback is called at each download with 
+                all the subscribed nodes. Default is True 
+        
+        Returns:
+            subscription (:class:`Subscription`): an object with an ``unsubscribe()`` method 
+        
+        Example:
+        
+        ::
+        
+            >>> connection = downloader.new_connection()
+            >>> connection.subscribe([motor.stat.pos_actual], print, deadband=0.01)
+        """
+        subscription = Subscription(self, token, nodes, callback, deadband=deadband, on_change=on_change)
+        self._register_nodes(subscription.nodes, self._dict_periods[token])
+        self._dict_subscriptions[token].append(subscription)
+        self._dict_callbacks[token].add(subscription)
+        self._rebuild_callbacks()
+        self._rebuild_schedule()
+        return subscription
     
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """ Remove a :class:`Subscription` 
+        
+        If the subscription is not in the downloader nothing is done or raised
+        """
+        token = subscription._token
+        try:
+            self._dict_subscriptions[token].remove(subscription)
+        except (KeyError, ValueError):
+            return 
+        self._dict_callbacks[token].discard(subscription)
+        self._unregister_nodes(subscription.nodes, self._dict_periods[token])
+        self._rebuild_callbacks()
+        self._rebuild_schedule()
+        self._discard_callbacks([subscription])
     
     def run(self, 
             period: float =1.0, 
             stop_signal: Callable =lambda : False, 
-            sleepfunc: Callable =time.sleep
+            sleepfunc: Callable =time.sleep, 
+            catchup: Union[str, CATCHUP] = CATCHUP.SKIP
         ) -> None:
         """ run the download indefinitely or when stop_signal return True 
         
+        Downloads are scheduled on deadlines of the monotonic clock (see :class:`DeadlineScheduler`) 
+        so the cadence does not drift. Timing statistics are available in :attr:`schedulers`. 
+        
         Args:
-            period (float, optional): period between downloads in second
+            period (float, optional): period between downloads in second. This is the period of 
+                nodes, datalinks and connections without their own period 
             stop_signal (callable, optional): a function returning True to stop the loop or False to continue
-            
+            sleepfunc (callable, optional): function used to sleep 
+            catchup (str, :class:`CATCHUP`, optional): policy when a download is late of one period 
+                or more: "skip" (default), "burst" or "stretch"
         """
+        self._catchup = CATCHUP(catchup)
+        self._schedulers.clear()
+        scheduler = self._schedulers[None] = DeadlineScheduler(period, self._catchup)
         try:
             while not stop_signal():
-                s_time = time.time()
-                self.download()
-                sleepfunc( max( period-(time.time()-s_time), 0))
+                if self._schedule:
+                    self._download(period)
+                else:
+                    now = time.monotonic()
+                    if scheduler.is_due(now):
+                        scheduler.advance(now)
+                        try:
+                            self.download()
+                        finally:
+                            scheduler.done()
+                sleepfunc( self._time_to_deadline() )
         except StopDownloader: # any downloader call back can send a StopDownloader to stop the runner 
             return 
             
@@ -651,36 +1318,288 @@ class Downloader:
         
         If the Downloader has a trigger method and the trigger return false, nothing is done
         
+        Nodes with a download period are downloaded only if their period is due.
         """
-        
-        if not self.trigger(): return 
-        
+        self._download(None)
+    
+    def _download(self, base_period):
+        plan = self._download_plan(base_period)
+        if plan is None:
+            return 
+        due, reader, datalinks, callbacks, _ = plan 
+        try:
+            self._read_and_dispatch(reader, datalinks, callbacks)
+        finally:
+            self._schedule_done(due)
+    
+    def _download_plan(self, base_period):
+        # return (due periods, reader, datalinks, callbacks, refreshed tokens) or None if 
+        # nothing has to be downloaded. refreshed tokens is None if all tokens are refreshed 
+        if self._pending:
+            self._apply_pending()
+        
+        if not self._schedule:
+            if not self.trigger(): return None
+            datalinks = [dl for dls in self._dict_datalinks.values() for dl in dls]
+            return (), self._to_read, datalinks, self._callbacks, None
+        
+        due = self._due_periods(time.monotonic(), base_period)
+        if not due or not self.trigger():
+            return None
+        reader = self._get_rate_reader(due)
+        datalinks = [dl for dls in self._dict_datalinks.values() for dl, p in dls.items() if p in due]
+        callbacks = set()
+        tokens = set()
+        for token, periods in self._token_periods.items():
+            if not due.isdisjoint(periods):
+                callbacks.update(self._dict_callbacks.get(token, ()))
+                tokens.add(token)
+        return due, reader, datalinks, callbacks, tokens
+    
+    def _schedule_done(self, due):
+        now = time.monotonic()
+        for period in due:
+            scheduler = self._schedulers.get(period)
+            if scheduler is not None:
+                scheduler.done(now)
+    
+    def _read_and_dispatch(self, reader, datalinks, callbacks):
+        self._last_reader = reader 
+        tic = time.perf_counter()
+        try:
+            if self._isolate_failures:
+                self._download_isolated(reader, datalinks, callbacks)
+            else:
+                self._download_all(reader, datalinks, callbacks)
+        finally:
+            if self._metrics is not None:
+                self._metrics.cycle.add(time.perf_counter()-tic)
+    
+    def _download_all(self, reader, datalinks, callbacks):
+        cycle, since = new_cycle(), time.time()
+        tic = time.perf_counter()
         try:
-            self._to_read.read(self._data)
+            reader.read(self._data)
         except Exception as e:
+            self._record(cycle, reader, since, tic)
             if self._failure_callbacks:
                 self._did_failed_flag = True
-                for func in self._failure_callbacks:                    
-                    func(e)
+                self._run_failure_callbacks(e)
             else:
                 raise e            
         else:
+            self._record(cycle, reader, since, tic)
             # Populate the data links 
-            for dls in self._dict_datalinks.values():
-                for dl in dls:
-                    dl._download_from(self._data)
+            self._download_datalinks(datalinks)
+            self._publish_snapshot()
             
             if self._did_failed_flag:
                 self._did_failed_flag = False
-                for func in self._failure_callbacks:                    
-                    func(None)
-                    
-            for func in self._callbacks:
-                func()
+                self._run_failure_callbacks(None)
+            
+            self._run_callbacks(callbacks)
+    
+    def _record(self, cycle, reader, since, tic):
+        # record acquisition times and metrics of a read started at tic (perf_counter)
+        self._acquisition.record(cycle, reader, since)
+        metrics = self._metrics 
+        if metrics is None:
+            return 
+        metrics.read.add(time.perf_counter()-tic)
+        metrics.aliases.add(reader.alias_time)
+        # durations are computed on perf_counter, wall clock stamps can jump 
+        for sid, (start, end) in list(reader.sid_perf_times.items()):
+            if start >= tic:
+                metrics.add_sid(sid, end-start)
+    
+    def _download_datalinks(self, datalinks):
+        tic = time.perf_counter()
+        for dl in datalinks:
+            dl._acquisition = self._acquisition
+            dl._download_from(self._data)
+        if self._metrics is not None:
+            self._metrics.datalinks.add(time.perf_counter()-tic)
+    
+    def _run_failure_callbacks(self, error):
+        tic = time.perf_counter()
+        for func in self._failure_callbacks:
+            self._run_callback(func, error)
+        if self._metrics is not None:
+            self._metrics.failure_callbacks.add(time.perf_counter()-tic)
+    
+    def _run_callbacks(self, callbacks):
+        tic = time.perf_counter()
+        for func in callbacks:
+            self._run_callback(func)
+        if self._metrics is not None:
+            self._metrics.callbacks.add(time.perf_counter()-tic)
+    
+    @property
+    def metrics(self) -> Optional[DownloaderMetrics]:
+        """ :class:`DownloaderMetrics` or None if metrics are not enabled """
+        metrics = self._metrics 
+        if metrics is not None:
+            counts = {}
+            for reader in list(self._readers.values()):
+                counts.update(reader.sid_counts())
+            metrics.nodes_per_sid = counts 
+        return metrics
+    
+    def enable_metrics(self, size: int = 1000) -> DownloaderMetrics:
+        """ Start to record the timing metrics 
+        
+        Args:
+            size (int, optional): number of samples kept in the rolling histograms 
+        """
+        if self._metrics is None:
+            self._metrics = DownloaderMetrics(size)
+        return self._metrics
+    
+    def disable_metrics(self) -> None:
+        """ Stop to record the timing metrics """
+        self._metrics = None 
+    
+    def _publish_snapshot(self):
+        # called after each successful download cycle 
+        self._version += 1
+        if not self._snapshot_enabled:
+            return 
+        snapshot = DataSnapshot(dict(self._data), self._version, time.time())
+        with self._snapshot_condition:
+            self._snapshot = snapshot
+            self._snapshot_condition.notify_all()
+    
+    @property
+    def acquisition(self) -> AcquisitionTimes:
+        """ :class:`AcquisitionTimes` of the downloaded nodes: sid round-trip times and cycle numbers """
+        return self._acquisition
+    
+    @property
+    def cycle(self) -> int:
+        """ global number of the last download cycle (see :func:`new_cycle`)"""
+        return self._acquisition.cycle
+    
+    def get_timestamp(self, node: BaseNode) -> Optional[float]:
+        """ Return the acquisition time (time.time()) of the node value or None """
+        return self._acquisition.timestamp(node)
+    
+    @property
+    def version(self) -> int:
+        """ number of successful download cycles """
+        return self._version
+    
+    def snapshot(self) -> DataSnapshot:
+        """ Return the immutable :class:`DataSnapshot` of the data published at the last download cycle
+        
+        Contrary to :attr:`data`, which is updated in place, the snapshot is a consistent view of one 
+        download cycle. It can be used by other threads without locking. 
+        
+        Snapshots are published after the first call of :meth:`snapshot` or :meth:`wait_snapshot`, 
+        before that the returned snapshot is a copy of the current data.  
+        """
+        if not self._snapshot_enabled:
+            self._snapshot_enabled = True
+            with self._snapshot_condition:
+                self._snapshot = DataSnapshot(dict(self._data), self._version, time.time())
+        return self._snapshot
+    
+    def wait_snapshot(self, after_version: int = -1, timeout: Optional[float] = None) -> DataSnapshot:
+        """ Wait for a snapshot with a version greater than after_version 
+        
+        Args:
+            after_version (int, optional): a version number, e.g. the version of the last processed
+                snapshot. Default (-1) return the last snapshot 
+            timeout (float, optional): timeout in second. A RuntimeError is raised if no new snapshot
+                was published before the timeout. 
+        
+        Example:
+            
+        ::
+            
+            snapshot = downloader.snapshot()
+            while True:
+                snapshot = downloader.wait_snapshot(snapshot.version)
+                print( snapshot[mgr.motor1.stat.pos_actual] )
+        """
+        self.snapshot()
+        with self._snapshot_condition:
+            if not self._snapshot_condition.wait_for(
+                    lambda: self._snapshot.version > after_version, 
+                    timeout):
+                raise RuntimeError('wait_snapshot timeout')
+            return self._snapshot
+    
+    def _run_callback(self, func, *args):
+        # execute a callback inline or inside the callback executor 
+        executor = self._callback_executor
+        if executor is None:
+            func(*args)
+        else:
+            executor.submit(func, *args)
+    
+    @property
+    def callback_executor(self) -> Optional[CallbackExecutor]:
+        """ :class:`CallbackExecutor` used to execute callbacks or None if they are executed inline """
+        return self._callback_executor
+    
+    def _download_isolated(self, reader, datalinks, callbacks):
+        errors = {}
+        cycle, since = new_cycle(), time.time()
+        tic = time.perf_counter()
+        try:
+            reader.read(self._data, errors)
+        except Exception as e:
+            # not related to one sid or alias (e.g. a constant evaluation) 
+            self._record(cycle, reader, since, tic)
+            self._errors = errors
+            if self._failure_callbacks:
+                self._did_failed_flag = True
+                self._run_failure_callbacks(e)
+                return 
+            raise e
+        self._record(cycle, reader, since, tic)
+        self._errors = errors
+        
+        if errors:
+            self._did_failed_flag = True
+            self._run_failure_callbacks(PartialDownloadError(errors))
+        
+        self._download_datalinks(datalinks)
+        self._publish_snapshot()
+        
+        if not errors and self._did_failed_flag:
+            self._did_failed_flag = False
+            self._run_failure_callbacks(None)
+        
+        self._run_callbacks(callbacks)
     
     def reset(self) -> None:
         """ All nodes of the downloader with a reset method will be reseted """
-        reset(self._dict_nodes)
+        reset(self._nodes)
+    
+    def resolve_constants(self) -> None:
+        """ Evaluate again the constant nodes at next download 
+        
+        Constant nodes (e.g. :class:`pydevmgr_core.nodes.Static`) and the aliases depending only on 
+        them are evaluated once, this shall be called after a change of their configuration. 
+        """
+        for reader in list(self._readers.values())+list(self._merged_readers.values()):
+            reader.resolve_constants()
+    
+    def close(self) -> None:
+        """ Shut down the thread pool created by the downloader (see ``max_workers``) 
+        
+        An executor given at init is left to its owner. The downloader shall not download after close. 
+        """
+        if self._own_executor:
+            self._own_executor = False
+            self._executor.shutdown(wait=True)
+    
+    def __enter__(self):
+        return self 
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
             
     def get_data_view(self, prefix: str ='') -> DataView:
         """ Return a view of the data in a dictionary where keys are string keys extracted from nodes
@@ -688,9 +1607,9 @@ class Downloader:
         If prefix is given the return object will be limited to items with key
         matching the prefix.  
         
-        Note: the data view reflect any change made on the rootdata except when new nodes 
-        (mathing the prefix) are added. So all necessary nodes shall be added to the downloader 
-        before requesting a DataView. 
+        The data view is a live view: it reflects any change made on the root data including the 
+        nodes (matching the prefix) added later to the downloader. Views are built in O(1) from 
+        an index of node keys maintained by the downloader. 
         
         Args:
            prefix (str, optional): limit the data viewer to a given prefix. prefix can also be an object 
@@ -712,7 +1631,11 @@ class Downloader:
                 # is equivalent to 
                 > m1_data = DataView(downloader.data, mgr.motor1)
         """
-        return DataView(self._data, prefix)        
+        return DataView(self._data, prefix, index=self._index)
+    
+    def get_node(self, key: str) -> Optional[BaseNode]:
+        """ Return the node of the data matching the given key or None """
+        return self._index.get(key)
     
     def clean_data(self) -> None:
         """ Remove to the .data dictionary all keys/value pairs corresponding to nodes not in the downloader queue
@@ -721,12 +1644,241 @@ class Downloader:
            n (int): The number of node/value pair removed 
         """
         d = self.data
-        n = 0
+        count = 0
         for n in list(d): # list(d) in order to avoid deletion on the iterator
             if not n in self._nodes:
                 d.pop(n, None)
-                n+=1
-        return n
+                self._index.remove(n)
+                count+=1
+        return count
+
+
+async def _call(func, *args):
+    # call a function or a coroutine function 
+    result = func(*args)
+    if asyncio.iscoroutine(result) or isinstance(result, asyncio.Future):
+        return await result
+    return result
+
+class AsyncDownloaderConnection(DownloaderConnection):
+    """ Hold a connection to a :class:`AsyncDownloader` 
+    
+    Same as :class:`DownloaderConnection` with an awaitable :meth:`next_update` 
+    """
+    async def next_update(self) -> dict:
+        """ wait the next download refreshing this connection and return the downloader data """
+        self._check_connection()
+        return await self._downloader.next_update(self._token)
+
+
+class AsyncDownloader(Downloader):
+    """ asyncio counterpart of :class:`Downloader` 
+
+    The connections, datalinks and callbacks model is the same than for :class:`Downloader`. 
+    Nodes are red with :meth:`NodesReader.aread` (servers are read concurrently). Callbacks and 
+    failure callbacks can be coroutine functions, they are awaited. 
+    
+    The downloader is running as a task (see :meth:`start`) inside the event loop, so data and
+    callbacks are accessed from the loop without any cross-thread locking.  
+    
+    Args: 
+        Same as :class:`Downloader`
+    
+    Example:
+    
+    ::
+        
+        async def main():
+            downloader = AsyncDownloader([mgr.motor1.stat.pos_actual])
+            downloader.start(period=0.1)
+            data = await downloader.next_update()
+            print( data[mgr.motor1.stat.pos_actual] )
+            await downloader.stop()
+    """
+    Connection = AsyncDownloaderConnection
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._waiters = [] # (token, future) pairs 
+        self._task = None
+    
+    def new_connection(self, period: Optional[float] = None) -> AsyncDownloaderConnection:
+        """ Return a :class:`AsyncDownloaderConnection` object 
+        
+        Args:
+            period (float, optional): default download period in second of the connection. 
+                                      See :meth:`Downloader.new_token`
+        """
+        return AsyncDownloaderConnection(self, self.new_token(period))
+    
+    def disconnect(self, token: tuple) -> None:
+        super().disconnect(token)
+        for t, future in list(self._waiters):
+            if t == token and not future.done():
+                future.cancel()
+        self._waiters = [(t, f) for t, f in self._waiters if t != token]
+    
+    def next_update(self, token: Optional[tuple] = None) -> asyncio.Future:
+        """ Return a future resolved with the data after the next download 
+        
+        If the download failed the future raises the exception. 
+        
+        Args:
+            token (optional): a connection token. If given the future is resolved at the next 
+                download refreshing this connection (relevant for multi-rate connections)
+        """
+        future = asyncio.get_event_loop().create_future()
+        self._waiters.append((token, future))
+        return future
+    
+    def _notify(self, tokens, error=None):
+        if not self._waiters:
+            return 
+        waiters = []
+        for token, future in self._waiters:
+            if future.done():
+                continue 
+            if token is None or tokens is None or token in tokens:
+                if error is None:
+                    future.set_result(self._data)
+                else:
+                    future.set_exception(error)
+            else:
+                waiters.append((token, future))
+        self._waiters = waiters
+    
+    async def adownload(self) -> None:
+        """ coroutine counterpart of :meth:`Downloader.download` """
+        await self._adownload(None)
+    
+    async def _adownload(self, base_period):
+        plan = self._download_plan(base_period)
+        if plan is None:
+            return 
+        due, reader, datalinks, callbacks, tokens = plan
+        try:
+            await self._aread_and_dispatch(reader, datalinks, callbacks, tokens)
+        finally:
+            self._schedule_done(due)
+    
+    async def _aread_and_dispatch(self, reader, datalinks, callbacks, tokens):
+        self._last_reader = reader 
+        tic = time.perf_counter()
+        try:
+            await self._adownload_all(reader, datalinks, callbacks, tokens)
+        finally:
+            if self._metrics is not None:
+                self._metrics.cycle.add(time.perf_counter()-tic)
+    
+    async def _arun_failure_callbacks(self, error):
+        tic = time.perf_counter()
+        for func in list(self._failure_callbacks):
+            await _call(func, error)
+        if self._metrics is not None:
+            self._metrics.failure_callbacks.add(time.perf_counter()-tic)
+    
+    async def _adownload_all(self, reader, datalinks, callbacks, tokens):
+        errors = {} if self._isolate_failures else None 
+        cycle, since = new_cycle(), time.time()
+        tic = time.perf_counter()
+        try:
+            await reader.aread(self._data, errors)
+        except Exception as e:
+            self._record(cycle, reader, since, tic)
+            self._notify(tokens, e)
+            if not self._failure_callbacks:
+                raise e 
+            self._did_failed_flag = True
+            await self._arun_failure_callbacks(e)
+            return 
+        
+        self._record(cycle, reader, since, tic)
+        if errors is not None:
+            self._errors = errors 
+            if errors:
+                self._did_failed_flag = True
+                await self._arun_failure_callbacks(PartialDownloadError(errors))
+        
+        self._download_datalinks(datalinks)
+        self._publish_snapshot()
+        
+        if not errors and self._did_failed_flag:
+            self._did_failed_flag = False
+            await self._arun_failure_callbacks(None)
+        
+        self._notify(tokens)
+        tic = time.perf_counter()
+        for func in list(callbacks):
+            await _call(func)
+        if self._metrics is not None:
+            self._metrics.callbacks.add(time.perf_counter()-tic)
+    
+    async def arun(self, 
+            period: float =1.0, 
+            stop_signal: Callable =lambda : False, 
+            catchup: Union[str, CATCHUP] = CATCHUP.SKIP
+        ) -> None:
+        """ coroutine running the download indefinitely or when stop_signal return True 
+        
+        Args:
+            period (float, optional): period between downloads in second. This is the period of 
+                nodes, datalinks and connections without their own period 
+            stop_signal (callable, optional): a function returning True to stop the loop or False to continue
+            catchup (str, :class:`CATCHUP`, optional): policy when a download is late of one period 
+                or more: "skip" (default), "burst" or "stretch"
+        """
+        self._catchup = CATCHUP(catchup)
+        self._schedulers.clear()
+        scheduler = self._schedulers[None] = DeadlineScheduler(period, self._catchup)
+        try:
+            while not stop_signal():
+                if self._schedule:
+                    await self._adownload(period)
+                else:
+                    now = time.monotonic()
+                    if scheduler.is_due(now):
+                        scheduler.advance(now)
+                        try:
+                            await self._adownload(None)
+                        finally:
+                            scheduler.done()
+                await asyncio.sleep( self._time_to_deadline() )
+        except StopDownloader: 
+            return 
+    
+    def start(self, 
+            period: float =1.0, 
+            stop_signal: Callable =lambda : False, 
+            catchup: Union[str, CATCHUP] = CATCHUP.SKIP
+        ) -> asyncio.Task:
+        """ Start the download loop (:meth:`arun`) as a task of the running loop  
+        
+        Returns:
+            task (asyncio.Task): the running task 
+        """
+        if self._task is not None and not self._task.done():
+            raise RuntimeError("AsyncDownloader is already running")
+        self._task = asyncio.ensure_future(self.arun(period, stop_signal, catchup))
+        return self._task
+    
+    async def stop(self) -> None:
+        """ Stop the download task started by :meth:`start` """
+        task, self._task = self._task, None 
+        if task is None:
+            return 
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass 
+        for _, future in self._waiters:
+            future.cancel()
+        self._waiters = []
+    
+    @property
+    def task(self) -> Optional[asyncio.Task]:
+        """ running task or None """
+        return self._task
 
 
 def reset(nodes: Iterable):
@@ -734,7 +1886,11 @@ def reset(nodes: Iterable):
     for n in nodes:
         n.reset()
 
-def download(nodes, data: Optional[Dict] = None) -> Union[list,None]:
+def download(nodes, 
+        data: Optional[Dict] = None, 
+        executor: Optional[Executor] = None, 
+        single_flight: Optional[Union[SingleFlight, bool]] = None
+    ) -> Union[list,None]:
     """ read node values from remote servers in one call per server    
 
     Args:
@@ -745,6 +1901,13 @@ def download(nodes, data: Optional[Dict] = None) -> Union[list,None]:
              This is mostlikely a dictionary, must define a __setitem__ method
              If given the function return None and update data in place. 
              If data is None the function return a list of values 
+        
+        executor (Executor, optional): 
+             If given, servers (sid) are read concurrently inside the executor 
+        
+        single_flight (SingleFlight, bool, optional):
+             If given, reads of the same nodes done at the same time by other threads are merged 
+             in one server call. See :class:`SingleFlight`
              
         
     Returns:
@@ -777,10 +1940,32 @@ def download(nodes, data: Optional[Dict] = None) -> Union[list,None]:
     if data is None:
         data = {}
         nodes = tuple(nodes) # in case this is a generator  
-        NodesReader(nodes).read(data)
+        get_read_plan(nodes, executor, single_flight).read(data)
         return [data[n] for n in nodes]
     else:    
-        NodesReader(nodes).read(data)
+        get_read_plan(nodes, executor, single_flight).read(data)
         return None
 
 
+
+
+async def download_async(nodes, data: Optional[Dict] = None, executor: Optional[Executor] = None) -> Union[list,None]:
+    """ coroutine counterpart of :func:`download` 
+    
+    Servers (sid) are read concurrently, collectors without native ``aread`` coroutine are 
+    executed in the executor (or the loop default executor). 
+
+    Example:
+    
+    ::
+     
+        pos, error = await download_async([mgr.motor1.stat.pos_actual, mgr.motor1.stat.pos_error])
+    """
+    if data is None:
+        data = {}
+        nodes = tuple(nodes) # in case this is a generator  
+        await get_read_plan(nodes, executor).aread(data)
+        return [data[n] for n in nodes]
+    else:    
+        await get_read_plan(nodes, executor).aread(data)
+        return None
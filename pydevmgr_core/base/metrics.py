@@ -0,0 +1,157 @@
+import sys
+import math
+import threading
+from collections import deque
+
+from typing import Any, Dict, List, Optional, TextIO
+
+
+class RollingHistogram:
+    """ Distribution of the last ``size`` samples of a measure (e.g. a duration in second)
+
+    Adding a sample is O(1), statistics are computed when queried.
+
+    Args:
+        size (int, optional): number of samples kept (default 1000)
+    """
+    def __init__(self, size: int = 1000):
+        self._samples = deque(maxlen=size)
+        self.total_count = 0
+
+    def add(self, value: float) -> None:
+        """ add one sample """
+        self._samples.append(value)
+        self.total_count += 1
+
+    def clear(self) -> None:
+        self._samples.clear()
+        self.total_count = 0
+
+    @property
+    def count(self) -> int:
+        """ number of samples inside the rolling window """
+        return len(self._samples)
+
+    @property
+    def last(self) -> float:
+        return self._samples[-1] if self._samples else math.nan
+
+    @property
+    def mean(self) -> float:
+        samples = list(self._samples)
+        return sum(samples)/len(samples) if samples else math.nan
+
+    @property
+    def min(self) -> float:
+        return min(self._samples) if self._samples else math.nan
+
+    @property
+    def max(self) -> float:
+        return max(self._samples) if self._samples else math.nan
+
+    def percentile(self, q: float) -> float:
+        """ q-th percentile (0 to 100) of the samples, nearest rank method """
+        samples = sorted(self._samples)
+        if not samples:
+            return math.nan
+        i = max(int(math.ceil(q/100.0*len(samples)))-1, 0)
+        return samples[min(i, len(samples)-1)]
+
+    def histogram(self, bins: List[float]) -> List[int]:
+        """ Number of samples inside each bin [bins[i], bins[i+1][
+
+        Samples outside the bins are ignored
+        """
+        counts = [0]*(len(bins)-1)
+        for value in list(self._samples):
+            for i in range(len(bins)-1):
+                if bins[i] <= value < bins[i+1]:
+                    counts[i] += 1
+                    break
+        return counts
+
+    def summary(self) -> Dict[str, float]:
+        """ dictionary of count, last, mean, min, p50, p90, p99 and max """
+        return dict(
+            count = self.count,
+            last = self.last,
+            mean = self.mean,
+            min = self.min,
+            p50 = self.percentile(50),
+            p90 = self.percentile(90),
+            p99 = self.percentile(99),
+            max = self.max
+        )
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} count={self.count} mean={self.mean:.6f} max={self.max:.6f}>"
+
+
+class DownloaderMetrics:
+    """ Timing metrics of a :class:`Downloader`, durations are in second
+
+    Histograms:
+        cycle : total download cycle time
+        read : time of the node reading (all servers and aliases)
+        sids[sid] : server round-trip time of each sid
+        aliases : time spent in alias evaluation
+        datalinks : time spent to feed the datalinks
+        callbacks : time spent in the callbacks (submission time if a callback executor is used)
+        failure_callbacks : time spent in failure callbacks
+
+    Args:
+        size (int, optional): number of samples kept in each histogram
+    """
+    def __init__(self, size: int = 1000):
+        self._size = size
+        self._lock = threading.Lock()
+        self.cycle = RollingHistogram(size)
+        self.read = RollingHistogram(size)
+        self.aliases = RollingHistogram(size)
+        self.datalinks = RollingHistogram(size)
+        self.callbacks = RollingHistogram(size)
+        self.failure_callbacks = RollingHistogram(size)
+        self.sids = {}
+        self.nodes_per_sid = {}
+
+    def add_sid(self, sid: Any, duration: float) -> None:
+        try:
+            histogram = self.sids[sid]
+        except KeyError:
+            with self._lock:
+                histogram = self.sids.setdefault(sid, RollingHistogram(self._size))
+        histogram.add(duration)
+
+    def reset(self) -> None:
+        """ clear all histograms """
+        for histogram in (self.cycle, self.read, self.aliases, self.datalinks,
+                          self.callbacks, self.failure_callbacks):
+            histogram.clear()
+        with self._lock:
+            self.sids = {}
+
+    def summary(self) -> Dict[str, Any]:
+        """ Return a dictionary of histogram summaries (see :meth:`RollingHistogram.summary`) """
+        return dict(
+            cycle = self.cycle.summary(),
+            read = self.read.summary(),
+            aliases = self.aliases.summary(),
+            datalinks = self.datalinks.summary(),
+            callbacks = self.callbacks.summary(),
+            failure_callbacks = self.failure_callbacks.summary(),
+            sids = {sid:h.summary() for sid, h in list(self.sids.items())},
+            nodes_per_sid = dict(self.nodes_per_sid)
+        )
+
+    def dump(self, file: Optional[TextIO] = None) -> None:
+        """ Write a table of the metrics (in milliseconds) in file (default is stdout) """
+        if file is None:
+            file = sys.stdout
+        rows = [(name, getattr(self, name)) for name in
+                ("cycle", "read", "aliases", "datalinks", "callbacks", "failure_callbacks")]
+        rows.extend( (f"sid {sid!r} ({self.nodes_per_sid.get(sid, 0)} nodes)", h) for sid, h in list(self.sids.items()) )
+
+        file.write(f"{'':<30} {'count':>7} {'mean':>9} {'p50':>9} {'p90':>9} {'p99':>9} {'max':>9}\n")
+        for name, h in rows:
+            s = h.summary()
+            file.write(f"{name:<30} {s['count']:>7} " + " ".join(f"{s[k]*1000:>9.3f}" for k in ('mean', 'p50', 'p90', 'p99', 'max')) + "\n")
@@ -5,8 +5,9 @@ except ModuleNotFoundError:
 
 from .datamodel import DataLink 
 from .download import Downloader
+from .scheduler import DeadlineScheduler, CATCHUP
 
-from typing import Any, Optional, Callable
+from typing import Any, Optional, Callable, Union
 import math 
 import time
 import traceback
@@ -235,7 +236,12 @@ class MonitorRunner:
         
         self.data = data
         self._is_alive_flag = False 
+        self._scheduler = None
     
+    @property
+    def scheduler(self) -> Optional[DeadlineScheduler]:
+        """ The :class:`DeadlineScheduler` of the last run, it holds the timing statistics """
+        return self._scheduler
 
     def _download_and_update_with_failure(self, data_link: DataLink, download_failed_pointer):
                
@@ -276,8 +282,22 @@ class MonitorRunner:
     def run(self, 
           period: float = 1, 
           stop_signal: Callable = lambda: False , 
-          link_failure: bool = True
+          link_failure: bool = True, 
+          catchup: Union[str, CATCHUP] = CATCHUP.SKIP
         ) -> None:
+        """ run the monitor until stop_signal return True or the monitor is stopped 
+        
+        Cycles are scheduled on deadlines of the monotonic clock, see :class:`DeadlineScheduler`
+        
+        Args:
+            period (float, optional): cycle period in second 
+            stop_signal (callable, optional): a function returning True to stop the loop 
+            link_failure (bool, optional): if True download failures are sent to monitor.update_failure 
+            catchup (str, :class:`CATCHUP`, optional): policy when a cycle is late of one period or more: 
+                "skip" (default), "burst" or "stretch"
+        """
+        scheduler = DeadlineScheduler(period, catchup)
+        self._scheduler = scheduler
 
         data_link = DataLink( self.device, self.data )
         data_link.download()
@@ -294,8 +314,11 @@ class MonitorRunner:
         
         self._is_alive_flag = True
         while not stop_signal():
-                            
-            tic = time.time()
+            now = time.monotonic()
+            if not scheduler.is_due(now):
+                time.sleep( scheduler.time_to_deadline(now) )
+                continue 
+            scheduler.advance(now)
                 
             try:
                 download_and_update(data_link, download_failed_pointer)
@@ -307,8 +330,8 @@ class MonitorRunner:
                 self._end_with_error(er)
                 return 
             
-            toc = time.time()
-            time.sleep( max(period-(toc-tic), 1e-6) ) # This avoid negative sleepp time
+            scheduler.done()
+            time.sleep( scheduler.time_to_deadline() ) 
         
         self._end_without_error()
 
@@ -320,20 +343,22 @@ class MonitorRunner:
     def target_function(self, 
             period: float = 1.0, 
             stop_signal: Callable = lambda: False, 
-            link_failure: bool = True
+            link_failure: bool = True, 
+            catchup: Union[str, CATCHUP] = CATCHUP.SKIP
         ) -> Callable:
 
         def target_function():
-            return self.run(period, stop_signal=stop_signal, link_failure=link_failure)
+            return self.run(period, stop_signal=stop_signal, link_failure=link_failure, catchup=catchup)
         return target_function
 
 
     def thread(self, 
           period: float = 1.0, 
           stop_signal: Callable = lambda: False, 
-          link_failure: bool = True
+          link_failure: bool = True, 
+          catchup: Union[str, CATCHUP] = CATCHUP.SKIP
         ) -> Callable:
-        return Thread( target = self.target_function(period, stop_signal, link_failure=link_failure) )
+        return Thread( target = self.target_function(period, stop_signal, link_failure=link_failure, catchup=catchup) )
         
     def end(self):
         return self.monitor.end(self.device, self.data, None)
@@ -6,7 +6,12 @@ from .parser_engine import parser,  AnyParserConfig, BaseParser
 from . import io 
 
 import weakref
+import asyncio
+import threading
+import time
+from collections import OrderedDict
 from inspect import signature , _empty
+from concurrent.futures import Executor, wait as _wait_futures
 
 try:
     from pydantic.v1 import create_model,  validator
@@ -29,6 +34,7 @@ class BaseNodeConfig(_BaseObject.Config):
     parser: Optional[Any] = None 
     description: str = ""
     unit: str = ""
+    max_age: Optional[float] = None 
     
     @validator('parser')
     def _parser_validator(cls, parsers):
@@ -36,12 +42,26 @@ class BaseNodeConfig(_BaseObject.Config):
             return parser(parsers).config
     
         
+def _has_fget_many(cls) -> bool:
+    # True if the node class implements its own fget_many class method 
+    func = getattr(getattr(cls, 'fget_many', None), '__func__', None)
+    return func is not None and func is not BaseNode.fget_many.__func__
+
+def _has_fset_many(cls) -> bool:
+    # True if the node class implements its own fset_many class method 
+    func = getattr(getattr(cls, 'fset_many', None), '__func__', None)
+    return func is not None and func is not BaseNode.fset_many.__func__
+
+
 class BaseReadCollector:
     """ Object used to collect nodes values from the same server in one roundtrip 
     
     It has two methods :
      .add(node) to add a node to the queue
      .read(data) to read nodes value inside a dictionary (data) 
+    
+    Nodes are grouped by class. Classes implementing the ``fget_many`` class method are read 
+    with one call per class, the other nodes are red one after the other with ``node.get()``
     """
     ####
     #@ The Read Collector shall collect all nodes having the same sid and read them in one call
@@ -50,14 +70,29 @@ class BaseReadCollector:
     #@ - add : take one argument, the Node. Should add node in the read queue 
     #@ - read : takes a dictionary as arguement, read the nodes and feed the data dictionary where key  
     #@          is the node itself
-    #@ The BaseReadCollector is just a dummy implementation where nodes are red one after the other     
+    #@ - remove (optional) : take one argument, the Node. Remove the node from the read queue. If not 
+    #@          implemented the collector is rebuilt when a node is removed from a NodesReader 
+    #@ The BaseReadCollector is a generic implementation batching nodes per class with fget_many 
     def __init__(self):
         self._nodes = set()
+        self._groups = {} # node class -> {node: None}, dict are used as ordered set 
     def add(self, node):
         self._nodes.add(node)
+        self._groups.setdefault(type(node), {})[node] = None
+    def remove(self, node):
+        self._nodes.discard(node)
+        group = self._groups.get(type(node))
+        if group is not None:
+            group.pop(node, None)
+            if not group:
+                del self._groups[type(node)]
     def read(self, data):
-        for node in self._nodes:
-            data[node] = node.get()
+        for cls, group in self._groups.items():
+            if _has_fget_many(cls):
+                data.update(zip(group, cls.fget_many(list(group))))
+            else:
+                for node in group:
+                    data[node] = node.get()
 
 class BaseWriteCollector:
     """ Object used to write nodes values from the same server in one roundtrip 
@@ -65,6 +100,9 @@ class BaseWriteCollector:
     Its has two methods :
      .add(node, value) to add a node and its associated value to the queue
      .write() to write (upload) nodes values
+    
+    Nodes are grouped by class. Classes implementing the ``fset_many`` class method are written 
+    with one call per class, the other nodes are written one after the other with ``node.set()``
     """
     ####
     #@ The Write Collector shall collect all nodes having the same sid, its value, and write them in one call
@@ -73,17 +111,26 @@ class BaseWriteCollector:
     #@ - add : take two argument, the Node and its value attached. Should add node,value in the write queue 
     #@ - write  : takes no arguement, write the node/value 
     #@ 
-    #@ The BaseWriteCollector is just a dummy implementation where nodes are written one after the other  
+    #@ The BaseWriteCollector is a generic implementation batching nodes per class with fset_many 
     
     def __init__(self):
         self._nodes = {}
+        self._groups = {} # node class -> {node: value}
     
     def add(self, node, value):
         self._nodes[node] = value
+        self._groups.setdefault(type(node), {})[node] = value
     
     def write(self):
-        for node, val  in self._nodes.items():
-            node.set(val)
+        for cls, group in self._groups.items():
+            if _has_fset_many(cls):
+                nodes = list(group)
+                cls.fset_many(nodes, [node.parse(group[node]) for node in nodes])
+                for node in nodes:
+                    node._cache = None 
+            else:
+                for node, val  in group.items():
+                    node.set(val)
 
 class DictReadCollector:
     """ A collector to read from a dictionary instead of getting node from server 
@@ -96,10 +143,17 @@ class DictReadCollector:
         
     def add(self, node):
         self._nodes.add(node)
+    
+    def remove(self, node):
+        self._nodes.discard(node)
         
     def read(self, data):
         for node in self._nodes:
             data[node] = self._data[node.key]
+    
+    async def aread(self, data):
+        # no I/O, no need to go through an executor
+        self.read(data)
 
 class DictWriteCollector:
     """ A collector to write to a dictionary instead of setting node to server 
@@ -116,6 +170,9 @@ class DictWriteCollector:
     def write(self):
         for node, val  in self._nodes.items():
             self._data[node.key] = val
+    
+    async def awrite(self):
+        self.write()
 
 
 
@@ -170,6 +227,11 @@ class BaseNode(_BaseObject):
         - write_collector() : a constructor for a node collector for writting
     
     To implement from BaseNode one need to implement the .fget and .fset method (they are called by .get and .set)
+    
+    If the ``max_age`` configuration parameter (in second) is set, the value returned by .get() and the 
+    :class:`NodesReader` is taken from a cache if it is younger than max_age, the server is then 
+    not called. The cache is a (value, timestamp) pair swapped atomically and can be cleared with 
+    the .invalidate() method. A .set() is invalidating the cache. 
     """
     Config = BaseNodeConfig
     Property = NodeProperty
@@ -178,6 +240,9 @@ class BaseNode(_BaseObject):
     class Data(BaseData):
         value: Any = None    
     _parser = None
+    _cache = None # (value, time, monotonic time) 
+    # A constant node returns always the same value, it is evaluated only once by a NodesReader 
+    _constant = False
     def __init__(self, 
            key: Optional[str] = None, 
            config: Optional[Config] = None,           
@@ -203,6 +268,36 @@ class BaseNode(_BaseObject):
     def parser(self):
         return self._parser
     
+    @property
+    def max_age(self) -> Optional[float]:
+        """ max age of the cached value in second, None if values are not cached """
+        return self._config.max_age
+    
+    @property
+    def cached(self) -> Optional[tuple]:
+        """ (value, timestamp) of the last cached value or None 
+        
+        The cached value is returned even if it is older than max_age 
+        """
+        cache = self._cache 
+        if cache is None:
+            return None 
+        return cache[0], cache[1]
+    
+    def invalidate(self) -> None:
+        """ Clear the cached value, next get will call the server """
+        self._cache = None
+    
+    def _store_cache(self, value) -> None:
+        self._cache = (value, time.time(), time.monotonic())
+    
+    def _fresh_cache(self, now: float) -> Optional[tuple]:
+        # return the cache if younger than max_age 
+        cache = self._cache
+        if cache is not None and (now-cache[2]) < self._config.max_age:
+            return cache 
+        return None
+    
     def parse(self, value):
         """ Parse the value as it is done before being treated by the set method 
         
@@ -230,8 +325,8 @@ class BaseNode(_BaseObject):
             a  ``.add(node)`` method 
             a  ``.read(data)`` method 
         
-        The BaseReadCollector is however gettting the node value one by one. The method has to be 
-        implemented for other Nodes
+        The BaseReadCollector is getting the node values one by one unless the node class implements 
+        the :meth:`fget_many` class method. The method has to be implemented for other Nodes
         """
         return BaseReadCollector()
     
@@ -245,8 +340,8 @@ class BaseNode(_BaseObject):
             a  ``.add(node, value)`` method 
             a  ``.write()`` method 
         
-        The BaseWriteCollector is however setting the node value one by one. The method has to be 
-        implemented for other Nodes
+        The BaseWriteCollector is setting the node values one by one unless the node class implements 
+        the :meth:`fset_many` class method. The method has to be implemented for other Nodes
         """
         return BaseWriteCollector()
             
@@ -256,9 +351,17 @@ class BaseNode(_BaseObject):
         If the optional data dictionary is given data[self] is return otherwise self.fget() is returned
         fget() will fetch the value from a distant server for instance (OPC-UA, Websocket, OLDB, etc ...)
         
+        If max_age is configured, the cached value is returned if still valid. 
         """
         if data is None:
-            return self.fget()
+            if self._config.max_age is None:
+                return self.fget()
+            cache = self._fresh_cache(time.monotonic())
+            if cache is not None:
+                return cache[0]
+            value = self.fget()
+            self._store_cache(value)
+            return value 
         return data[self]
         
     def set(self, value, data=None):
@@ -270,9 +373,31 @@ class BaseNode(_BaseObject):
                 
         if data is None:
             self.fset(value)
+            self._cache = None
         else:
             data[self] = value
     
+    async def aget(self, data: Dict =None) -> Any:
+        """ coroutine counterpart of :meth:`get`
+        
+        If data is not given the blocking :meth:`get` is executed in the loop default executor. 
+        Nodes with a native asynchronous client shall overwrite this method. 
+        """
+        if data is None:
+            return await asyncio.get_event_loop().run_in_executor(None, self.get)
+        return data[self]
+    
+    async def aset(self, value, data: Dict =None) -> None:
+        """ coroutine counterpart of :meth:`set`
+        
+        If data is not given the blocking :meth:`set` is executed in the loop default executor. 
+        Nodes with a native asynchronous client shall overwrite this method. 
+        """
+        if data is None:
+            await asyncio.get_event_loop().run_in_executor(None, self.set, value)
+        else:
+            self.set(value, data)
+    
     ### ############################################
     #
     # To be implemented by the inerated class  
@@ -286,6 +411,39 @@ class BaseNode(_BaseObject):
         """ This is the function we need to implement to set real data """
         raise NotImplementedError('fset')
                 
+    @classmethod
+    def fget_many(cls, nodes: List['BaseNode']) -> List[Any]:
+        """ Get the values of several nodes of this class in one call 
+        
+        Nodes are all instances of this class and share the same sid. 
+        This can be implemented to batch the reads on the server without having to write a 
+        collector: the default :class:`BaseReadCollector` is calling it once per node class and sid.
+        The default implementation calls fget on each node. 
+
+        Args:
+            nodes (list): list of nodes  
+        
+        Returns:
+            values (list): list of values in the same order than nodes
+        """
+        return [node.fget() for node in nodes]
+    
+    @classmethod
+    def fset_many(cls, nodes: List['BaseNode'], values: List[Any]) -> None:
+        """ Set the values of several nodes of this class in one call 
+        
+        Nodes are all instances of this class and share the same sid, values are already parsed.
+        This can be implemented to batch the writes on the server without having to write a 
+        collector: the default :class:`BaseWriteCollector` is calling it once per node class and sid.
+        The default implementation calls fset on each node. 
+        
+        Args:
+            nodes (list): list of nodes  
+            values (list): list of parsed values, in the same order than nodes 
+        """
+        for node, value in zip(nodes, values):
+            node.fset(value)
+    
     ### #############################################
     #  Optional reset will be mainly used on NodeAlias with some persistant data  
     def reset(self):
@@ -340,68 +498,669 @@ def node(key: Optional[str] =None):
 def setitem(obj,k,v):
     obj[k] = v
 
+class _Flight:
+    __slots__ = ('nodes', 'done', 'values', 'error')
+    def __init__(self, nodes):
+        self.nodes = nodes
+        self.done = threading.Event()
+        self.values = None
+        self.error = None
+
+class SingleFlight:
+    """ Merge concurrent reads of the same nodes into one server call 
+    
+    When a thread reads a sid while an other thread is already reading a superset of the 
+    same nodes on the same sid, it waits for the in-flight call and takes its result 
+    instead of doing a new round-trip. Callers get the same values (or the same exception). 
+    
+    One SingleFlight object defines a group of readers which can be merged, it is given to 
+    :class:`NodesReader`, :class:`Downloader` or :func:`download` with the ``single_flight`` 
+    argument. ``single_flight=True`` is using ``default_single_flight``.
+    
+    Example:
+    
+    ::
+        
+        flight = SingleFlight()
+        # in thread 1 
+        download([motor.stat.pos_actual, motor.stat.vel_actual], single_flight=flight)
+        # in thread 2, at the same time, the pos_actual value of thread 1 call is used
+        download([motor.stat.pos_actual], single_flight=flight)
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight = {}
+    
+    def read(self, sid, nodes: frozenset, collector, data: dict) -> None:
+        """ read the nodes of one sid with the collector or wait for an in-flight read """
+        with self._lock:
+            flights = self._inflight.setdefault(sid, [])
+            for flight in flights:
+                if nodes <= flight.nodes:
+                    leader = False
+                    break
+            else:
+                flight = _Flight(nodes)
+                flights.append(flight)
+                leader = True
+        
+        if leader:
+            values = {}
+            try:
+                collector.read(values)
+            except BaseException as e:
+                flight.error = e
+            else:
+                flight.values = values 
+            finally:
+                with self._lock:
+                    flights.remove(flight)
+                    if not flights:
+                        self._inflight.pop(sid, None)
+                flight.done.set()
+            if flight.error is not None:
+                raise flight.error
+            data.update(values)
+        else:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            values = flight.values 
+            for node in nodes:
+                data[node] = values[node]
+
+default_single_flight = SingleFlight()
+
+
 class NodesReader:
-    def __init__(self, nodes=tuple()):
+    """ Read a collection of nodes in one call per server (sid) 
+    
+    Args:
+        nodes (iterable): nodes to read, aliases are resolved at the end of the read 
+        executor (Executor, optional): a :class:`concurrent.futures.Executor` (e.g. a ThreadPoolExecutor)
+            If given, each sid collector is read concurrently inside the executor and aliases are 
+            resolved when all collectors have returned. Otherwise collectors are read one after 
+            the other. 
+        single_flight (SingleFlight, bool, optional): If given, concurrent reads (from other threads) 
+            of the same nodes of a sid are merged into one server call, see :class:`SingleFlight`. 
+            True is using the default group shared by all readers. 
+    
+    Attributes:
+        sid_times (dict): sid/(start, end) pairs of the time (time.time()) of the last successful 
+                          server round-trip of each sid. A sid served only from cache is not updated.  
+        sid_perf_times (dict): same as sid_times with time.perf_counter() stamps, to be used for 
+                          durations (not affected by system clock changes) 
+        cache_times (dict): node/timestamp pairs of the nodes with a max_age, timestamp (time.time()) 
+                          of their cached value 
+        alias_time (float): time in second spent to evaluate aliases during the last read 
+    """
+    # If True constants are evaluated at each read instead of once 
+    _refresh_constants = False
+    def __init__(self, nodes=tuple(), 
+            executor: Optional[Executor] = None, 
+            single_flight: Optional[Union['SingleFlight', bool]] = None
+        ):
         self._input_nodes = nodes # need to save to remenber the order
-        self._dispatch, self._aliases = {}, []
+        # aliases is an ordered set (dict) of aliases sorted in a topological order, 
+        # dependencies are always before the aliases using them   
+        self._dispatch, self._aliases = {}, {}
+        self._sid_nodes = {}
+        # reference count of each node: number of add + number of aliases depending on it 
+        self._refs = {}
+        self._sid_keys = {} # frozen sets of sid nodes used by single flight 
+        self._ttl_nodes = {} # nodes with a max_age, per sid 
+        self._constants = {} # ordered set of constant nodes and folded aliases 
+        self._constant_values = None
+        self._alias_order = None
+        self._alias_sids = None
+        self.sid_times = {}
+        self.sid_perf_times = {}
+        self.cache_times = {}
+        self.alias_time = 0.0
+        self.executor = executor
+        if single_flight is True:
+            single_flight = default_single_flight
+        self.single_flight = single_flight or None
         for node in nodes:
             self.add(node) 
             
     def add(self, node):
-        # if no _sid, this ia an alias or a standalone node and should be call 
-        # at the end
+        """ add a node (or an iterable of nodes) to the reader 
+        
+        Aliases and their dependencies are added recursively, each alias is evaluated 
+        only once per read. A ValueError is raised if a circular dependency is found 
+        between aliases. 
         
+        Nodes are reference counted, a node added n times shall be removed n times to be
+        removed from the reader. If an error is raised, the reader is left unchanged. 
+        """
+        journal = [] # nodes registered by this call 
+        try:
+            self._add_many(node, journal)
+        except Exception:
+            for n in reversed(journal):
+                self._unregister(n)
+            raise 
+    
+    def _add_many(self, node, journal):
         # None object are ignored 
         if node is None:
             return 
                 
         if isinstance(node, (tuple, list, set)):
             for n in node:
-                self.add(n)
-         
-        sid = getattr(node, 'sid', None)
-        if sid is None:
-            self._aliases.append( node )
-            for n in getattr(node, "nodes", []):            
-                self.add(n)
-            return         
+                self._add_many(n, journal)
+            return 
+        self._add(node, set(), journal)
+    
+    def remove(self, node):
+        """ remove a node (or an iterable of nodes) previously added 
+        
+        The node, and the alias dependencies not used anymore, are removed when its reference 
+        count drops to zero. Unknown nodes are ignored. 
+        """
+        if node is None:
+            return 
+        if isinstance(node, (tuple, list, set)):
+            for n in node:
+                self.remove(n)
+            return 
+        self._remove(node)
+    
+    def _add(self, node, visiting, journal):
+        if node in visiting:
+            raise ValueError(f"Circular dependency found on node alias {node!r}")
         try:
-            collection = self._dispatch[sid]
+            self._refs[node] += 1
         except KeyError:
-            collection = node.read_collector()
-            self._dispatch[sid] = collection
+            pass 
+        else:
+            journal.append(node)
+            return 
+        
+        # if no _sid, this ia an alias or a standalone node and should be call 
+        # at the end
+        if getattr(node, 'sid', None) is None:
+            visiting.add(node)
+            constant = getattr(node, "_foldable", False)
+            for n in getattr(node, "nodes", []):
+                if n is not None:
+                    self._add(n, visiting, journal)
+                    constant = constant and n in self._constants
+            visiting.discard(node)
+            if constant:
+                # alias depending only on constants is a constant  
+                self._add_constant(node)
+            else:
+                # Added after its dependencies: this is a topological order 
+                self._aliases[node] = None
+                self._alias_order = None
+        elif getattr(node, "_constant", False):
+            self._add_constant(node)
+        else:
+            self._add_node(node)
+        self._refs[node] = 1
+        journal.append(node)
+    
+    def _unregister(self, node):
+        # undo one registration of node, its dependencies are undone separately 
+        count = self._refs[node]
+        if count>1:
+            self._refs[node] = count-1
+            return 
+        del self._refs[node]
+        if node in self._constants:
+            del self._constants[node]
+            self._constant_values = None
+        elif getattr(node, 'sid', None) is None:
+            del self._aliases[node]
+            self._alias_order = None
+        else:
+            self._remove_node(node)
+    
+    def _add_constant(self, node):
+        # constants are resolved once (at next read) in a topological order 
+        self._constants[node] = None
+        self._constant_values = None
+    
+    def _add_node(self, node):
+        sid = node.sid 
+        try:
+            nodes = self._sid_nodes[sid]
+        except KeyError:
+            nodes = self._sid_nodes[sid] = set()
+            # collector is None when all nodes of the sid have a max_age 
+            self._dispatch[sid] = None 
+        nodes.add(node)
+        self._sid_keys.pop(sid, None)
+        
+        if getattr(node, "max_age", None) is not None:
+            # nodes with a max_age are read only when their cache is too old  
+            self._ttl_nodes.setdefault(sid, set()).add(node)
+            return 
+        collection = self._dispatch[sid]
+        if collection is None:
+            collection = self._dispatch[sid] = node.read_collector()
         collection.add(node)
     
+    def _remove(self, node):
+        try:
+            count = self._refs[node]
+        except KeyError:
+            return 
+        if count>1:
+            self._refs[node] = count-1
+            return 
+        del self._refs[node]
+        
+        if node in self._constants:
+            del self._constants[node]
+            self._constant_values = None
+            for n in getattr(node, "nodes", []) if getattr(node, 'sid', None) is None else []:
+                if n is not None:
+                    self._remove(n)
+        elif getattr(node, 'sid', None) is None:
+            del self._aliases[node]
+            self._alias_order = None
+            for n in getattr(node, "nodes", []):
+                if n is not None:
+                    self._remove(n)
+        else:
+            self._remove_node(node)
+    
+    def _remove_node(self, node):
+        sid = node.sid 
+        nodes = self._sid_nodes[sid]
+        nodes.discard(node)
+        self._sid_keys.pop(sid, None)
+        if not nodes:
+            del self._sid_nodes[sid]
+            del self._dispatch[sid]
+            self._ttl_nodes.pop(sid, None)
+            self.cache_times.pop(node, None)
+            return 
+        
+        ttl_nodes = self._ttl_nodes.get(sid, ())
+        if node in ttl_nodes:
+            ttl_nodes.discard(node)
+            self.cache_times.pop(node, None)
+            if not ttl_nodes:
+                del self._ttl_nodes[sid]
+            return 
+        
+        regular_nodes = nodes.difference(ttl_nodes)
+        collection = self._dispatch[sid]
+        if not regular_nodes:
+            self._dispatch[sid] = None
+        elif hasattr(collection, "remove"):
+            collection.remove(node)
+        else:
+            # collector cannot remove node, rebuilt only this sid collector 
+            collection = next(iter(regular_nodes)).read_collector()
+            for n in regular_nodes:
+                collection.add(n)
+            self._dispatch[sid] = collection
+    
     def clear(self):
         self._dispatch.clear()
+        self._sid_nodes.clear()
+        self._sid_keys.clear()
+        self._ttl_nodes.clear()
+        self._constants.clear()
+        self._constant_values = None
+        self._refs.clear()
         self._aliases.clear()
+        self._alias_order = None
+        self.sid_times.clear()
+        self.sid_perf_times.clear()
+        self.cache_times.clear()
     
-    def read(self, data=None):
+    def read(self, data=None, errors: Optional[Dict] = None):
         """ read all node values 
         
         nodes are first grouped by sid and are red in one call is the server allows it 
+        
+        Args:
+            data (dict): dictionary receiving the node/value pairs 
+            errors (dict, optional): If given, each sid is read independently: an exception raised 
+                while reading one sid is stored in ``errors[sid]`` instead of being raised. Nodes of 
+                the failed sids (and the aliases depending on them) are not updated in data. 
+                Likewise an alias raising an error is stored in ``errors[alias]``. 
         """
+        if self._constants:
+            data.update(self._get_constant_values())
         # starts with the UA nodes 
+        if self.executor is not None and len(self._dispatch)>1:
+            self._read_concurrently(data, errors)
+        elif errors is None:
+            for sid, collection in self._dispatch.items(): 
+                self._read_sid(sid, collection, data)
+        else:
+            for sid, collection in self._dispatch.items():
+                try:
+                    self._read_sid_isolated(sid, collection, data)
+                except Exception as e:
+                    errors[sid] = e
+        tic = time.perf_counter()
+        self._read_aliases(data, errors)
+        self.alias_time = time.perf_counter()-tic
+    
+    async def aread(self, data=None, errors: Optional[Dict] = None):
+        """ coroutine counterpart of :meth:`read` 
         
-        # :TODO: At some point, this should be asynchrone 
-        for sid, collection in self._dispatch.items(): 
-            collection.read(data)       
-                
+        All sid collectors are read concurrently. Collectors defining an ``aread(data)`` coroutine 
+        are awaited, the others have their blocking ``read(data)`` method executed inside the 
+        executor (the loop default executor if the reader has none).
+        """
+        if self._constants:
+            data.update(self._get_constant_values())
+        loop = asyncio.get_event_loop()
+        if errors is None:
+            await asyncio.gather(*(
+                self._aread_sid(loop, sid, c, data) for sid, c in self._dispatch.items()
+            ))
+        else:
+            # each sid is read in its own dictionary, merged in data only if the read succeed
+            sid_data = {sid:{} for sid in self._dispatch}
+            results = await asyncio.gather(*(
+                self._aread_sid(loop, sid, c, sid_data[sid]) for sid, c in self._dispatch.items()
+            ), return_exceptions=True)
+            for sid, result in zip(self._dispatch, results):
+                if isinstance(result, Exception):
+                    errors[sid] = result
+                else:
+                    data.update(sid_data[sid])
+        tic = time.perf_counter()
+        self._read_aliases(data, errors)
+        self.alias_time = time.perf_counter()-tic
+    
+    def _read_sid_isolated(self, sid, collection, data):
+        # a failing sid must not write a part of its nodes, values are merged on success only 
+        values = {}
+        self._read_sid(sid, collection, values)
+        data.update(values)
+    
+    def _read_sid(self, sid, collection, data):
+        start, tic = time.time(), time.perf_counter()
+        if self._read_sid_nodes(sid, collection, data):
+            self.sid_perf_times[sid] = (tic, time.perf_counter())
+            self.sid_times[sid] = (start, time.time())
+    
+    def _read_sid_nodes(self, sid, collection, data):
+        # return True if the server has been called, False if all values come from cache 
+        ttl_nodes = self._ttl_nodes.get(sid)
+        if ttl_nodes and self._read_ttl_nodes(sid, ttl_nodes, data):
+            return True
+        if collection is None:
+            return False
+        
+        if self.single_flight is None:
+            collection.read(data)
+            return True
+        try:
+            key = self._sid_keys[sid]
+        except KeyError:
+            key = self._sid_keys[sid] = frozenset(self._sid_nodes[sid].difference(self._ttl_nodes.get(sid, ())))
+        self.single_flight.read(sid, key, collection, data)
+        return True
+    
+    def _read_ttl_nodes(self, sid, ttl_nodes, data):
+        # Cached values are used when fresh. If some are too old, they are read in the same 
+        # server call than the other nodes of the sid with a temporary collector
+        # return True if the sid has been read  
+        now = time.monotonic()
+        due = []
+        cache_times = self.cache_times
+        for node in ttl_nodes:
+            cache = node._fresh_cache(now)
+            if cache is None:
+                due.append(node)
+            else:
+                data[node] = cache[0]
+                cache_times[node] = cache[1]
+        if not due:
+            return False
+        
+        collection = due[0].read_collector()
+        for node in self._sid_nodes[sid].difference(ttl_nodes):
+            collection.add(node)
+        for node in due:
+            collection.add(node)
+        collection.read(data)
+        for node in due:
+            node._store_cache(data[node])
+            cache_times[node] = node._cache[1]
+        return True
+    
+    def resolve_constants(self) -> None:
+        """ force constant nodes (and aliases depending only on constants) to be resolved again 
+        
+        Constant nodes (e.g. :class:`pydevmgr_core.nodes.Static`) are evaluated only at the first read, 
+        a change of their configuration is seen only after this call. 
+        """
+        self._constant_values = None
+    
+    def _get_constant_values(self):
+        values = self._constant_values
+        if values is None or self._refresh_constants:
+            values = {}
+            for node in self._constants: # dependencies are first 
+                if getattr(node, 'sid', None) is None:
+                    values[node] = node.get(values)
+                else:
+                    values[node] = node.get()
+            self._constant_values = values
+        return values
+    
+    async def _aread_sid(self, loop, sid, collection, data):
+        if sid in self._ttl_nodes or self.single_flight is not None:
+            return await loop.run_in_executor(self.executor, self._read_sid, sid, collection, data)
+        start, tic = time.time(), time.perf_counter()
+        await _collector_aread(loop, self.executor, collection, data)
+        self.sid_perf_times[sid] = (tic, time.perf_counter())
+        self.sid_times[sid] = (start, time.time())
+    
+    def sid_counts(self) -> Dict[Any, int]:
+        """ Return sid/number of nodes pairs """
+        return {sid:len(nodes) for sid, nodes in self._sid_nodes.items()}
+    
+    def stale_nodes(self, sids) -> set:
+        """ Return the set of nodes which depend on the given sids 
+        
+        This includes the nodes of these sids and all the aliases depending on them. sids can also 
+        contain aliases (which failed to be evaluated), they are stale with their dependent aliases.
+        """
+        sids = set(sids)
+        stale = set()
+        for sid in sids:
+            stale.update(self._sid_nodes.get(sid, ()))
+        for alias, alias_sids in self._get_alias_sids().items(): # dependencies are first 
+            if alias in sids or not sids.isdisjoint(alias_sids) or not stale.isdisjoint(getattr(alias, "nodes", ())):
+                stale.add(alias)
+        return stale 
+    
+    def _get_alias_order(self):
+        alias_order = self._alias_order
+        if alias_order is None:
+            alias_order = self._alias_order = tuple(self._aliases)
+            self._alias_sids = None
+        return alias_order
+    
+    def _get_alias_sids(self):
+        # sids on which each alias depend, recursively 
+        alias_order = self._get_alias_order()
+        alias_sids = self._alias_sids
+        if alias_sids is None:
+            alias_sids = {}
+            for alias in alias_order: # dependencies are first 
+                sids = set()
+                for n in getattr(alias, "nodes", []):
+                    if n is None or n in self._constants: continue
+                    sid = getattr(n, 'sid', None)
+                    if sid is None:
+                        sids.update(alias_sids.get(n, ()))
+                    else:
+                        sids.add(sid)
+                alias_sids[alias] = frozenset(sids)
+            self._alias_sids = alias_sids
+        return alias_sids
+    
+    def _read_aliases(self, data, errors=None):
         # aliases are treated at the end, data should have all necessary real nodes for 
-        # the alias 
-        # We need to start from the last as Aliases at with lower index can depend 
-        # of aliases with higher index
-        aliases = self._aliases
-        flags = [False]*len(aliases)
-        for i, alias in reversed(list(enumerate(aliases))):
-            if not flags[i]: 
+        # the alias. Aliases are sorted so dependencies are evaluated first
+        if errors is None:
+            for alias in self._get_alias_order():
                 data[alias] = alias.get(data)                       
-                flags[i]= True
+            return 
+        # aliases depending on a failed sid or alias are not evaluated, an alias raising an 
+        # error is recorded in errors 
+        alias_sids = self._get_alias_sids()
+        failed_sids = set(errors)
+        failed = set()
+        for alias in self._get_alias_order():
+            if not failed_sids.isdisjoint(alias_sids[alias]) or not failed.isdisjoint(getattr(alias, "nodes", ())):
+                failed.add(alias)
+                continue 
+            try:
+                data[alias] = alias.get(data)
+            except Exception as e:
+                errors[alias] = e
+                failed.add(alias)
+    
+    def _read_concurrently(self, data, errors=None):
+        # one collector per sid is submitted, each collector feeds its own nodes 
+        # inside data. We wait for all of them before raising any error so no 
+        # collector is still writing in data when read returns  
+        read_sid = self._read_sid if errors is None else self._read_sid_isolated
+        futures = {sid:self.executor.submit(read_sid, sid, c, data) for sid, c in self._dispatch.items()}
+        _wait_futures(futures.values())
+        for sid, future in futures.items():
+            if errors is None:
+                future.result() # raise the first error if any 
+            else:
+                e = future.exception()
+                if e is not None:
+                    errors[sid] = e
+
+
+class ReadPlan(NodesReader):
+    """ A frozen :class:`NodesReader` made to be read several times 
+    
+    The sid grouping (one collector per sid) and the alias evaluation order are computed 
+    once at creation. Nodes cannot be added to a ReadPlan. Contrary to a :class:`NodesReader`, 
+    constant nodes are evaluated at each read (without server call). 
+    
+    Plans are used internally by :func:`download` and the node aliases get method through 
+    :func:`get_read_plan` which keep a per thread LRU cache of plans keyed by the node tuple. 
+    A plan shall not be read by several threads at the same time. 
+    
+    Args:
+        nodes (iterable): nodes to read 
+        executor (Executor, optional): see :class:`NodesReader`
+        single_flight (SingleFlight, bool, optional): see :class:`NodesReader`
+    """
+    _frozen = False
+    # plans are shared, constants are looked up at each read so they are never stale 
+    _refresh_constants = True
+    def __init__(self, nodes=tuple(), 
+            executor: Optional[Executor] = None, 
+            single_flight: Optional[Union[SingleFlight, bool]] = None
+        ):
+        super().__init__(tuple(nodes), executor=executor, single_flight=single_flight)
+        self._alias_order = tuple(self._aliases)
+        self._frozen = True
+    
+    @property
+    def nodes(self) -> tuple:
+        return self._input_nodes
+    
+    def add(self, node):
+        if self._frozen:
+            raise RuntimeError("ReadPlan is frozen, build a new one to read other nodes")
+        super().add(node)
+    
+    def remove(self, node):
+        raise RuntimeError("ReadPlan is frozen, build a new one to read other nodes")
+    
+    def clear(self):
+        raise RuntimeError("ReadPlan is frozen and cannot be cleared")
+
+
+READ_PLAN_CACHE_SIZE = 16
+# incremented by clear_read_plans, plans of an older generation are rebuilt 
+_read_plans_generation = 0
+_read_plans_lock = threading.Lock()
+
+def get_read_plan(nodes, 
+        executor: Optional[Executor] = None, 
+        single_flight: Optional[Union[SingleFlight, bool]] = None
+    ) -> ReadPlan:
+    """ Return a cached :class:`ReadPlan` for the given nodes 
+    
+    Plans are cached on the first node of the tuple in a LRU of size READ_PLAN_CACHE_SIZE keyed by 
+    the tuple of nodes (and the executor and single_flight options): the cache does not keep the 
+    nodes alive, plans are released with their first node. 
+    Note that the order matter, ``(n1,n2)`` and ``(n2,n1)`` are two different plans.
+    
+    A plan is not thread safe (collectors and sid_times are shared by its reads), plans are 
+    therefore cached per thread. 
+    """
+    nodes = tuple(nodes)
+    key = (nodes, executor, single_flight, threading.get_ident())
+    with _read_plans_lock:
+        try:
+            plans = vars(nodes[0]).setdefault("_read_plans", OrderedDict())
+            generation, plan = plans[key]
+        except KeyError:
+            pass 
+        except (IndexError, TypeError): # no nodes, no __dict__ or unhashable (e.g. nested list of nodes) 
+            return ReadPlan(nodes, executor, single_flight)
+        else:
+            if generation == _read_plans_generation:
+                plans.move_to_end(key)
+                return plan 
+        generation = _read_plans_generation
+    
+    plan = ReadPlan(nodes, executor, single_flight)
+    with _read_plans_lock:
+        plans[key] = (generation, plan)
+        while len(plans)>READ_PLAN_CACHE_SIZE:
+            plans.popitem(last=False)
+    return plan 
+
+def clear_read_plans(node=None) -> None:
+    """ Invalidate cached read plans 
+    
+    Args:
+        node (BaseNode, optional): a node of the plans to invalidate. Rebuilding a plan is cheap, 
+                                   all plans are invalidated anyway. 
+    
+    This shall be called when nodes are rebuilt (e.g. new communication object). 
+    """
+    global _read_plans_generation
+    with _read_plans_lock:
+        _read_plans_generation += 1
+
+
+def _collector_aread(loop, executor, collector, data):
+    try:
+        aread = collector.aread
+    except AttributeError:
+        return loop.run_in_executor(executor, collector.read, data)
+    return aread(data)
+
+def _collector_awrite(loop, executor, collector):
+    try:
+        awrite = collector.awrite
+    except AttributeError:
+        return loop.run_in_executor(executor, collector.write)
+    return awrite()
 
 class NodesWriter:
     def __init__(self, node_values):
         
         self._dispatch = {}
+        self._written_ttl_nodes = []
         
         # start with aliases, returned values are set inside 
         # the node_values dictionary
@@ -428,11 +1187,30 @@ class NodesWriter:
             self._dispatch[node.sid] = collection
         
         collection.add(node, value)
+        if getattr(node, "max_age", None) is not None:
+            self._written_ttl_nodes.append(node)
+    
+    def _invalidate(self):
+        # a written node must be read again from server
+        for node in self._written_ttl_nodes:
+            node.invalidate()
         
     def write(self) -> None:                
-        # :TODO: At some point, this should be asynchrone 
         for collection in  self._dispatch.values():
             collection.write()
+        self._invalidate()
+    
+    async def awrite(self) -> None:
+        """ coroutine counterpart of :meth:`write`
+        
+        All sid collectors are written concurrently, collectors without an ``awrite()`` coroutine 
+        are executed in the loop default executor. 
+        """
+        loop = asyncio.get_event_loop()
+        await asyncio.gather(*(
+            _collector_awrite(loop, None, c) for c in self._dispatch.values()
+        ))
+        self._invalidate()
 
 
 def new_node(type_, *args, **kwargs):
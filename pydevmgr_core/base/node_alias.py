@@ -1,4 +1,4 @@
-from .node import BaseNode, NodesReader, NodesWriter
+from .node import BaseNode, NodesReader, NodesWriter, get_read_plan
 from .base import kjoin, _BaseObject, new_key, path 
 from typing import Union, List, Optional, Any, Dict, Callable
 try:
@@ -40,6 +40,10 @@ class NodeAliasProperty(BaseNode.Property):
 class BaseNodeAlias(BaseNode):
     _n_nodes_required = None
     _nodes_is_scalar = False
+    # If True the alias is considered as constant when all its input nodes are constant. 
+    # Opt-in: only to be set on aliases which are a pure function of their inputs (e.g. Formula), 
+    # an alias may have an internal state or read something else (time, counter, ...)
+    _foldable = False
     def __init__(self, 
           key: Optional[str] = None, 
           nodes: Union[List[BaseNode], BaseNode] = None,
@@ -86,7 +90,7 @@ class BaseNodeAlias(BaseNode):
         """ get the node alias value from server or from data dictionary if given """
         if data is None:
             _n_data = {}
-            NodesReader(self._nodes).read(_n_data)
+            get_read_plan(self._nodes).read(_n_data)
             values = [_n_data[n] for n in self._nodes]
             #values = [n.get() for n in self._nodes]
         else:
@@ -106,6 +110,21 @@ class BaseNodeAlias(BaseNode):
             for n,v in zip(self._nodes, values):
                 data[n] = v        
     
+    async def aget(self, data: Optional[Dict] =None) -> Any:
+        """ coroutine counterpart of :meth:`get` """
+        if data is None:
+            data = {}
+            await get_read_plan(self._nodes).aread(data)
+        return self.get(data)
+    
+    async def aset(self, value: Any, data: Optional[Dict] =None) -> None:
+        """ coroutine counterpart of :meth:`set` """
+        if data is not None:
+            return self.set(value, data)
+        n_data = {}
+        self.set(value, n_data)
+        await NodesWriter(n_data).awrite()
+    
     def fget(self, *args) -> Any:
         # Process all input value (taken from Nodes) and return a computed value 
         return args 
@@ -232,7 +251,6 @@ class NodeAlias(BaseNodeAlias):
     Property = NodeAliasProperty
     
     
-    
     @classmethod
     def prop(cls, name: Optional[str] = None, nodes=None, **kwargs):
         nodes = [] if nodes is None else nodes
@@ -340,6 +358,7 @@ class BaseNodeAlias1(BaseNode):
     """
     # This class does not implement the engine to get the source node from a parent object 
     # one has to implement the _new_source_node(cls, parent, config) class method 
+    _foldable = False
     
     def __init__(self, 
           key: Optional[str] = None, 
@@ -393,7 +412,7 @@ class BaseNodeAlias1(BaseNode):
         """ get the node alias value from server or from data dictionary if given """
         if data is None:
             _n_data = {}
-            NodesReader([self._node]).read(_n_data)
+            get_read_plan((self._node,)).read(_n_data)
             value = _n_data[self._node]
         else:
             value = data[self._node]
@@ -407,6 +426,21 @@ class BaseNodeAlias1(BaseNode):
         else:
             data[self._node] = value
     
+    async def aget(self, data: Optional[Dict] =None) -> Any:
+        """ coroutine counterpart of :meth:`get` """
+        if data is None:
+            data = {}
+            await get_read_plan((self._node,)).aread(data)
+        return self.get(data)
+    
+    async def aset(self, value: Any, data: Optional[Dict] =None) -> None:
+        """ coroutine counterpart of :meth:`set` """
+        if data is not None:
+            return self.set(value, data)
+        n_data = {}
+        self.set(value, n_data)
+        await NodesWriter(n_data).awrite()
+    
     def fget(self,value) -> Any:
         """ Process the input retrieved value and return a new computed on """
         return value
@@ -0,0 +1,161 @@
+import math
+import time
+from enum import Enum
+
+from typing import Optional, Union
+
+
+class CATCHUP(str, Enum):
+    """ Policy of a :class:`DeadlineScheduler` when a cycle started after the next deadline
+
+    - SKIP : the missed cycles are skipped, the scheduler stays on its period grid
+    - BURST : the missed cycles are executed back to back until the scheduler is back on its grid
+    - STRETCH : the grid is shifted, the next deadline is one period after the late cycle
+    """
+    SKIP = "skip"
+    BURST = "burst"
+    STRETCH = "stretch"
+
+
+class DeadlineScheduler:
+    """ Drift-free periodic scheduler based on the monotonic clock
+
+    Deadlines are computed as ``start + n*period`` so the time spent in a cycle and the sleep
+    inaccuracy does not accumulate. The monotonic clock is used: wall-clock adjustments have no
+    effect on the cadence.
+
+    The scheduler keeps per-cycle timing statistics:
+        - lateness : time between the deadline and the actual start of the cycle
+        - jitter : absolute difference between the actual time since the previous cycle and the period
+        - cycle_time : duration of the last cycle (see :meth:`done`)
+        - n_overruns : number of cycles ending after the deadline of the next cycle
+        - n_skipped : number of cycles skipped by the SKIP policy
+
+    Args:
+        period (float): period in second
+        catchup (str, :class:`CATCHUP`, optional): policy when a cycle is late of one period or
+                more. "skip" (default), "burst" or "stretch"
+        clock (callable, optional): monotonic clock function, default is time.monotonic
+
+    Example:
+
+    ::
+
+        scheduler = DeadlineScheduler(0.05) # 20Hz
+        while True:
+            if scheduler.is_due():
+                scheduler.advance()
+                do_something()
+                scheduler.done()
+            time.sleep( scheduler.time_to_deadline() )
+    """
+    def __init__(self,
+          period: float,
+          catchup: Union[str, CATCHUP] = CATCHUP.SKIP,
+          clock = time.monotonic
+        ) -> None:
+        if period <= 0:
+            raise ValueError(f"period must be strictly positive got {period}")
+        self._period = period
+        self._catchup = CATCHUP(catchup)
+        self._clock = clock
+        self._deadline = None
+        self._last_start = None
+        self.reset_stats()
+
+    @property
+    def period(self) -> float:
+        return self._period
+
+    @property
+    def catchup(self) -> CATCHUP:
+        return self._catchup
+
+    @property
+    def deadline(self) -> Optional[float]:
+        """ clock time of the next cycle, None if the scheduler did not start """
+        return self._deadline
+
+    def reset_stats(self) -> None:
+        """ reset the timing statistics """
+        self.n_cycles = 0
+        self.n_overruns = 0
+        self.n_skipped = 0
+        self.cycle_time = 0.0
+        self.lateness = 0.0
+        self.max_lateness = 0.0
+        self.jitter = 0.0
+        self.max_jitter = 0.0
+        self._sum_jitter = 0.0
+        self._n_jitter = 0
+
+    @property
+    def mean_jitter(self) -> float:
+        """ mean of the jitter since the last reset """
+        if not self._n_jitter:
+            return 0.0
+        return self._sum_jitter / self._n_jitter
+
+    def is_due(self, now: Optional[float] = None) -> bool:
+        """ True if the deadline of the next cycle is reached """
+        if self._deadline is None:
+            return True
+        if now is None:
+            now = self._clock()
+        return now >= self._deadline
+
+    def time_to_deadline(self, now: Optional[float] = None) -> float:
+        """ time to wait in second before the next deadline (always >=0) """
+        if self._deadline is None:
+            return 0.0
+        if now is None:
+            now = self._clock()
+        return max(self._deadline-now, 0.0)
+
+    def advance(self, now: Optional[float] = None) -> None:
+        """ Record the start of a cycle at ``now`` and compute the next deadline
+
+        Shall be called at the begining of each cycle
+        """
+        if now is None:
+            now = self._clock()
+        period = self._period
+        deadline = self._deadline
+
+        if deadline is None:
+            deadline = now
+
+        lateness = now-deadline
+        self.lateness = lateness
+        self.max_lateness = max(self.max_lateness, lateness)
+        if self._last_start is not None:
+            jitter = abs(now-self._last_start-period)
+            self.jitter = jitter
+            self.max_jitter = max(self.max_jitter, jitter)
+            self._sum_jitter += jitter
+            self._n_jitter += 1
+        self._last_start = now
+        self.n_cycles += 1
+
+        next_deadline = deadline+period
+        if now >= next_deadline:
+            if self._catchup == CATCHUP.SKIP:
+                n = math.floor(lateness/period)
+                self.n_skipped += n
+                next_deadline = deadline+(n+1)*period
+            elif self._catchup == CATCHUP.STRETCH:
+                next_deadline = now+period
+            # BURST: next deadline is already passed, the next cycle is executed right away
+        self._deadline = next_deadline
+
+    def done(self, now: Optional[float] = None) -> None:
+        """ Record the end of a cycle started by :meth:`advance` 
+        
+        An overrun is counted if the cycle ended after the next deadline 
+        """
+        if now is None:
+            now = self._clock()
+        if self._last_start is not None:
+            self.cycle_time = now-self._last_start
+        if self._deadline is not None and now > self._deadline:
+            self.n_overruns += 1
@@ -140,3 +140,13 @@ def upload(node_dict_or_datalink : Union[Dict[BaseNode,Any], BaseDataLink] ) ->
         The input dictionary has pairs of node/value and not node.key/value      
     """
     NodesWriter(node_dict_or_datalink).write()    
+
+
+async def upload_async(node_values : Dict[BaseNode,Any] ) -> None:
+    """ coroutine counterpart of :func:`upload` 
+    
+    Args:
+        node_values (dict):
+             Dictionary of node/value pairs like  ``{ motor.cfg.velocity : 4.3 }``
+    """
+    await NodesWriter(node_values).awrite()
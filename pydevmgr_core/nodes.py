@@ -75,6 +75,9 @@ class Local(BaseNode):
 @record_class
 class Static(BaseNode):
     """ Static node always returning the configured value and cannot be set 
+    
+    The value is evaluated only once by a :class:`Downloader`, call its ``resolve_constants()`` 
+    method after a change of ``config.value``. 
 
     Config:
         value (any) 
@@ -82,7 +85,9 @@ class Static(BaseNode):
     class Config(BaseNode.Config):    
         type = "Static"
         value: Any
-
+    
+    _constant = True 
+    
     def fget(self):        
         return self.config.value    
 
@@ -239,6 +244,7 @@ class Counter(BaseNode):
 class AllTrue(NodeAlias):
     class Config(NodeAlias.Config):
         type = "AllTrue"
+    _foldable = True
     @staticmethod
     def fget(*nodes):
         return all(nodes)
@@ -248,6 +254,7 @@ All = AllTrue
 class AnyTrue(NodeAlias):
     class Config(NodeAlias.Config):
         type = "AnyTrue"
+    _foldable = True
     @staticmethod
     def fget(*nodes):
         return any(nodes)
@@ -257,6 +264,7 @@ Any = AnyTrue
 class AllFalse(NodeAlias):
     class Config(NodeAlias.Config):
         type = "AllFalse"
+    _foldable = True
     @staticmethod 
     def fget(*nodes):
         return not any(nodes)
@@ -265,6 +273,7 @@ class AllFalse(NodeAlias):
 class AnyFalse(NodeAlias):
     class Config(NodeAlias.Config):
         type = "AnyFalse"
+    _foldable = True
     @staticmethod
     def fget(*nodes):
         return not all(nodes)
@@ -274,6 +283,7 @@ class AnyFalse(NodeAlias):
 @record_class
 class Opposite(NodeAlias1, type="Opposite"):
     """ rNodeAlias1, Return the "not value" of the aliased node """
+    _foldable = True
     @staticmethod
     def fget(value):
         return not value 
@@ -432,6 +442,7 @@ class InsideInterval(NodeAlias1):
         min : Optional[float] = None
         max : Optional[float] = None
             
+    _foldable = True
     def fget(self, value):
         c = self.config
         if c.min is not None and value<c.min:
@@ -457,6 +468,7 @@ class InsideCircle(NodeAlias):
         y0 : float = 0.0 
         r  : float = 1.0
             
+    _foldable = True
     _n_nodes_required = 2    
     
     def fget(self, x, y):
@@ -488,6 +500,7 @@ class PosName(NodeAlias1):
         tol: float = 0.0 
         unknown: str = ""
         
+    _foldable = True
     def fget(self, value: float) -> str:
         c = self.config
         for name, pos in c.poses.items():
@@ -510,6 +523,7 @@ class Formula(NodeAlias):
         formula : str = "-99.99"
         varnames: Optional[Union[List[str],str]] = None  
     
+    _foldable = True
     def __init__(self, *args, **kwargs):                            
         super().__init__(*args, **kwargs)
         if isinstance(self.config.varnames, str):
@@ -549,6 +563,7 @@ class Formula1(NodeAlias1):
         formula : str = "-99.99"
         varname: str = 'x' 
     
+    _foldable = True
     def __init__(self, *args, **kwargs):                            
         super().__init__(*args, **kwargs)
                 
@@ -571,6 +586,7 @@ class Polynom(NodeAlias1):
         polynom: List[float] = [0.0,1.0]
         
     
+    _foldable = True
     def fget(self, value):
         if not self.config.polynom:
             return 0.0
@@ -786,6 +802,7 @@ class Format(NodeAlias):
     class Config(NodeAlias.Config):
         type: str = "Format"
         format: str = "{0}"
+    _foldable = True
     def fget(self, *values):
         return self.config.format.format(*values)
 
@@ -813,6 +830,7 @@ class Bits(NodeAlias, type="Bits"):
         (False, True, False)
         
     """
+    _foldable = True
     def fget(self, *bits):
         out = 0 
         for bit in reversed(bits):
@@ -825,14 +843,17 @@ class Bits(NodeAlias, type="Bits"):
 
 @record_class
 class MaxOf(NodeAlias, type="MaxOf"):
+    _foldable = True
     fget = staticmethod(max)
         
 @record_class
 class MinOf(NodeAlias, type="MinOf"):
+    _foldable = True
     fget = staticmethod(min)
 
 @record_class
 class MeanOf(NodeAlias, type="MeanOf"):
+    _foldable = True
     @staticmethod
     def fget(*values):
         return sum(values)/float(len(values))
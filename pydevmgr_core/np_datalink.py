@@ -0,0 +1,272 @@
+""" Columnar data link of identical devices into a numpy structured array. This module requires numpy """
+
+from .base import BaseNode, AcquisitionTimes, new_cycle, get_read_plan, upload, reset
+from .base.download import BaseDataLink
+from .base.datamodel import get_field_plan, F, MatchError
+import time
+import operator
+import numpy as np
+
+try:
+    from pydantic.v1 import BaseModel
+except ModuleNotFoundError:
+    from pydantic import BaseModel
+
+from typing import Any, Dict, Iterable, List, Optional, Type
+
+__all__ = [
+"ArrayDataLink",
+"ArrayRow",
+]
+
+_DTYPES = {float: np.float64, int: np.int64, bool: np.bool_}
+
+def _field_dtype(field):
+    # numpy dtype of a NodeVar[T] field, object if T is not a numerical type
+    if not field.sub_fields:
+        return object
+    return _DTYPES.get(field.sub_fields[0].type_, object)
+
+def _walk_fields(Model, prefix, out):
+    # collect the column_name -> (kind, field) of a model class recursively
+    for name, kind, getter, strict in get_field_plan(Model):
+        if kind in (F.R, F.RW, F.W):
+            out[prefix+name] = (kind, Model.__fields__[name])
+        elif kind == F.MODEL:
+            _walk_fields(Model.__fields__[name].type_, prefix+name+".", out)
+    return out
+
+def _resolve_nodes(Model, obj, prefix, strick_match, out):
+    # collect the column_name -> node of one input object
+    for name, kind, getter, strict in get_field_plan(Model):
+        if kind is None:
+            # the field configuration does not match, getter is the error
+            if strick_match: raise getter
+            continue
+        if kind == F.STATIC:
+            continue
+        try:
+            val = getter(obj)
+        except MatchError as e:
+            if strick_match and (kind != F.MODEL or strict):
+                raise e
+            continue
+        if kind == F.MODEL:
+            _resolve_nodes(Model.__fields__[name].type_, val, prefix+name+".", strick_match, out)
+        else:
+            out[prefix+name] = val
+    return out
+
+def _getter(nodes):
+    # function data -> tuple of node values in C (itemgetter)
+    if len(nodes) == 1:
+        node, = nodes
+        return lambda data: (data[node],)
+    return operator.itemgetter(*nodes)
+
+
+class ArrayRow:
+    """ Attribute access to one row of an :class:`ArrayDataLink` array
+
+    Sub-models are accessed as nested rows, e.g. ``row.stat.pos`` reads the "stat.pos" column.
+    Setting an attribute writes the array.
+    """
+    __slots__ = ("_link", "_index", "_prefix")
+    def __init__(self, link: "ArrayDataLink", index: int, prefix: str = ""):
+        object.__setattr__(self, "_link", link)
+        object.__setattr__(self, "_index", index)
+        object.__setattr__(self, "_prefix", prefix)
+
+    def __getattr__(self, name):
+        link = self._link
+        column = self._prefix+name
+        if column in link._dtypes:
+            value = link._array[column][self._index]
+            return value if link._dtypes[column] is object else value.item()
+        if column in link._groups:
+            return ArrayRow(link, self._index, column+".")
+        raise AttributeError(f"{name!r} is not a field of {self!r}")
+
+    def __setattr__(self, name, value):
+        column = self._prefix+name
+        if column not in self._link._dtypes:
+            raise AttributeError(f"{name!r} is not a field of {self!r}")
+        self._link._array[column][self._index] = value
+
+    def __dir__(self):
+        prefix = self._prefix
+        n = len(prefix)
+        return sorted({c[n:].split(".")[0] for c in self._link._dtypes if c.startswith(prefix)})
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self._prefix}[{self._index}]>"
+
+
+class ArrayDataLink(BaseDataLink):
+    """ Link a list of identical objects (e.g. devices of the same class) to one numpy structured array
+
+    This is a columnar alternative of one :class:`DataLink` per device: the model class is used as
+    a template, each ``NodeVar`` field (sub-models included) is a column of the array named by its
+    path (e.g. "stat.pos") and each input object is a row. A download fills each column at once from
+    the downloader data.
+
+    Columns of ``NodeVar[float]``, ``NodeVar[int]`` and ``NodeVar[bool]`` are numerical, the others
+    are object columns. Static fields are ignored. A None value (e.g. node not read yet because its
+    server failed) is not written, the cell keeps its previous value. 
+
+    Args:
+        inputs (iterable): input objects, expecting that they all contain the nodes of the model
+        model (Type[BaseModel]): the data model class
+        strick_match (bool, optional): If True (default) a field which cannot be matched to one input
+            raise a ValueError, otherwise the cell keeps its default value
+        dtypes (dict, optional): column name/numpy dtype pairs overwriting the dtypes of the fields
+
+    Example:
+
+    ::
+
+        link = ArrayDataLink(motors, MotorData)
+        downloader = Downloader(link)
+        downloader.download()
+        link.array["stat.pos_actual"] # array of all motor positions
+        link[0].stat.pos_actual
+        link.row(motors[3]).stat.pos_actual
+    """
+    def __init__(self,
+          inputs: Iterable[Any],
+          model: Type[BaseModel],
+          strick_match: bool = True,
+          dtypes: Optional[Dict[str, Any]] = None
+        ) -> None:
+        inputs = list(inputs)
+        fields = _walk_fields(model, "", {})
+        if dtypes:
+            for column in dtypes:
+                if column not in fields:
+                    raise ValueError(f"{column!r} is not a node field of {model.__name__}")
+        dtypes = {c:(dtypes or {}).get(c, _field_dtype(f)) for c, (_, f) in fields.items()}
+
+        array = np.zeros(len(inputs), dtype=[(c, dt) for c, dt in dtypes.items()])
+        for column, (_, field) in fields.items():
+            try:
+                array[column] = field.default
+            except (TypeError, ValueError):
+                pass
+
+        resolved = [_resolve_nodes(model, obj, "", strick_match, {}) for obj in inputs]
+
+        rnodes, wnodes = {}, {}
+        rcolumns, wcolumns = [], []
+        for column, (kind, _) in fields.items():
+            rows = [i for i, r in enumerate(resolved) if column in r]
+            if not rows:
+                continue
+            nodes = [resolved[i][column] for i in rows]
+            index = slice(None) if len(rows) == len(inputs) else np.array(rows)
+            if kind in (F.R, F.RW):
+                rnodes.update(dict.fromkeys(nodes))
+                rcolumns.append( (column, index, _getter(nodes), dtypes[column] is object) )
+            if kind in (F.RW, F.W):
+                wnodes.update(dict.fromkeys(nodes))
+                wcolumns.append( (column, index, nodes) )
+
+        self._inputs = inputs
+        self._positions = {id(obj):i for i, obj in enumerate(inputs)}
+        self._model = model
+        self._array = array
+        self._dtypes = dtypes
+        self._groups = {c.rsplit(".", 1)[0] for c in dtypes if "." in c}
+        self._groups.update( g.rsplit(".", i)[0] for g in list(self._groups) for i in range(1, g.count(".")+1) )
+        self._rnodes = rnodes
+        self._wnodes = wnodes
+        self._rcolumns = rcolumns
+        self._wcolumns = wcolumns
+        self._rows = [ArrayRow(self, i) for i in range(len(inputs))]
+
+    @property
+    def array(self) -> np.ndarray:
+        """ the structured array, one row per input """
+        return self._array
+
+    @property
+    def model(self) -> Type[BaseModel]:
+        return self._model
+
+    @property
+    def inputs(self) -> List[Any]:
+        return self._inputs
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._dtypes)
+
+    @property
+    def rnodes(self) -> Dict[BaseNode, None]:
+        return self._rnodes
+
+    @property
+    def wnodes(self) -> Dict[BaseNode, None]:
+        return self._wnodes
+
+    @property
+    def acquisition(self) -> Optional[AcquisitionTimes]:
+        """ :class:`AcquisitionTimes` of the last download, None if the link was never downloaded """
+        return self._acquisition
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __getitem__(self, index: int) -> ArrayRow:
+        return self._rows[index]
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def row(self, obj: Any) -> ArrayRow:
+        """ Return the row of an input object """
+        try:
+            return self._rows[self._positions[id(obj)]]
+        except KeyError:
+            raise ValueError(f"{obj!r} is not an input of the link")
+
+    def _download_from(self, data: dict) -> None:
+        array = self._array
+        for column, index, getter, is_object in self._rcolumns:
+            values = getter(data)
+            if is_object or None in values:
+                # element per element so sequence values are not broadcasted and missing 
+                # values (None) are skipped 
+                col = array[column]
+                rows = range(len(col)) if isinstance(index, slice) else index.tolist()
+                for i, val in zip(rows, values):
+                    if val is not None:
+                        col[i] = val
+            else:
+                array[column][index] = values
+
+    def download(self) -> None:
+        """ download nodes from servers and update the array """
+        data = {}
+        plan = get_read_plan(self._rnodes)
+        cycle, since = new_cycle(), time.time()
+        plan.read(data)
+        acquisition = AcquisitionTimes()
+        acquisition.record(cycle, plan, since)
+        self._acquisition = acquisition
+        self._download_from(data)
+
+    def _upload_to(self, todata: dict) -> None:
+        array = self._array
+        for column, index, nodes in self._wcolumns:
+            todata.update(zip(nodes, array[column][index].tolist()))
+
+    def upload(self) -> None:
+        """ upload the array values of write nodes to the server """
+        todata = {}
+        self._upload_to(todata)
+        upload(todata)
+
+    def reset(self):
+        """ All linked nodes with a reset method will be reseted """
+        reset(self._rnodes)
+        reset(self._wnodes)
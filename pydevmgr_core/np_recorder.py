@@ -0,0 +1,205 @@
+""" History recorder of node values into numpy arrays. This module requires numpy """
+
+from .base import BaseNode, Downloader
+import math
+import time
+import threading
+import numpy as np
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+__all__ = [
+"HistoryRecorder",
+]
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+class HistoryRecorder:
+    """ Record node values in preallocated numpy ring buffers, one column per node plus a time column
+
+    Values are stored as float64 (non numerical values are recorded as NaN). The buffer is
+    allocated twice: each sample is written twice so any window of the last samples is a
+    contiguous numpy view of the buffer (no copy).
+
+    When the buffer is full the oldest samples are overwritten, or, if ``spill`` is given, the
+    oldest ``spill_chunk`` samples are appended to a binary file before being dropped. The file
+    can be read with :meth:`load_spill`.
+
+    Args:
+        nodes (iterable): nodes to record
+        size (int, optional): max number of samples kept in memory
+        spill (str, optional): file path where the samples are spilled when the buffer is full
+        spill_chunk (int, optional): number of samples spilled at once, default is size//4
+
+    Example:
+
+    ::
+
+        recorder = HistoryRecorder([motor.stat.pos_actual, motor.stat.pos_error], size=100000)
+        recorder.connect(downloader)
+        ...
+        t, pos = recorder.get(motor.stat.pos_actual, seconds=10) # last 10 seconds
+
+    .. warning::
+
+        Views are not copies, they are overwritten when the buffer wraps. Copy them if they have
+        to be kept longer than ``size`` samples.
+    """
+    def __init__(self,
+          nodes: Iterable[BaseNode],
+          size: int = 100000,
+          spill: Optional[str] = None,
+          spill_chunk: Optional[int] = None
+        ) -> None:
+        if size<1:
+            raise ValueError(f"size must be >=1 got {size}")
+        self._nodes = tuple(nodes)
+        self._columns = {node:i+1 for i, node in enumerate(self._nodes)}
+        self._size = size
+        # row 0 is the time, rows are contiguous in memory (columnar storage)
+        self._buffer = np.full( (len(self._nodes)+1, 2*size), np.nan, dtype=np.float64)
+        self._start = 0
+        self._count = 0
+        self._spill = spill
+        self._spill_chunk = max(1, size//4) if spill_chunk is None else min(max(1, spill_chunk), size)
+        self.n_spilled = 0
+        self._lock = threading.Lock()
+        self._connection = None
+
+    @property
+    def nodes(self) -> Tuple[BaseNode]:
+        return self._nodes
+
+    @property
+    def columns(self) -> List[str]:
+        """ column names: 'time' followed by node keys """
+        return ["time"]+[n.key for n in self._nodes]
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def __len__(self):
+        return self._count
+
+    def connect(self, downloader: Downloader, period: Optional[float] = None) -> None:
+        """ Record the nodes at each download of the downloader
+
+        Args:
+            downloader (:class:`Downloader`): a downloader
+            period (float, optional): download period of the recorder connection, see
+                                      :meth:`Downloader.new_connection`
+        """
+        self.disconnect()
+        connection = downloader.new_connection(period)
+        connection.add_nodes(self._nodes)
+        data = downloader.data
+        def record():
+            self.append(data)
+        connection.add_callback(record)
+        self._connection = connection
+
+    def disconnect(self) -> None:
+        """ Disconnect the recorder from its downloader """
+        if self._connection is not None:
+            self._connection.disconnect()
+            self._connection = None
+
+    def append(self, data: Dict[BaseNode, Any], timestamp: Optional[float] = None) -> None:
+        """ Append one sample from a node/value dictionary
+
+        Args:
+            data (dict): node/value pairs, must contains all recorded nodes
+            timestamp (float, optional): sample time, default is time.time()
+        """
+        values = [data[n] for n in self._nodes]
+        try:
+            row = np.array(values, dtype=np.float64)
+        except (TypeError, ValueError):
+            row = np.array([_to_float(v) for v in values], dtype=np.float64)
+
+        with self._lock:
+            size = self._size
+            if self._count == size:
+                if self._spill:
+                    self._spill_oldest(self._spill_chunk)
+                else:
+                    self._start = (self._start+1) % size
+                    self._count -= 1
+            i = (self._start+self._count) % size
+            buffer = self._buffer
+            t = time.time() if timestamp is None else timestamp
+            buffer[0, i] = t
+            buffer[0, i+size] = t
+            buffer[1:, i] = row
+            buffer[1:, i+size] = row
+            self._count += 1
+
+    def _spill_oldest(self, n):
+        # append the n oldest samples to the spill file (records of n_columns float64) and drop them
+        view = self._buffer[:, self._start:self._start+n]
+        with open(self._spill, "ab") as f:
+            np.ascontiguousarray(view.T).tofile(f)
+        self.n_spilled += n
+        self._start = (self._start+n) % self._size
+        self._count -= n
+
+    def flush(self) -> None:
+        """ spill all the samples in memory to the spill file """
+        if not self._spill:
+            raise ValueError("recorder has no spill file")
+        with self._lock:
+            if self._count:
+                self._spill_oldest(self._count)
+
+    @staticmethod
+    def load_spill(path: str, n_nodes: int) -> np.ndarray:
+        """ Read a spill file
+
+        Args:
+            path (str): spill file path
+            n_nodes (int): number of recorded nodes
+
+        Returns:
+            array (ndarray): (n_samples, 1+n_nodes) array, first column is the time
+        """
+        return np.fromfile(path, dtype=np.float64).reshape(-1, n_nodes+1)
+
+    def window(self, seconds: Optional[float] = None, n: Optional[int] = None) -> np.ndarray:
+        """ Return a view of the last samples
+
+        Args:
+            seconds (float, optional): only samples of the last ``seconds`` (relative to the last sample)
+            n (int, optional): only the last n samples
+
+        Returns:
+            view (ndarray): (1+n_nodes, n_samples) array view, row 0 is the time, then one row per node
+        """
+        with self._lock:
+            end = self._start+self._count
+            start = self._start
+            if n is not None:
+                start = max(start, end-n)
+            view = self._buffer[:, start:end]
+            if seconds is not None and view.shape[1]:
+                times = view[0]
+                i = np.searchsorted(times, times[-1]-seconds, side="left")
+                view = view[:, i:]
+        return view
+
+    def get(self, node: BaseNode, seconds: Optional[float] = None, n: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """ Return (time, values) views of one node, see :meth:`window` """
+        view = self.window(seconds=seconds, n=n)
+        return view[0], view[self._columns[node]]
+
+    def clear(self) -> None:
+        """ drop all samples in memory """
+        with self._lock:
+            self._start = 0
+            self._count = 0
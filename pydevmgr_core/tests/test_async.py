@@ -0,0 +1,118 @@
+import asyncio
+import pytest
+
+from pydevmgr_core import (BaseNode, NodeAlias1, NodesReader, NodesWriter, 
+                           DictReadCollector, download_async, upload_async)
+from pydevmgr_core.nodes import Value, Formula1
+
+
+class AsyncCollector:
+    """ A collector with native coroutines """
+    def __init__(self):
+        self._nodes = set()
+    def add(self, node):
+        self._nodes.add(node)
+    async def aread(self, data):
+        await asyncio.sleep(0)
+        for node in self._nodes:
+            data[node] = node.config.value
+    def read(self, data):
+        raise RuntimeError("blocking read should not be called")
+
+class AsyncNode(BaseNode, value=(float, 0.0)):
+    @property
+    def sid(self):
+        return "async"
+    def read_collector(self):
+        return AsyncCollector()
+
+
+def test_aget_aset_on_blocking_node():
+    v = Value(value=1.0)
+    async def main():
+        assert await v.aget() == 1.0
+        await v.aset(2.0)
+        return await v.aget()
+    assert asyncio.run(main()) == 2.0
+
+
+def test_alias_aget_aset():
+    v = Value(value=2.0)
+    f = Formula1(node=v, formula="x*10")
+    assert asyncio.run(f.aget()) == 20.0
+    
+    class Scaler(NodeAlias1):
+        def fset(self, value):
+            return value/10.0
+    s = Scaler(node=v)
+    asyncio.run(s.aset(30.0))
+    assert v.get() == 3.0
+
+
+def test_aread_should_use_native_and_adapted_collectors():
+    a = AsyncNode(value=4.0)
+    v = Value(value=5.0)
+    f = Formula1(node=v, formula="x+1")
+    data = {}
+    asyncio.run(NodesReader([a, v, f]).aread(data))
+    assert data[a] == 4.0
+    assert data[v] == 5.0
+    assert data[f] == 6.0
+
+
+def test_download_upload_async():
+    v1, v2 = Value(value=1), Value(value=2)
+    assert asyncio.run(download_async([v1, v2])) == [1, 2]
+    asyncio.run(upload_async({v1: 10, v2: 20}))
+    data = {}
+    asyncio.run(download_async([v1, v2], data))
+    assert data == {v1: 10, v2: 20}
+
+
+def test_async_downloader_should_run_as_a_task():
+    from pydevmgr_core import AsyncDownloader
+    
+    async def main():
+        downloader = AsyncDownloader()
+        connection = downloader.new_connection()
+        a, v = AsyncNode(value=3.0), Value(value=4)
+        connection.add_node(a, v)
+        received = []
+        async def callback():
+            await asyncio.sleep(0)
+            received.append(downloader.data[a])
+        connection.add_callback(callback)
+        
+        downloader.start(period=0.01)
+        data = await connection.next_update()
+        a.config.value = 5.0
+        await downloader.next_update()
+        await downloader.next_update()
+        await downloader.stop()
+        return data, received
+    
+    data, received = asyncio.run(main())
+    assert received[0] == 3.0
+    assert received[-1] == 5.0 
+
+
+def test_async_downloader_failure():
+    from pydevmgr_core import AsyncDownloader
+    
+    class FailingNode(BaseNode):
+        def fget(self):
+            raise ValueError("server down")
+    
+    async def main():
+        failures = []
+        async def on_failure(e):
+            failures.append(e)
+        downloader = AsyncDownloader([FailingNode()])
+        downloader.add_failure_callback(Ellipsis, on_failure)
+        future = downloader.next_update()
+        await downloader.adownload()
+        with pytest.raises(ValueError):
+            await future
+        return failures
+    failures = asyncio.run(main())
+    assert len(failures) == 1 
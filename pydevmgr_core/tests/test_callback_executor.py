@@ -0,0 +1,86 @@
+import threading 
+from pydevmgr_core import CallbackExecutor, Downloader
+from pydevmgr_core.nodes import Value 
+
+
+def test_slow_callback_should_not_block_downloads():
+    release, started = threading.Event(), threading.Event()
+    calls = []
+    def slow_callback():
+        started.set()
+        release.wait(2.0)
+        calls.append(node.get())
+    
+    node = Value(value=0)
+    executor = CallbackExecutor(max_workers=2, policy="latest")
+    downloader = Downloader([node], callback=slow_callback, callback_executor=executor)
+    for i in range(5):
+        node.set(i)
+        downloader.download() # does not wait the callback 
+        started.wait(2.0)
+    release.set()
+    assert executor.join(2.0)
+    
+    stats = executor.stats[slow_callback]
+    # first call is running, then only the latest call is kept 
+    assert stats.n_calls == 2 
+    assert stats.n_dropped == 3 
+    assert stats.max_latency > 0 
+    executor.shutdown()
+
+
+def test_callback_executor_drop_oldest():
+    release, started = threading.Event(), threading.Event()
+    received = []
+    def callback(x):
+        started.set()
+        release.wait(2.0)
+        received.append(x)
+    
+    executor = CallbackExecutor(maxsize=2, dedicated=True)
+    executor.submit(callback, 0)
+    started.wait(2.0)
+    for i in range(1, 5):
+        executor.submit(callback, i)
+    release.set()
+    assert executor.join(2.0)
+    assert received == [0, 3, 4]
+    executor.shutdown()
+
+
+def test_callback_executor_errors():
+    errors = []
+    def callback():
+        raise ValueError()
+    executor = CallbackExecutor(on_error=lambda f,e: errors.append(e))
+    executor.submit(callback)
+    assert executor.join(2.0)
+    assert executor.stats[callback].n_errors == 1 
+    assert isinstance(errors[0], ValueError)
+    executor.shutdown()
+
+
+def test_removed_callbacks_should_be_discarded_from_executor():
+    executor = CallbackExecutor(dedicated=True)
+    downloader = Downloader([Value(value=0)], callback_executor=executor)
+    shared = lambda: None
+    
+    connections = []
+    for _ in range(3):
+        connection = downloader.new_connection()
+        connection.add_node(Value(value=1))
+        connection.add_callback(lambda: None, shared)
+        connection.add_failure_callback(lambda e: None)
+        connection.subscribe([Value(value=2)], lambda changed: None)
+        connections.append(connection)
+    downloader.download()
+    assert executor.join(2.0)
+    assert len(executor.stats) == 7 # 3 callbacks, 3 subscriptions and the shared callback 
+    
+    connections[0].disconnect()
+    assert shared in executor.stats
+    assert len(executor.stats) == 5
+    for connection in connections[1:]:
+        connection.disconnect()
+    assert executor.stats == {}
+    executor.shutdown()
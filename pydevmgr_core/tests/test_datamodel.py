@@ -0,0 +1,221 @@
+from pydevmgr_core import DataLink, NodeVar, NodeVar_R, BaseNode
+from pydevmgr_core.nodes import Value
+try:
+    from pydantic.v1 import BaseModel, ValidationError
+except ModuleNotFoundError:
+    from pydantic import BaseModel, ValidationError
+import pytest
+from typing import Any
+
+
+class Stat:
+    pos = Value('pos', value=1.0)
+    vel = Value('vel', value=2.0)
+
+
+class Device:
+    stat = Stat()
+    name = Value('name', value="motor")
+
+
+class StatData(BaseModel):
+    pos: NodeVar[float] = 0.0
+    vel: NodeVar_R = 0.0
+
+
+class StrictStatData(StatData):
+    class Config:
+        validate_assignment = True
+
+
+def test_datalink_should_download_in_bulk():
+    class Data(BaseModel):
+        stat: StatData = StatData()
+        name: NodeVar_R = ""
+
+    data = Data()
+    link = DataLink(Device, data)
+    link.download()
+    assert data.stat.pos == 1.0 and data.stat.vel == 2.0 and data.name == "motor"
+    assert data.stat.__fields_set__ >= {"pos", "vel"}
+    assert not link._transfer_plan.slow
+
+    data.stat.pos = 4.0
+    todata = {}
+    link._upload_to(todata)
+    assert todata == {Stat.pos: 4.0}
+
+
+def test_datalink_validation_can_be_skipped():
+    class Data(BaseModel):
+        stat: StrictStatData = StrictStatData()
+
+    Stat.pos.set("not a float")
+    try:
+        link = DataLink(Device, Data())
+        assert len(link._transfer_plan.slow) == 2
+        with pytest.raises(ValidationError):
+            link.download()
+
+        data = Data()
+        link = DataLink(Device, data, validate=False)
+        assert not link._transfer_plan.slow
+        link.download()
+        assert data.stat.pos == "not a float"
+    finally:
+        Stat.pos.set(1.0)
+
+
+def test_datalink_field_plan_is_cached_by_model_class():
+    from pydevmgr_core.base.datamodel import get_field_plan, MatchError
+
+    class Data(BaseModel):
+        stat: StatData = StatData()
+
+    class Stat2:
+        pos = Value('pos2', value=3.0)
+        vel = Value('vel2', value=4.0)
+
+    class Device2:
+        stat = Stat2()
+
+    plan = get_field_plan(Data)
+    assert get_field_plan(Data) is plan
+
+    d1, d2 = Data(), Data()
+    l1, l2 = DataLink(Device, d1), DataLink(Device2, d2)
+    assert set(l1.rnodes) == {Stat.pos, Stat.vel}
+    assert set(l2.rnodes) == {Stat2.pos, Stat2.vel}
+    l2.download()
+    assert d2.stat.pos == 3.0 and d1.stat.pos == 0.0
+
+    class BrokenStat:
+        pos = Value('pos3')
+
+    class Broken:
+        stat = BrokenStat()
+
+    with pytest.raises(MatchError):
+        DataLink(Broken, Data())
+    link = DataLink(Broken, Data(), strick_match=False)
+    assert set(link.rnodes) == {BrokenStat.pos}
+
+
+def test_datalink_upload_changed_only():
+    from pydevmgr_core import NodeVar_W
+    written = []
+
+    class CfgNode(BaseNode, value=(Any, 0.0)):
+        def fget(self):
+            return self.config.value
+        def fset(self, value):
+            written.append((self.key, value))
+            self.config.value = value
+
+    class Cfg:
+        a = CfgNode('a', value=1.0)
+        b = CfgNode('b', value=2.0)
+        c = CfgNode('c', value=3.0)
+
+    class CfgData(BaseModel):
+        a: NodeVar[float] = 0.0
+        b: NodeVar[float] = 0.0
+        c: NodeVar_W = 0.0
+
+    data = CfgData()
+    link = DataLink(Cfg, data, track_changes=True)
+    assert set(link.changes()) == {Cfg.a, Cfg.b, Cfg.c}
+    link.download()
+    assert link.changes() == {}
+    link.upload(changed_only=True)
+    assert written == []
+
+    data.c = 4.0
+    link.upload(changed_only=True)
+    assert written == [('c', 4.0)]
+    del written[:]
+
+    data.b = 5.0
+    link.upload(changed_only=True)
+    assert written == [('b', 5.0)]
+
+    Cfg.a.set(7.0)
+    del written[:]
+    link.download()
+    assert data.a == 7.0
+    link.upload(changed_only=True)
+    assert written == []
+
+    link.upload()
+    assert len(written) == 3
+
+
+def test_datalink_changes_should_compare_validated_values():
+    from enum import Enum
+    written = []
+
+    class Mode(str, Enum):
+        AUTO = "AUTO"
+        MANUAL = "MANUAL"
+
+    class RawNode(BaseNode, value=(Any, None)):
+        def fget(self):
+            return self.config.value
+        def fset(self, value):
+            written.append((self.key, value))
+
+    class Cfg:
+        count = RawNode('count', value="3")
+        mode = RawNode('mode', value="AUTO")
+
+    class CfgData(BaseModel):
+        count: NodeVar[int] = 0
+        mode: NodeVar[Mode] = Mode.MANUAL
+        class Config:
+            validate_assignment = True
+
+    data = CfgData()
+    link = DataLink(Cfg, data, track_changes=True)
+    link.download()
+    assert data.count == 3 and data.mode is Mode.AUTO
+    assert link.changes() == {}
+    link.upload(changed_only=True)
+    assert written == []
+
+    link.download_from_nodes({Cfg.count: "4"})
+    assert link.changes() == {}
+
+
+def test_datalink_should_report_changed_fields():
+    from pydevmgr_core import Downloader
+
+    class Data(BaseModel):
+        stat: StatData = StatData()
+        name: NodeVar_R = ""
+
+    class StrictData(BaseModel):
+        stat: StrictStatData = StrictStatData()
+
+    data = Data()
+    assert DataLink(Device, Data()).download() is None
+
+    events = []
+    link = DataLink(Device, data, on_change=events.append)
+    assert link.download() == {"stat.pos", "stat.vel", "name"}
+    assert link.download() == set()
+    Stat.pos.set(3.0)
+    try:
+        assert link.download() == {"stat.pos"}
+        assert events == [{"stat.pos", "stat.vel", "name"}, {"stat.pos"}]
+
+        strict_link = DataLink(Device, StrictData(), report_changes=True)
+        assert strict_link.download() == {"stat.pos", "stat.vel"}
+        assert strict_link.download() == set()
+
+        downloader = Downloader()
+        downloader.add_datalink(Ellipsis, link)
+        Stat.pos.set(4.0)
+        downloader.download()
+        assert events[-1] == {"stat.pos"}
+    finally:
+        Stat.pos.set(1.0)
@@ -0,0 +1,588 @@
+import pytest
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from pydevmgr_core import BaseNode, NodesReader, Downloader, download
+from pydevmgr_core.nodes import Value 
+
+
+class SidNode(BaseNode, sid_number=(int, 0), value=(float, 0.0)):
+    """ A dummy node living on a given server (sid) """
+    barrier = None 
+    
+    @property
+    def sid(self):
+        return self.config.sid_number
+    
+    def fget(self):
+        if self.barrier is not None:
+            # all servers must be read at the same time to pass the barrier 
+            self.barrier.wait(timeout=2.0)
+        return self.config.value
+
+
+def test_nodes_reader_should_read_all_nodes():
+    nodes = [SidNode(sid_number=i, value=i) for i in range(4)]
+    data = {}
+    NodesReader(nodes).read(data)
+    assert [data[n] for n in nodes] == [0.0, 1.0, 2.0, 3.0]
+
+
+def test_concurrent_read_should_read_sids_in_parallel():
+    nodes = [SidNode(sid_number=i, value=i) for i in range(4)]
+    barrier = threading.Barrier(4)
+    for n in nodes:
+        n.barrier = barrier
+
+    with ThreadPoolExecutor(4) as executor:
+        assert download(nodes, executor=executor) == [0.0, 1.0, 2.0, 3.0]
+
+
+def test_concurrent_read_should_raise_collector_error():
+    class FailingNode(SidNode):
+        def fget(self):
+            raise ValueError("server down")
+    
+    nodes = [SidNode(sid_number=0), FailingNode(sid_number=1)]
+    with ThreadPoolExecutor(2) as executor:
+        with pytest.raises(ValueError):
+            download(nodes, executor=executor)
+
+
+def test_downloader_with_max_workers():
+    nodes = [SidNode(sid_number=i, value=i) for i in range(3)]
+    barrier = threading.Barrier(3)
+    for n in nodes:
+        n.barrier = barrier
+    
+    with Downloader(nodes, max_workers=3) as downloader:
+        downloader.download()
+        assert [downloader.data[n] for n in nodes] == [0.0, 1.0, 2.0]
+    assert downloader._executor._shutdown
+    
+    with ThreadPoolExecutor(2) as executor:
+        Downloader(nodes[:1], max_workers=executor).close()
+        assert not executor._shutdown
+
+
+def test_download_should_reuse_cached_read_plan():
+    from pydevmgr_core import get_read_plan, clear_read_plans, ReadPlan
+    nodes = [Value(value=1), Value(value=2)]
+    plan = get_read_plan(nodes)
+    assert isinstance(plan, ReadPlan)
+    assert get_read_plan(nodes) is plan 
+    assert download(nodes) == [1, 2]
+    
+    with pytest.raises(RuntimeError):
+        plan.add(Value(value=3))
+    
+    clear_read_plans(nodes[0])
+    assert get_read_plan(nodes) is not plan
+
+
+def test_cached_read_plans_should_not_keep_nodes_alive():
+    import gc, weakref
+    from pydevmgr_core import get_read_plan
+    nodes = [Value(value=1), Value(value=2)]
+    plan = get_read_plan(nodes)
+    refs = [weakref.ref(n) for n in nodes]
+    del nodes, plan
+    gc.collect()
+    assert [r() for r in refs] == [None, None]
+
+
+def test_cached_read_plans_should_be_per_thread():
+    from concurrent.futures import ThreadPoolExecutor
+    from pydevmgr_core import get_read_plan
+    nodes = (Value(value=1),)
+    plan = get_read_plan(nodes)
+    with ThreadPoolExecutor(1) as executor:
+        other = executor.submit(get_read_plan, nodes).result()
+    assert other is not plan 
+    assert get_read_plan(nodes) is plan 
+
+
+class CountingNode(BaseNode):
+    """ count the number of fget calls """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.n_calls = 0
+    def fget(self):
+        self.n_calls += 1
+        return self.n_calls
+
+
+def test_downloader_nodes_should_be_reference_counted():
+    node = CountingNode()
+    downloader = Downloader()
+    c1 = downloader.new_connection()
+    c2 = downloader.new_connection()
+    c1.add_node(node)
+    c2.add_node(node)
+    downloader.download()
+    assert node.n_calls == 1
+    
+    c1.disconnect()
+    downloader.download()
+    assert node.n_calls == 2
+    
+    c2.remove_node(node)
+    downloader.download()
+    assert node.n_calls == 2
+    assert downloader.data[node] == 2 # data is kept but not updated 
+
+
+def test_downloader_should_keep_alias_dependencies_used_elsewhere():
+    from pydevmgr_core.nodes import Formula1
+    node = CountingNode()
+    alias = Formula1(node=node, formula="x*10")
+    downloader = Downloader()
+    c1 = downloader.new_connection()
+    c2 = downloader.new_connection()
+    c1.add_node(alias)
+    c2.add_node(node)
+    downloader.download()
+    assert downloader.data[alias] == 10
+    
+    c1.disconnect()
+    downloader.download()
+    assert node.n_calls == 2
+    assert downloader.data[alias] == 10
+
+
+def test_downloader_should_isolate_sid_failures():
+    from pydevmgr_core import PartialDownloadError
+    from pydevmgr_core.nodes import Formula1
+    
+    class FlakyNode(SidNode):
+        failing = False
+        def fget(self):
+            if self.failing:
+                raise ValueError("server down")
+            return self.config.value
+    
+    good = SidNode(sid_number=0, value=1.0)
+    flaky = FlakyNode(sid_number=1, value=2.0)
+    alias = Formula1(node=flaky, formula="x*10")
+    
+    failures = []
+    downloader = Downloader([good, flaky, alias], isolate_failures=True)
+    downloader.add_failure_callback(Ellipsis, failures.append)
+    downloader.download()
+    assert downloader.data[alias] == 20.0
+    assert not downloader.errors
+    
+    flaky.failing = True
+    good.config.value = 3.0
+    downloader.download()
+    assert downloader.data[good] == 3.0 
+    assert downloader.data[flaky] == 2.0 
+    assert set(downloader.errors) == {1}
+    assert downloader.stale_nodes == {flaky, alias}
+    assert downloader.is_stale(alias)
+    assert isinstance(failures[-1], PartialDownloadError)
+    
+    flaky.failing = False
+    downloader.download()
+    assert failures[-1] is None
+    assert not downloader.stale_nodes
+
+
+def test_downloader_should_isolate_alias_failures():
+    from pydevmgr_core import PartialDownloadError
+    from pydevmgr_core.nodes import Formula1, Static
+    
+    good = SidNode(sid_number=0, value=1.0)
+    x = SidNode(sid_number=1, value=0.0)
+    inverse = Formula1(node=x, formula="1/x")
+    double = Formula1(node=inverse, formula="2*x")
+    other = Formula1(node=good, formula="x+1")
+    
+    failures, calls = [], []
+    downloader = Downloader([good, inverse, double, other], isolate_failures=True)
+    downloader.add_failure_callback(Ellipsis, failures.append)
+    downloader.add_callback(Ellipsis, lambda: calls.append(1))
+    downloader.download()
+    assert downloader.data[other] == 2.0
+    assert downloader.data[x] == 0.0
+    assert downloader.data[inverse] is None
+    assert set(downloader.errors) == {inverse}
+    assert isinstance(downloader.errors[inverse], ZeroDivisionError)
+    assert downloader.stale_nodes == {inverse, double}
+    assert isinstance(failures[-1], PartialDownloadError)
+    assert calls == [1]
+    
+    x.config.value = 0.5
+    downloader.download()
+    assert downloader.data[double] == 4.0
+    assert failures[-1] is None
+    
+    # error not related to a sid or an alias (constant folding) 
+    constant = Formula1(node=Static(value=0), formula="1/x")
+    downloader.add_node(Ellipsis, constant)
+    downloader.download()
+    assert isinstance(failures[-1], ZeroDivisionError)
+    assert calls == [1, 1]
+
+
+def test_failing_sid_should_not_be_partially_updated():
+    class HalfCollector:
+        # writes the first node then fails 
+        failing = False
+        def __init__(self):
+            self.nodes = []
+        def add(self, node):
+            self.nodes.append(node)
+        def read(self, data):
+            for node in self.nodes:
+                data[node] = node.config.value
+                if HalfCollector.failing:
+                    raise ValueError("connection lost")
+    
+    class HalfNode(SidNode):
+        def read_collector(self):
+            return HalfCollector()
+    
+    a, b = HalfNode(sid_number=1, value=1.0), HalfNode(sid_number=1, value=2.0)
+    for max_workers in (None, 2):
+        HalfCollector.failing = False
+        a.config.value = 1.0
+        downloader = Downloader([a, b, SidNode(sid_number=2)], isolate_failures=True, max_workers=max_workers)
+        downloader.download()
+        HalfCollector.failing = True
+        a.config.value = 101.0
+        downloader.download()
+        assert downloader.stale_nodes == {a, b}
+        assert downloader.data[a] == 1.0
+        downloader.close()
+
+
+def test_single_flight_should_merge_concurrent_reads():
+    import time
+    from pydevmgr_core import SingleFlight
+    started, release = threading.Event(), threading.Event()
+    
+    class SlowNode(CountingNode):
+        def fget(self):
+            started.set()
+            release.wait(2.0)
+            return super().fget()
+    
+    node = SlowNode()
+    flight = SingleFlight()
+    results = []
+    def target():
+        results.append(download([node], single_flight=flight))
+    
+    t1 = threading.Thread(target=target)
+    t1.start()
+    started.wait(2.0)
+    t2 = threading.Thread(target=target)
+    t2.start()
+    time.sleep(0.1)
+    release.set()
+    t1.join(); t2.join()
+    
+    assert node.n_calls == 1
+    assert results == [[1], [1]]
+
+
+def test_static_nodes_should_be_read_once():
+    from pydevmgr_core.nodes import Static, Formula
+    
+    class CountingStatic(Static):
+        n_calls = 0
+        def fget(self):
+            self.n_calls += 1
+            return super().fget()
+    
+    static = CountingStatic(value=2.0)
+    formula = Formula(nodes=[static], formula="2*x")
+    counting = CountingNode()
+    mixed = Formula(nodes=[static, counting], formula="x1+x2")
+
+    downloader = Downloader([static, formula, counting, mixed])
+    downloader.download()
+    downloader.download()
+    
+    assert static.n_calls == 1 
+    assert downloader.data[formula] == 4.0
+    assert downloader.data[mixed] == 4.0 
+    assert counting.n_calls == 2 
+    
+    static.config.value = 3.0
+    downloader.download()
+    assert downloader.data[formula] == 4.0 # frozen until resolved again 
+    downloader.resolve_constants()
+    downloader.download()
+    assert static.n_calls == 2 
+    assert downloader.data[formula] == 6.0
+    assert download([static, formula]) == [3.0, 6.0]
+    static.config.value = 4.0
+    assert download([static, formula]) == [4.0, 8.0]
+
+
+def test_impure_aliases_should_not_be_folded():
+    import itertools
+    from pydevmgr_core import nodealias, NodeAlias
+    from pydevmgr_core.nodes import Static
+    
+    counter = itertools.count()
+    @nodealias('tick', [])
+    def tick():
+        return next(counter)
+    
+    class Offset(NodeAlias):
+        n = 0
+        def fget(self, value):
+            self.n += 1
+            return value+self.n
+    offset = Offset(nodes=[Static(value=10)])
+    
+    downloader = Downloader([tick, offset])
+    downloader.download()
+    downloader.download()
+    assert downloader.data[tick] == 1
+    assert downloader.data[offset] == 12
+
+
+def test_downloader_should_read_nodes_at_their_own_rate():
+    fast, slow, other = CountingNode(), CountingNode(), CountingNode()
+    downloader = Downloader()
+    c_fast = downloader.new_connection(period=0.01)
+    c_slow = downloader.new_connection(period=100.0)
+    c_fast.add_node(fast)
+    c_fast.add_node(other, period=100.0)
+    c_slow.add_node(slow)
+    calls = []
+    c_slow.add_callback(lambda: calls.append('slow'))
+    
+    downloader.run(period=100.0, stop_signal=lambda: fast.n_calls>=5)
+    assert fast.n_calls == 5 
+    assert slow.n_calls == 1 
+    assert other.n_calls == 1
+    assert calls == ['slow']
+    
+    # callbacks of a connection follow the periods of its nodes, not its default period 
+    node = CountingNode()
+    connection = downloader.new_connection()
+    connection.add_node(node, period=10.0)
+    connection.add_callback(lambda: calls.append('node'))
+    for _ in range(5):
+        downloader.download()
+    assert node.n_calls == 1
+    assert calls.count('node') == 1
+    
+    with pytest.raises(ValueError):
+        downloader.new_connection(period=0.0)
+
+
+def test_subscription_should_follow_the_connection_period():
+    import time
+    subscribed, slow = CountingNode(), CountingNode()
+    downloader = Downloader()
+    connection = downloader.new_connection(period=0.01)
+    connection.add_node(slow, period=100.0)
+    notified = []
+    subscription = connection.subscribe([subscribed], notified.append, on_change=False)
+    
+    timeout = time.monotonic()+2.0
+    downloader.run(period=100.0, 
+                   stop_signal=lambda: subscribed.n_calls>=5 or time.monotonic()>timeout, 
+                   sleepfunc=lambda s: time.sleep(min(s, 0.01))
+                )
+    assert subscribed.n_calls == 5 
+    assert slow.n_calls == 1 
+    assert [n[subscribed] for n in notified] == [1, 2, 3, 4, 5]
+    
+    subscription.unsubscribe()
+    assert 0.01 not in downloader.schedulers
+
+
+def test_subscription_should_notify_changed_nodes_only():
+    a, b = Value(value=1.0), Value(value="ok")
+    downloader = Downloader()
+    connection = downloader.new_connection()
+    notified = []
+    subscription = connection.subscribe([a, b], notified.append, deadband=0.5)
+    
+    downloader.download()
+    assert notified == [{a:1.0, b:"ok"}]
+    
+    a.set(1.2) # inside deadband 
+    downloader.download()
+    assert len(notified) == 1
+    
+    a.set(2.0)
+    b.set("error")
+    downloader.download()
+    assert notified[-1] == {a:2.0, b:"error"}
+    
+    b.set("ok")
+    downloader.download()
+    assert notified[-1] == {b:"ok"}
+    
+    subscription.unsubscribe()
+    downloader.download()
+    assert len(notified) == 3 
+    assert a not in downloader._nodes
+
+
+def test_downloader_snapshots():
+    node = Value(value=1)
+    downloader = Downloader([node])
+    snapshot = downloader.snapshot()
+    assert snapshot.version == 0 
+    assert snapshot[node] is None 
+    
+    downloader.download()
+    first = downloader.snapshot()
+    assert first.version == 1 
+    assert first[node] == 1
+    
+    node.set(2)
+    t = threading.Timer(0.05, downloader.download)
+    t.start()
+    second = downloader.wait_snapshot(first.version, timeout=2.0)
+    t.join()
+    assert second.version == 2 
+    assert second[node] == 2 
+    assert first[node] == 1 # unchanged 
+    with pytest.raises(TypeError):
+        second[node] = 3
+    with pytest.raises(RuntimeError):
+        downloader.wait_snapshot(second.version, timeout=0.01)
+
+
+def test_data_view_should_be_live():
+    downloader = Downloader()
+    view = downloader.get_data_view("motor1")
+    stat_view = downloader.get_data_view("motor1.stat")
+    assert len(view) == 0 
+    
+    pos = Value("motor1.stat.pos", value=3.0)
+    other = Value("motor2.stat.pos", value=4.0)
+    downloader.add_node(Ellipsis, pos, other)
+    downloader.download()
+    
+    assert view["stat.pos"] == 3.0
+    assert stat_view["pos"] == 3.0
+    assert "pos" in stat_view and len(stat_view) == 1 
+    assert downloader.get_node("motor2.stat.pos") is other
+    
+    stat_view.update(pos=5.0)
+    assert downloader.data[pos] == 5.0
+    stat_view.clear()
+    assert pos not in downloader.data
+    assert len(view) == 0 
+
+
+def test_cached_nodes_should_keep_the_timestamp_of_their_cache():
+    cached = SidNode(sid_number=3, value=3.0, max_age=60.0)
+    mixed_cached = SidNode(sid_number=1, value=1.0, max_age=60.0)
+    mixed = SidNode(sid_number=1, value=1.0)
+    downloader = Downloader([cached, mixed_cached, mixed])
+    
+    downloader.download()
+    first = downloader.acquisition.sid_timing(3)
+    assert downloader.get_timestamp(cached) == cached.cached[1]
+    assert downloader.get_timestamp(mixed_cached) == mixed_cached.cached[1]
+    timestamp = downloader.get_timestamp(mixed)
+    
+    downloader.download() # served from cache, no server call for sid 3 
+    assert downloader.acquisition.sid_timing(3) == first 
+    assert downloader.get_timestamp(cached) == cached.cached[1] <= first.end
+    assert downloader.get_timestamp(mixed_cached) == mixed_cached.cached[1] <= timestamp
+    assert downloader.acquisition.sid_timing(1).cycle == downloader.cycle
+    assert downloader.get_timestamp(mixed) >= timestamp
+    
+    cached.invalidate()
+    downloader.download()
+    assert downloader.acquisition.sid_timing(3).cycle == downloader.cycle
+    assert downloader.get_timestamp(cached) == cached.cached[1] > first.end
+
+
+def test_downloader_should_record_acquisition_times():
+    import time
+    from pydevmgr_core import DataLink, NodeVar
+    from pydevmgr_core.nodes import Formula1
+    try:
+        from pydantic.v1 import BaseModel
+    except ModuleNotFoundError:
+        from pydantic import BaseModel
+    
+    class Device:
+        a = SidNode(sid_number=1, value=1.0)
+        b = SidNode(sid_number=2, value=2.0)
+        f = Formula1(node=a, formula="2*x")
+    
+    class Data(BaseModel):
+        a: NodeVar[float] = 0.0 
+        f: NodeVar[float] = 0.0 
+    
+    data = Data()
+    link = DataLink(Device, data)
+    assert link.cycle == 0 
+    downloader = Downloader([Device.b])
+    downloader.add_datalink(Ellipsis, link)
+    tic = time.time()
+    downloader.download()
+    
+    cycle = downloader.cycle 
+    assert cycle > 0 
+    timing = downloader.acquisition.sid_timing(1)
+    assert timing.cycle == cycle and tic <= timing.start <= timing.end 
+    assert downloader.get_timestamp(Device.a) == timing.end
+    assert downloader.acquisition.timing(Device.f) == timing 
+    assert link.cycle == cycle 
+    assert link.get_timestamp(Device.a) == timing.end
+    
+    link.download() # own download, new global cycle 
+    assert link.cycle > cycle 
+    assert link.acquisition.sid_timing(2) is None 
+
+
+def test_downloader_metrics():
+    import io
+    from pydevmgr_core.nodes import Formula1
+    a, b = SidNode(sid_number=1, value=1.0), SidNode(sid_number=1, value=2.0)
+    f = Formula1(node=a, formula="x*2")
+    calls = []
+    downloader = Downloader([a, b, f], callback=lambda: calls.append(1), metrics=True)
+    for i in range(3):
+        downloader.download()
+    
+    metrics = downloader.metrics 
+    assert metrics.cycle.count == 3 
+    assert metrics.sids[1].count == 3 
+    assert metrics.aliases.count == 3 
+    assert metrics.callbacks.count == 3 
+    assert metrics.nodes_per_sid == {1:2}
+    assert metrics.cycle.percentile(50) >= metrics.read.percentile(50) >= 0.0
+    summary = metrics.summary()
+    assert summary['sids'][1]['count'] == 3 
+    out = io.StringIO()
+    metrics.dump(out)
+    assert "sid 1 (2 nodes)" in out.getvalue()
+    
+    downloader.disable_metrics()
+    assert downloader.metrics is None
+
+
+def test_downloader_metrics_should_ignore_clock_steps(monkeypatch):
+    import time
+    wall = time.time 
+    offset = [0.0]
+    monkeypatch.setattr(time, "time", lambda: wall()+offset[0])
+    
+    class SteppingNode(SidNode):
+        def fget(self):
+            offset[0] -= 3600.0 # system clock set back during the round-trip 
+            return super().fget()
+    
+    downloader = Downloader([SteppingNode(sid_number=1)], metrics=True)
+    for i in range(3):
+        downloader.download()
+    histogram = downloader.metrics.sids[1]
+    assert histogram.count == 3 
+    assert 0.0 <= histogram.percentile(0) <= histogram.percentile(100) < 1.0 
@@ -51,3 +51,76 @@ def test_node_config():
     
     assert config._get_parent_class() is BaseNode
 
+
+
+def test_node_max_age_should_cache_values():
+    from pydevmgr_core import NodesReader, upload
+    
+    class CountingNode(BaseNode):
+        n_calls = 0
+        def fget(self):
+            self.n_calls += 1
+            return self.n_calls
+        def fset(self, value):
+            pass 
+    
+    node = CountingNode(max_age=60.0)
+    assert node.get() == 1
+    assert node.get() == 1
+    value, timestamp = node.cached 
+    assert value == 1
+    
+    data = {}
+    other = CountingNode()
+    reader = NodesReader([node, other])
+    reader.read(data)
+    assert data[node] == 1 
+    assert data[other] == 1
+    
+    node.invalidate()
+    reader.read(data)
+    assert data[node] == 2 
+    assert data[other] == 2
+    
+    upload({node:0})
+    assert node.cached is None
+    assert node.get() == 3 
+    
+    node.config.max_age = 0.0 
+    assert node.get() == 4
+
+
+def test_fget_many_and_fset_many_should_batch_per_class():
+    from pydevmgr_core import download, upload
+    from pydevmgr_core.nodes import Value
+    
+    class BatchNode(BaseNode, value=(float, 0.0)):
+        calls = []
+        @classmethod
+        def fget_many(cls, nodes):
+            cls.calls.append(('get', len(nodes)))
+            return [n.config.value for n in nodes]
+        @classmethod
+        def fset_many(cls, nodes, values):
+            cls.calls.append(('set', len(nodes)))
+            for n, v in zip(nodes, values):
+                n.config.value = v
+    
+    nodes = [BatchNode(value=i) for i in range(3)]
+    other = Value(value=9)
+    assert download(nodes+[other]) == [0.0, 1.0, 2.0, 9]
+    assert BatchNode.calls == [('get', 3)]
+    
+    upload({nodes[0]:10.0, nodes[2]:12.0, other:19})
+    assert BatchNode.calls[-1] == ('set', 2)
+    assert [n.config.value for n in nodes] == [10.0, 1.0, 12.0]
+    assert other.get() == 19
+    
+    # collectors keep their flat node containers for subclasses 
+    from pydevmgr_core.base.node import BaseReadCollector, BaseWriteCollector
+    rc, wc = BaseReadCollector(), BaseWriteCollector()
+    for n in nodes+[other]:
+        rc.add(n)
+        wc.add(n, 1.0)
+    assert rc._nodes == set(nodes+[other])
+    assert wc._nodes == dict.fromkeys(nodes+[other], 1.0)
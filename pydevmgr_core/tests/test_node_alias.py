@@ -134,3 +134,50 @@ def test_bad_number_of_fset_outputs_should_raise_error(node10, node20):
 
 
             
+
+
+def test_shared_alias_should_be_evaluated_once_per_read(node10):
+    from pydevmgr_core import NodesReader
+    calls = []
+    
+    class Counted(NodeAlias1):
+        def fget(self, value):
+            calls.append(self)
+            return value
+    
+    shared = Counted(node=node10)
+    a = NodeAlias(nodes=[shared])
+    a.fget = lambda v: v+1
+    b = NodeAlias(nodes=[shared, a])
+    b.fget = lambda v, w: v+w
+    
+    data = {}
+    NodesReader([b, a, shared]).read(data)
+    assert calls == [shared]
+    assert data[b] == 21
+    assert data[a] == 11 
+
+
+def test_circular_aliases_should_raise_error(node10):
+    from pydevmgr_core import NodesReader
+    a = NodeAlias(nodes=[node10])
+    b = NodeAlias(nodes=[a])
+    a._nodes.append(b)
+    with pytest.raises(ValueError):
+        NodesReader([b])
+
+
+def test_circular_aliases_should_leave_reader_unchanged(node10, node20):
+    from pydevmgr_core import NodesReader
+    reader = NodesReader([node20])
+    a = NodeAlias(nodes=[node10, node20])
+    b = NodeAlias(nodes=[a])
+    a._nodes.append(b)
+    with pytest.raises(ValueError):
+        reader.add([node10, b])
+    assert reader._refs == {node20: 1}
+    assert reader.sid_counts() == {0: 1}
+    assert not reader._aliases 
+    data = {}
+    reader.read(data)
+    assert data == {node20: 20}
@@ -0,0 +1,132 @@
+import pytest
+np = pytest.importorskip("numpy")
+
+from pydevmgr_core import Downloader, NodeVar, NodeVar_R, BaseNode
+from pydevmgr_core.nodes import Value
+from pydevmgr_core.np_datalink import ArrayDataLink
+try:
+    from pydantic.v1 import BaseModel
+except ModuleNotFoundError:
+    from pydantic import BaseModel
+from typing import Any
+
+
+class Stat:
+    def __init__(self, i):
+        self.pos = Value(f'm{i}.pos', value=float(i))
+        self.ok = Value(f'm{i}.ok', value=True)
+
+
+class Motor:
+    def __init__(self, i):
+        self.stat = Stat(i)
+        self.name = Value(f'm{i}.name', value=f"motor{i}")
+        self.velocity = Value(f'm{i}.velocity', value=1.0)
+
+
+class StatData(BaseModel):
+    pos: NodeVar[float] = 0.0
+    ok: NodeVar[bool] = False
+
+
+class MotorData(BaseModel):
+    stat: StatData = StatData()
+    name: NodeVar_R = ""
+    velocity: NodeVar[float] = 0.0
+
+
+def test_array_datalink_download():
+    motors = [Motor(i) for i in range(5)]
+    link = ArrayDataLink(motors, MotorData)
+    assert link.columns == ["stat.pos", "stat.ok", "name", "velocity"]
+    assert link.array.dtype["stat.pos"] == np.float64
+    assert link.array.dtype["name"] == object
+    assert len(link.rnodes) == 20
+
+    downloader = Downloader(link)
+    downloader.download()
+    assert list(link.array["stat.pos"]) == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert link.array["stat.ok"].all()
+    assert link[2].name == "motor2"
+    row = link.row(motors[3])
+    assert row.stat.pos == 3.0 and isinstance(row.stat.pos, float)
+    assert row.stat.ok is True
+    with pytest.raises(AttributeError):
+        row.stat.vel
+
+    motors[1].stat.pos.set(10.0)
+    link.download()
+    assert link[1].stat.pos == 10.0
+
+
+def test_array_datalink_upload():
+    motors = [Motor(i) for i in range(3)]
+    link = ArrayDataLink(motors, MotorData)
+    link[1].velocity = 5.0
+    todata = {}
+    link._upload_to(todata)
+    assert todata[motors[1].velocity] == 5.0
+    assert motors[0].name not in todata
+    link.upload()
+    assert motors[1].velocity.get() == 5.0
+
+
+def test_array_datalink_partial_match():
+    class Incomplete:
+        def __init__(self):
+            self.stat = Stat(9)
+            self.name = Value('n', value="x")
+
+    motors = [Motor(0), Incomplete()]
+    with pytest.raises(ValueError):
+        ArrayDataLink(motors, MotorData)
+    link = ArrayDataLink(motors, MotorData, strick_match=False)
+    link.download()
+    assert list(link.array["velocity"]) == [1.0, 0.0]
+    assert list(link.array["stat.pos"]) == [0.0, 9.0]
+
+
+def test_array_datalink_partial_object_column():
+    class Label(BaseModel):
+        name: NodeVar[str] = "?"
+
+    class Unnamed:
+        pass
+
+    devices = [Motor(0), Unnamed(), Motor(2)]
+    link = ArrayDataLink(devices, Label, strick_match=False)
+    assert link.array.dtype["name"] == object
+    downloader = Downloader(link)
+    downloader.download()
+    assert list(link.array["name"]) == ["motor0", "?", "motor2"]
+
+
+def test_array_datalink_should_skip_missing_values():
+    class Flaky(BaseNode, value=(Any, None)):
+        failing = True
+        @property
+        def sid(self):
+            return id(self)
+        def fget(self):
+            if self.failing:
+                raise ValueError("server down")
+            return self.config.value
+
+    class Counter:
+        def __init__(self, i):
+            self.count = Flaky(f'c{i}.count', value=i)
+            self.ok = Flaky(f'c{i}.ok', value=False)
+
+    class CounterData(BaseModel):
+        count: NodeVar[int] = -1
+        ok: NodeVar[bool] = True
+
+    counters = [Counter(0), Counter(1)]
+    for node in (counters[0].count, counters[0].ok):
+        node.failing = False
+    link = ArrayDataLink(counters, CounterData)
+    downloader = Downloader(link, isolate_failures=True)
+    downloader.download()
+    assert downloader.errors
+    assert list(link.array["count"]) == [0, -1]
+    assert list(link.array["ok"]) == [False, True]
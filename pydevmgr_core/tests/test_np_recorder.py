@@ -0,0 +1,56 @@
+import pytest
+np = pytest.importorskip("numpy")
+
+from pydevmgr_core import Downloader
+from pydevmgr_core.nodes import Value
+from pydevmgr_core.np_recorder import HistoryRecorder
+
+
+def test_recorder_window_is_a_view():
+    a, b = Value('a', value=0.0), Value('b', value=None)
+    rec = HistoryRecorder([a, b], size=4)
+    for i in range(10):
+        rec.append({a: i, b: None}, timestamp=float(i))
+    assert len(rec) == 4
+    w = rec.window()
+    assert w.shape == (3, 4)
+    assert np.shares_memory(w, rec._buffer)
+    assert list(w[0]) == [6, 7, 8, 9]
+    assert list(w[1]) == [6, 7, 8, 9]
+    assert np.isnan(w[2]).all()
+
+    t, v = rec.get(a, seconds=1.5)
+    assert list(t) == [8, 9]
+    assert list(v) == [8, 9]
+    assert list(rec.get(a, n=3)[1]) == [7, 8, 9]
+    assert rec.columns == ["time", "a", "b"]
+
+
+def test_recorder_spill(tmp_path):
+    a = Value('a', value=0.0)
+    path = str(tmp_path/"spill.bin")
+    rec = HistoryRecorder([a], size=8, spill=path, spill_chunk=4)
+    for i in range(20):
+        rec.append({a: i*10}, timestamp=float(i))
+    assert rec.n_spilled == 12
+    assert list(rec.get(a)[1]) == [120, 130, 140, 150, 160, 170, 180, 190]
+    rec.flush()
+    assert len(rec) == 0
+    spilled = HistoryRecorder.load_spill(path, 1)
+    assert spilled.shape == (20, 2)
+    assert list(spilled[:, 0]) == list(range(20))
+    assert list(spilled[:, 1]) == [i*10 for i in range(20)]
+
+
+def test_recorder_connected_to_downloader():
+    a = Value('a', value=1.0)
+    downloader = Downloader()
+    rec = HistoryRecorder([a], size=100)
+    rec.connect(downloader)
+    for i in range(5):
+        a.set(float(i))
+        downloader.download()
+    assert list(rec.get(a)[1]) == [0, 1, 2, 3, 4]
+    rec.disconnect()
+    downloader.download()
+    assert len(rec) == 5
@@ -0,0 +1,54 @@
+import pytest 
+from pydevmgr_core import DeadlineScheduler, Downloader
+from pydevmgr_core.nodes import Value 
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+    def __call__(self):
+        return self.now
+
+
+def test_scheduler_should_not_drift():
+    clock = FakeClock()
+    s = DeadlineScheduler(0.05, clock=clock)
+    for i in range(100):
+        s.advance()
+        clock.now += 0.01 # cycle time 
+        s.done()
+        clock.now += s.time_to_deadline() + 0.001 # sleep inaccuracy 
+    assert s.deadline == pytest.approx(100.0 + 100*0.05)
+    assert s.n_overruns == 0 
+    assert s.lateness == pytest.approx(0.001)
+    assert s.n_cycles == 100
+
+
+@pytest.mark.parametrize("catchup, next_deadline, n_skipped", [
+    ("skip", 100.3, 1),
+    ("burst", 100.2, 0),
+    ("stretch", 100.35, 0),
+])
+def test_scheduler_catchup_policies(catchup, next_deadline, n_skipped):
+    clock = FakeClock()
+    s = DeadlineScheduler(0.1, catchup=catchup, clock=clock)
+    s.advance()
+    clock.now += 0.25 # overrun 
+    s.done()
+    assert s.n_overruns == 1
+    s.advance()
+    assert s.lateness == pytest.approx(0.15)
+    assert s.deadline == pytest.approx(next_deadline)
+    assert s.n_skipped == n_skipped
+
+
+def test_downloader_run_should_record_timing():
+    downloader = Downloader([Value(value=1)])
+    n = [0]
+    def stop():
+        n[0] += 1
+        return n[0]>3
+    downloader.run(period=0.01, stop_signal=stop)
+    scheduler = downloader.schedulers[None]
+    assert scheduler.n_cycles == 3
+    assert scheduler.n_overruns == 0 